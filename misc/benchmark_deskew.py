@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MIT
+
+"""Compare the deskew angle methods for accuracy and speed.
+
+Each page is rendered with pypdfium2 and its skew angle is measured with
+``--deskew-method projection`` and, if Tesseract is installed, with
+``--deskew-method engine``. The expected angle is taken from the placement of
+the page's image, which is exact for test files such as skew.pdf where a
+straight scan was placed on the page at an angle.
+
+Usage: python misc/benchmark_deskew.py [file.pdf ...]
+"""
+
+from __future__ import annotations
+
+import shutil
+import sys
+import time
+from math import atan2, degrees
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pikepdf
+import pypdfium2 as pdfium
+
+from ocrmypdf._exec import tesseract
+from ocrmypdf.imageops import estimate_skew
+
+DEFAULT_FILES = ['tests/resources/skew.pdf', 'tests/resources/rotated_skew.pdf']
+DPI = 300
+
+
+def expected_angle(input_file: Path) -> float | None:
+    """Angle that straightens the page's image, from its placement matrix."""
+    with pikepdf.open(input_file) as pdf:
+        page = pdf.pages[0]
+        for operands, operator in pikepdf.parse_content_stream(page):
+            if str(operator) == 'cm':
+                a, b = float(operands[0]), float(operands[1])
+                angle = degrees(atan2(b, a)) - int(page.get('/Rotate', 0))
+                return round(-((angle + 45) % 90 - 45), 2)
+    return None
+
+
+def timed(fn, *args):
+    t = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - t
+
+
+def main():
+    files = [Path(f) for f in sys.argv[1:] or DEFAULT_FILES]
+    have_tesseract = shutil.which('tesseract') is not None
+    if not have_tesseract:
+        print("tesseract not found; only measuring the projection method")
+
+    print(f"{'file':24} {'expected':>9} {'projection':>16} {'tesseract':>16}")
+    with TemporaryDirectory() as tmpdir:
+        for input_file in files:
+            pdf = pdfium.PdfDocument(input_file)
+            image = pdf[0].render(scale=DPI / 72).to_pil()
+            pdf.close()
+            png = Path(tmpdir) / 'page.png'
+            image.save(png)
+
+            projection, t_projection = timed(estimate_skew, image)
+            row = f"{projection:6.2f}° {t_projection * 1000:5.0f} ms"
+            if have_tesseract:
+                engine, t_engine = timed(tesseract.get_deskew, png, ['eng'], None, 180)
+                row += f" {engine:6.2f}° {t_engine * 1000:5.0f} ms"
+            print(f"{input_file.name:24} {expected_angle(input_file)!s:>8}° {row}")
+
+
+if __name__ == '__main__':
+    main()
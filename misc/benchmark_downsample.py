@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MIT
+
+"""Measure the peak memory and time of downsampling a very large page image.
+
+A synthetic page is saved in each of the formats an OCR image may arrive in,
+then downsampled to a quarter of its width and height by
+``imageops.downsample_image``, and by resizing the fully decoded image as
+``downsample_image`` used to. Each measurement runs in a fresh interpreter so
+that its peak resident memory can be compared.
+
+Usage: python misc/benchmark_downsample.py [width height]
+"""
+
+from __future__ import annotations
+
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from PIL import Image, ImageDraw
+
+from ocrmypdf.imageops import downsample_image
+
+FORMATS = [
+    ('tiff', 'TIFF', {'compression': 'raw'}),
+    ('ppm', 'PPM', {}),
+    ('png', 'PNG', {'compress_level': 1}),
+    ('jpg', 'JPEG', {}),
+]
+
+
+def make_page(size: tuple[int, int]) -> Image.Image:
+    im = Image.new('RGB', size, 'white')
+    draw = ImageDraw.Draw(im)
+    for top in range(size[1] // 20, size[1] * 19 // 20, 60):
+        draw.line((size[0] // 20, top, size[0] * 19 // 20, top), fill='black', width=25)
+    return im
+
+
+def peak_rss_mb() -> float:
+    # On Linux, ru_maxrss includes the parent's memory at the time of fork,
+    # but VmHWM starts over when the new program is executed
+    status = Path('/proc/self/status')
+    if status.exists():
+        for line in status.read_text().splitlines():
+            if line.startswith('VmHWM:'):
+                return int(line.split()[1]) / 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(path: str, method: str) -> None:
+    """Downsample one image; run in a child process."""
+    t = time.perf_counter()
+    with Image.open(path) as im:
+        im.info.setdefault('dpi', (1200, 1200))
+        size = (im.width // 4, im.height // 4)
+        if method == 'streaming':
+            downsample_image(im, size)
+        else:
+            im.resize(size, resample=Image.Resampling.BICUBIC, reducing_gap=3)
+    elapsed = time.perf_counter() - t
+    print(f"{elapsed:.2f} {peak_rss_mb():.0f}")
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == '--measure':
+        measure(sys.argv[2], sys.argv[3])
+        return
+    size = (10200, 13200)  # US Letter at 1200 dpi
+    if len(sys.argv) == 3:
+        size = (int(sys.argv[1]), int(sys.argv[2]))
+    page = make_page(size)
+    print(f"Page is {size[0]}x{size[1]} ({size[0] * size[1] / 1e6:.0f} MPixels)")
+    print(f"{'format':8} {'method':10} {'time':>8} {'peak RSS':>10}")
+    with TemporaryDirectory() as tmpdir:
+        for suffix, format_, params in FORMATS:
+            path = Path(tmpdir) / f'page.{suffix}'
+            page.save(path, format=format_, dpi=(1200, 1200), **params)
+            for method in ('full', 'streaming'):
+                out = subprocess.run(
+                    [sys.executable, __file__, '--measure', str(path), method],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout.split()
+                print(f"{suffix:8} {method:10} {out[0]:>7}s {out[1]:>7} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MIT
+
+"""Measure the cost of each intermediate image format.
+
+Every page image that OCRmyPDF passes between processing steps is written to
+and read back from the temporary folder, often several times per page. This
+script renders a page with pypdfium2 and times one encode and decode of the
+page image in each available ``--intermediate-image-format``.
+
+Usage: python misc/benchmark_intermediate_formats.py input.pdf [page] [dpi]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pypdfium2 as pdfium
+from PIL import Image
+
+from ocrmypdf.imageops import INTERMEDIATE_IMAGE_FORMATS
+
+REPEATS = 3
+
+
+def render(input_file: Path, pageno: int, dpi: float) -> Image.Image:
+    pdf = pdfium.PdfDocument(input_file)
+    try:
+        page = pdf[pageno - 1]
+        return page.render(scale=dpi / 72).to_pil()
+    finally:
+        pdf.close()
+
+
+def measure(im: Image.Image, name: str, folder: Path) -> tuple[float, float, int]:
+    image_format = INTERMEDIATE_IMAGE_FORMATS[name]
+    output_file = folder / f'{name}{image_format.suffix}'
+    encode = decode = float('inf')
+    for _ in range(REPEATS):
+        t0 = time.process_time()
+        im.save(output_file, format=image_format.format, **image_format.params)
+        t1 = time.process_time()
+        with Image.open(output_file) as reloaded:
+            reloaded.load()
+        t2 = time.process_time()
+        encode = min(encode, t1 - t0)
+        decode = min(decode, t2 - t1)
+    return encode, decode, output_file.stat().st_size
+
+
+def main():
+    input_file = Path(sys.argv[1])
+    pageno = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+    dpi = float(sys.argv[3]) if len(sys.argv) > 3 else 300.0
+
+    im = render(input_file, pageno, dpi)
+    print(f"Page {pageno} at {dpi:g} dpi: {im.width}x{im.height} {im.mode}")
+    print(f"{'format':10} {'encode ms':>10} {'decode ms':>10} {'size KiB':>10}")
+    results = {}
+    with TemporaryDirectory() as tmpdir:
+        for name in INTERMEDIATE_IMAGE_FORMATS:
+            results[name] = measure(im, name, Path(tmpdir))
+            encode, decode, size = results[name]
+            print(
+                f"{name:10} {encode * 1000:10.1f} {decode * 1000:10.1f} "
+                f"{size / 1024:10.0f}"
+            )
+    baseline = sum(results['png'][:2])
+    for name, (encode, decode, _size) in results.items():
+        if name != 'png':
+            saved = (baseline - encode - decode) * 1000
+            print(f"{name}: {saved:.1f} ms CPU saved per image round trip")
+
+
+if __name__ == '__main__':
+    main()
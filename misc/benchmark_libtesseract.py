@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MIT
+
+"""Compare OCR with the tesseract program and with libtesseract in process.
+
+Each image is OCRed several times by ``TesseractOcrEngine`` (one tesseract
+process per page, writing hOCR to a pipe to be parsed) and by
+``LibTesseractOcrEngine`` (one initialized TessBaseAPI reused for all pages).
+The first libtesseract page includes loading the language models, so it is
+reported separately.
+
+Usage: python misc/benchmark_libtesseract.py [-l LANG] [-n PAGES] IMAGE...
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from ocrmypdf._exec import libtesseract, tesseract
+from ocrmypdf._exec.tesseract import ThresholdingMethod
+from ocrmypdf.builtin_plugins.libtesseract_ocr import LibTesseractOcrEngine
+from ocrmypdf.builtin_plugins.tesseract_ocr import TesseractOcrEngine
+
+
+def make_options(languages: list[str]) -> SimpleNamespace:
+    return SimpleNamespace(
+        languages=languages,
+        use_threads=False,
+        tesseract=SimpleNamespace(
+            oem=None,
+            config=[],
+            pagesegmode=None,
+            thresholding=ThresholdingMethod.AUTO,
+            timeout=600.0,
+            user_words=None,
+            user_patterns=None,
+            omp_thread_limit=1,
+            batch_size=1,
+        ),
+    )
+
+
+def ocr_with_program(image: Path, options) -> int:
+    page, _text = TesseractOcrEngine.generate_ocr(image, options)
+    return len(page.words)
+
+
+def ocr_with_library(image: Path, options) -> int:
+    page, _text = LibTesseractOcrEngine.generate_ocr(image, options)
+    return len(page.words)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-l', '--language', default='eng')
+    parser.add_argument('-n', '--pages', type=int, default=5)
+    parser.add_argument('images', nargs='+', type=Path)
+    args = parser.parse_args()
+
+    if not libtesseract.available():
+        raise SystemExit("libtesseract not found")
+    options = make_options(args.language.split('+'))
+    print(f"tesseract {tesseract.version()}, libtesseract {libtesseract.version()}")
+
+    t = time.perf_counter()
+    ocr_with_library(args.images[0], options)
+    print(
+        f"first libtesseract page, including model loading: "
+        f"{time.perf_counter() - t:.2f}s"
+    )
+
+    print(f"{'image':24} {'program':>10} {'library':>10} {'speedup':>8} words")
+    for image in args.images:
+        t = time.perf_counter()
+        for _ in range(args.pages):
+            words_program = ocr_with_program(image, options)
+        program = (time.perf_counter() - t) / args.pages
+
+        t = time.perf_counter()
+        for _ in range(args.pages):
+            words_library = ocr_with_library(image, options)
+        library = (time.perf_counter() - t) / args.pages
+
+        print(
+            f"{image.name:24} {program:9.2f}s {library:9.2f}s "
+            f"{program / library:7.2f}x {words_program}/{words_library}"
+        )
+
+
+if __name__ == '__main__':
+    main()
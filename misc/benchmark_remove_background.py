@@ -0,0 +1,92 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MIT
+
+"""Compare the cost of --remove-background with cleaning a page with unpaper.
+
+For each test image, a grayscale and a color version are prepared on
+synthetic yellowed paper (the test resources are mostly monochrome scans),
+then timed with ``imageops.remove_background`` and, if unpaper is installed,
+with unpaper using the same arguments as ``--clean``.
+
+The result of each background removal is saved next to the timing output, so
+it can be inspected.
+
+Usage: python misc/benchmark_remove_background.py [image ...]
+"""
+
+from __future__ import annotations
+
+import shutil
+import sys
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from PIL import Image, ImageChops
+
+from ocrmypdf._exec import unpaper
+from ocrmypdf.imageops import remove_background
+
+DEFAULT_IMAGES = [
+    'tests/resources/linn.png',
+    'tests/resources/typewriter.png',
+    'tests/resources/baiona_gray.png',
+]
+OUTPUT_FOLDER = Path('remove_background_benchmark')
+
+
+def yellowed(image: Image.Image) -> Image.Image:
+    """Print the image on paper that yellows and darkens from top to bottom."""
+    ink = image.convert('RGB')
+    gradient = Image.linear_gradient('L').resize(ink.size)
+    paper = Image.merge(
+        'RGB', [gradient.point(lambda v, hi=hi: hi - v // 8) for hi in (240, 225, 170)]
+    )
+    return ImageChops.multiply(ink, paper)
+
+
+def timed(fn, *args, **kwargs):
+    t = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - t
+
+
+def main():
+    images = [Path(f) for f in sys.argv[1:] or DEFAULT_IMAGES]
+    have_unpaper = shutil.which('unpaper') is not None
+    if not have_unpaper:
+        print("unpaper not found; only measuring --remove-background")
+    OUTPUT_FOLDER.mkdir(exist_ok=True)
+
+    print(f"{'image':28} {'MPixels':>8} {'remove-bg':>10} {'unpaper':>10}")
+    with TemporaryDirectory() as tmpdir:
+        for path in images:
+            with Image.open(path) as im:
+                page = yellowed(im)
+            for mode in ('L', 'RGB'):
+                test_image = page.convert(mode)
+                name = f'{path.stem}_{mode}'
+                input_png = Path(tmpdir) / f'{name}.png'
+                test_image.save(input_png, dpi=(300, 300))
+
+                def remove_bg(input_png=input_png, name=name):
+                    with Image.open(input_png) as im:
+                        remove_background(im, dpi=300).save(
+                            OUTPUT_FOLDER / f'{name}_remove_bg.png'
+                        )
+
+                row = f"{name:28} {page.width * page.height / 1e6:8.1f}"
+                row += f" {timed(remove_bg):9.2f}s"
+                if have_unpaper:
+                    t = timed(
+                        unpaper.clean,
+                        input_png,
+                        OUTPUT_FOLDER / f'{name}_unpaper.png',
+                        dpi=300,
+                    )
+                    row += f" {t:9.2f}s"
+                print(row)
+
+
+if __name__ == '__main__':
+    main()
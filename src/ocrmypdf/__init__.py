@@ -43,7 +43,12 @@ from ocrmypdf.models.ocr_element import (
     OcrClass,
     OcrElement,
 )
-from ocrmypdf.pluginspec import OcrEngine, OrientationConfidence
+from ocrmypdf.pluginspec import (
+    OcrEngine,
+    OrientationConfidence,
+    PageGeometry,
+    ScriptConfidence,
+)
 
 hookimpl = _HookimplMarker('ocrmypdf')
 
@@ -74,11 +79,13 @@ __all__ = [
     'OrientationConfidence',
     'OutputFileAccessError',
     'PageContext',
+    'PageGeometry',
     'pdfa',
     'PdfContext',
     'pdfinfo',
     'PriorOcrFoundError',
     'PROGRAM_NAME',
+    'ScriptConfidence',
     'SubprocessOutputError',
     'TaggedPdfMode',
     'TesseractConfigError',
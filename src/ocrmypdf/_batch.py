@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+"""Combine requests from concurrent worker threads into batches."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Hashable, Sequence
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Generic, TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+class Batcher(Generic[T, R]):
+    """Combine requests from concurrent worker threads into batches.
+
+    Each page is processed by one worker, so to process several pages with one
+    call to a program or engine, a worker waits briefly for other workers to
+    make requests with the same key. Whichever worker completes a batch, or
+    gives up waiting, runs the batch and the others collect their results.
+
+    A request that is alone in its batch is run singly. If a batch fails, its
+    requests are run singly, so that an error is reported against the page
+    that caused it.
+    """
+
+    def __init__(self, window: float = 0.1):
+        """Create a batcher.
+
+        Args:
+            window: How long in seconds a request waits for others to join
+                its batch before running an incomplete batch.
+        """
+        self.window = window
+        self._lock = threading.Lock()
+        self._pending: dict[Hashable, list[tuple[T, Future[R]]]] = {}
+
+    def submit(
+        self,
+        key: Hashable,
+        request: T,
+        *,
+        batch_size: int,
+        run_batch: Callable[[list[T]], Sequence[R]],
+        run_single: Callable[[T], R],
+        name: str,
+    ) -> R:
+        """Run a request, possibly in a batch with other requests.
+
+        Args:
+            key: Requests are only batched with others of the same key.
+            request: The request.
+            batch_size: The largest number of requests to run in one batch.
+            run_batch: Run a batch of requests, returning their results in
+                order. Called with requests that have the same key as this one.
+            run_single: Run one request and return its result.
+            name: What runs the requests, for log messages.
+
+        Returns:
+            The result of the request.
+        """
+        if batch_size <= 1:
+            return run_single(request)
+        future: Future[R] = Future()
+        with self._lock:
+            group = self._pending.setdefault(key, [])
+            group.append((request, future))
+            batch = self._pending.pop(key) if len(group) >= batch_size else None
+        if batch is None:
+            try:
+                return future.result(timeout=self.window)
+            except FutureTimeoutError:
+                with self._lock:
+                    pending = self._pending.get(key, [])
+                    if any(waiting is future for _, waiting in pending):
+                        batch = self._pending.pop(key)
+        if batch is not None:
+            self._run(batch, run_batch, run_single, name)
+        return future.result()
+
+    @staticmethod
+    def _run(
+        batch: list[tuple[T, Future[R]]],
+        run_batch: Callable[[list[T]], Sequence[R]],
+        run_single: Callable[[T], R],
+        name: str,
+    ) -> None:
+        if len(batch) > 1:
+            try:
+                results = run_batch([request for request, _ in batch])
+                if len(results) != len(batch):
+                    raise ValueError(
+                        f"{name} returned {len(results)} results "
+                        f"for a batch of {len(batch)}"
+                    )
+            except Exception as e:  # pylint: disable=broad-except
+                log.debug(
+                    f"{name} failed on a batch of {len(batch)}, retrying singly: {e}"
+                )
+            else:
+                log.debug(f"{name} processed a batch of {len(batch)}")
+                for (_, future), result in zip(batch, results, strict=True):
+                    future.set_result(result)
+                return
+        for request, future in batch:
+            try:
+                future.set_result(run_single(request))
+            except Exception as e:  # pylint: disable=broad-except
+                future.set_exception(e)
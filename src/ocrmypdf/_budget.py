@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+"""Spend less effort on pages when OCR would not finish by a deadline.
+
+Pages are all submitted to the workers at once, so each worker decides how
+much effort to spend on a page when it starts it, from the time left before
+the deadline, the number of pages still to come, and how long the pages it
+has already finished took.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Sequence
+from enum import IntEnum
+from typing import Any
+
+from ocrmypdf._options import OcrOptions
+
+log = logging.getLogger(__name__)
+
+# Never give a page less than this much OCR time, even past the deadline, so
+# that late pages still get some text
+MIN_PAGE_SECONDS = 5.0
+
+
+class Effort(IntEnum):
+    """How much work to spend on a page, from most to least."""
+
+    # pylint: disable=invalid-name
+    full = 0  #: All requested processing
+    reduced = 1  #: No optional preprocessing (deskew, clean, background removal)
+    fast = 2  #: Also no oversampling, adaptive OCR resolution, fast OCR
+    #: models only, limited OCR time
+
+
+# Rough cost of each effort relative to full effort, used to estimate the
+# cost of an effort level before any page was processed at that level. Levels
+# that would not change the options of a page are never used, so these
+# assume each level does change something.
+_RELATIVE_COST = {Effort.full: 1.0, Effort.reduced: 0.7, Effort.fast: 0.4}
+
+
+class EffortPlanner:
+    """Choose the effort for each page from the time pages have taken so far."""
+
+    def __init__(self):
+        """Start with no page times measured."""
+        self._lock = threading.Lock()
+        self._seconds: dict[Effort, list[float]] = {}
+
+    def record(self, effort: Effort, seconds: float) -> None:
+        """Record that a page processed at ``effort`` took ``seconds``."""
+        with self._lock:
+            self._seconds.setdefault(effort, []).append(seconds)
+
+    def estimate(self, effort: Effort) -> float | None:
+        """Estimated seconds to process a page at ``effort``, if known."""
+        with self._lock:
+            if times := self._seconds.get(effort):
+                return sum(times) / len(times)
+            # Scale from the effort level with the most measurements
+            measured = max(
+                self._seconds.items(), key=lambda kv: len(kv[1]), default=None
+            )
+        if measured is None:
+            return None
+        other, times = measured
+        full_seconds = sum(times) / len(times) / _RELATIVE_COST[other]
+        return full_seconds * _RELATIVE_COST[effort]
+
+    def choose(
+        self, seconds_available: float, efforts: Sequence[Effort] = tuple(Effort)
+    ) -> Effort:
+        """Return the most effort that fits in ``seconds_available`` per page.
+
+        Only the effort levels in ``efforts`` are considered; the least of them
+        is returned if none fits.
+        """
+        for effort in efforts:
+            estimate = self.estimate(effort)
+            if estimate is None or estimate <= seconds_available:
+                return effort
+        return efforts[-1]
+
+    def reset(self) -> None:
+        """Forget all measurements, such as before processing another file."""
+        with self._lock:
+            self._seconds.clear()
+
+
+# Each worker process keeps its own measurements; worker threads share them
+_PLANNER = EffortPlanner()
+
+
+def seconds_per_page(
+    deadline: float, now: float, pageno: int, page_count: int, workers: int
+) -> float:
+    """Time each remaining page may take for OCR to finish by ``deadline``.
+
+    Pages are started in order, so page ``pageno`` and all later pages are
+    still to be done, shared among ``workers``.
+    """
+    pages_left = max(page_count - pageno, 1)
+    return (deadline - now) * min(workers, pages_left) / pages_left
+
+
+def _copy_options(options: OcrOptions, updates: dict[str, Any]) -> OcrOptions:
+    """Copy options with updated fields, updating plugin option views too."""
+    extra_attrs = dict(options.extra_attrs)
+    for key, plugin_options in options.extra_attrs.items():
+        if not key.startswith('_plugin_cache_'):
+            continue
+        prefix = key.removeprefix('_plugin_cache_') + '_'
+        plugin_updates = {
+            name.removeprefix(prefix): value
+            for name, value in updates.items()
+            if name.startswith(prefix)
+        }
+        if plugin_updates:
+            extra_attrs[key] = plugin_options.model_copy(update=plugin_updates)
+    return options.model_copy(update={**updates, 'extra_attrs': extra_attrs})
+
+
+def _effort_updates(
+    options: OcrOptions, effort: Effort, seconds_available: float
+) -> dict[str, Any]:
+    """Option changes to process a page with ``effort``, less any no-ops."""
+    updates: dict[str, Any] = {}
+    if effort >= Effort.reduced:
+        updates.update(
+            deskew=False, clean=False, clean_final=False, remove_background=False
+        )
+    if effort >= Effort.fast:
+        # Adaptive resolution caps the OCR resolution of pages with large text
+        updates.update(oversample=0, adaptive_ocr_resolution=True)
+    updates = {
+        name: value
+        for name, value in updates.items()
+        if getattr(options, name) != value
+    }
+    tesseract = getattr(options, 'tesseract', None)
+    if effort >= Effort.fast and tesseract is not None:
+        if tesseract.fast_tessdata and tesseract.escalate_below:
+            # Use only the --tesseract-fast-tessdata models, without escalating
+            updates['tesseract_escalate_below'] = 0.0
+        timeout = min(tesseract.timeout, max(seconds_available, MIN_PAGE_SECONDS))
+        if timeout != tesseract.timeout:
+            updates['tesseract_timeout'] = timeout
+    return updates
+
+
+def useful_efforts(options: OcrOptions, seconds_available: float) -> list[Effort]:
+    """Effort levels that change the options of a page from the level above."""
+    efforts = [Effort.full]
+    previous: dict[str, Any] = {}
+    for effort in list(Effort)[1:]:
+        updates = _effort_updates(options, effort, seconds_available)
+        if updates != previous:
+            efforts.append(effort)
+            previous = updates
+    return efforts
+
+
+def options_for_effort(
+    options: OcrOptions, effort: Effort, seconds_available: float
+) -> OcrOptions:
+    """Return options that process a page with ``effort``."""
+    updates = _effort_updates(options, effort, seconds_available)
+    if not updates:
+        return options
+    return _copy_options(options, updates)
+
+
+def plan_page(
+    options: OcrOptions,
+    *,
+    deadline: float,
+    pageno: int,
+    page_count: int,
+    workers: int,
+) -> tuple[OcrOptions, Effort]:
+    """Choose the effort for a page and return the options to process it with."""
+    available = seconds_per_page(deadline, time.time(), pageno, page_count, workers)
+    effort = _PLANNER.choose(available, useful_efforts(options, available))
+    if effort != Effort.full:
+        log.debug(
+            f"{available:.1f}s per page left before the OCR deadline; "
+            f"using {effort.name} effort"
+        )
+    return options_for_effort(options, effort, available), effort
+
+
+def record_page(effort: Effort, seconds: float) -> None:
+    """Record the time a page took, to plan later pages."""
+    _PLANNER.record(effort, seconds)
+
+
+def reset() -> None:
+    """Forget page times measured while processing an earlier file."""
+    _PLANNER.reset()
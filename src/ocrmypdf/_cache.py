@@ -0,0 +1,244 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+"""Content-addressed on-disk caches shared between runs and worker processes."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import NamedTuple
+
+from pikepdf import Array, Dictionary, Object, Page, Stream
+
+log = logging.getLogger(__name__)
+
+_tls = threading.local()
+
+# Keys that point back up the page tree, or whose values do not affect how the
+# page looks. Following them would hash unrelated parts of the document.
+_IGNORED_PAGE_KEYS = frozenset({'/Parent', '/P', '/StructParent', '/StructParents'})
+
+
+def _counters() -> Counter[str]:
+    if not hasattr(_tls, 'counters'):
+        _tls.counters = Counter()
+    return _tls.counters
+
+
+def take_cache_counts() -> Counter[str]:
+    """Return and reset the cache hit/miss counts recorded by this thread.
+
+    Each page is processed entirely by one worker thread or process, so
+    counts taken after processing a page belong to that page.
+    """
+    counts = _counters()
+    _tls.counters = Counter()
+    return counts
+
+
+class CacheEntry(NamedTuple):
+    """An entry of a :class:`DiskCache`."""
+
+    key: str
+    path: Path
+    size: int
+    last_used: float
+    """Time the entry was last stored or used, in seconds since the epoch."""
+
+
+class DiskCache:
+    """A size-bounded, content-addressed file cache.
+
+    Entries are files named by their key and are written atomically, so that
+    several worker processes (or several OCRmyPDF processes) may share one
+    cache folder. When the cache grows beyond ``max_bytes``, the least recently
+    used entries are evicted. Using an entry refreshes its modification time.
+    """
+
+    def __init__(self, root: Path, max_bytes: int, *, name: str):
+        """Create a cache in ``root``, which is created if missing.
+
+        Args:
+            root: Folder to store cache entries in.
+            max_bytes: Evict entries once the cache is larger than this.
+            name: Short name of the cache, used to label hit/miss counts.
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.name = name
+
+    def _entry(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def get(self, key: str, output_file: Path) -> bool:
+        """Copy the entry for ``key`` to ``output_file``, if present."""
+        entry = self._entry(key)
+        try:
+            shutil.copyfile(entry, output_file)
+            os.utime(entry)
+        except FileNotFoundError:
+            _counters()[f'{self.name}_misses'] += 1
+            return False
+        _counters()[f'{self.name}_hits'] += 1
+        log.debug(f"{self.name} cache hit {key}")
+        return True
+
+    def put(self, key: str, input_file: Path) -> None:
+        """Store a copy of ``input_file`` as the entry for ``key``."""
+        entry = self._entry(key)
+        tmp_path = None
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            with (
+                NamedTemporaryFile(
+                    dir=entry.parent, prefix='.', suffix='.tmp', delete=False
+                ) as tmp,
+                input_file.open('rb') as src,
+            ):
+                tmp_path = Path(tmp.name)
+                shutil.copyfileobj(src, tmp)
+            tmp_path.replace(entry)
+        except OSError as e:
+            log.warning(f"Could not write to {self.name} cache: {e}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+            return
+        self.evict()
+
+    def entries(self) -> list[CacheEntry]:
+        """Return the entries of the cache, least recently used first."""
+        entries = []
+        for shard in self.root.iterdir() if self.root.is_dir() else ():
+            if not shard.is_dir():
+                continue
+            for item in os.scandir(shard):
+                if item.name.startswith('.'):
+                    continue
+                try:
+                    st = item.stat()
+                except FileNotFoundError:
+                    continue  # evicted by another process
+                entries.append(
+                    CacheEntry(item.name, Path(item.path), st.st_size, st.st_mtime)
+                )
+        entries.sort(key=lambda entry: entry.last_used)
+        return entries
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits its budget.
+
+        Entries are trimmed to 90% of the budget, so that eviction does not
+        need to run after every subsequent write.
+        """
+        entries = self.entries()
+        if sum(entry.size for entry in entries) <= self.max_bytes:
+            return
+        self._remove(entries, max_bytes=self.max_bytes * 0.9)
+
+    def prune(
+        self, *, max_bytes: float | None = None, older_than: float | None = None
+    ) -> list[CacheEntry]:
+        """Delete old entries, or least recently used entries beyond a size.
+
+        Args:
+            max_bytes: Delete least recently used entries until the cache is no
+                larger than this.
+            older_than: Delete entries not used for this many seconds.
+
+        Returns:
+            The entries deleted.
+        """
+        return self._remove(
+            self.entries(),
+            max_bytes=max_bytes,
+            used_before=time.time() - older_than if older_than is not None else None,
+        )
+
+    def clear(self) -> list[CacheEntry]:
+        """Delete all entries.
+
+        Returns:
+            The entries deleted.
+        """
+        return self._remove(self.entries(), max_bytes=0)
+
+    @staticmethod
+    def _remove(
+        entries: list[CacheEntry],
+        *,
+        max_bytes: float | None = None,
+        used_before: float | None = None,
+    ) -> list[CacheEntry]:
+        total = sum(entry.size for entry in entries)
+        removed = []
+        for entry in entries:
+            stale = used_before is not None and entry.last_used < used_before
+            if not stale and (max_bytes is None or total <= max_bytes):
+                break
+            entry.path.unlink(missing_ok=True)
+            total -= entry.size
+            removed.append(entry)
+        return removed
+
+
+def _hash_object(obj, h, seen: dict[tuple[int, int], int]) -> None:
+    if isinstance(obj, Dictionary | Stream | Array) and obj.is_indirect:
+        if obj.objgen in seen:
+            h.update(b'R%d' % seen[obj.objgen])
+            return
+        seen[obj.objgen] = len(seen)
+    if isinstance(obj, Dictionary | Stream):
+        h.update(b'<<')
+        for key in sorted(obj.keys()):
+            if key in _IGNORED_PAGE_KEYS:
+                continue
+            h.update(key.encode())
+            _hash_object(obj[key], h, seen)
+        h.update(b'>>')
+        if isinstance(obj, Stream):
+            h.update(obj.read_raw_bytes())
+    elif isinstance(obj, Array):
+        h.update(b'[')
+        for item in obj:
+            _hash_object(item, h, seen)
+        h.update(b']')
+    elif isinstance(obj, Object):
+        h.update(obj.unparse())
+    else:
+        h.update(repr(obj).encode())
+
+
+def page_fingerprint(page: Page) -> str:
+    """Hash everything that determines how a page renders.
+
+    This includes the content streams, resources (fonts, images, form
+    XObjects), page boxes, rotation and annotations, but not the page's position
+    in the document.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    _hash_object(page.obj, h, {})
+    return h.hexdigest()
+
+
+def file_digest(path: os.PathLike | str) -> str:
+    """Hash the contents of a file."""
+    with Path(path).open('rb') as f:
+        h = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=20))
+    return h.hexdigest()
+
+
+def cache_key(*parts: object) -> str:
+    """Combine a fingerprint and the parameters that affect the result."""
+    h = hashlib.blake2b(digest_size=20)
+    for part in parts:
+        h.update(repr(part).encode())
+        h.update(b'\0')
+    return h.hexdigest()
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+"""Find uncertain lines in an OCR tree and splice in a second opinion.
+
+Used to OCR a page with a fast model, then OCR again with a slower, more
+accurate model only the lines the fast model was unsure of.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from ocrmypdf._tiles import _offset
+from ocrmypdf.models.ocr_element import OcrElement
+
+
+def line_confidence(line: OcrElement) -> float | None:
+    """Mean confidence (0.0-1.0) of the words of a line, if any are known."""
+    scores = [w.confidence for w in line.words if w.confidence is not None]
+    if not scores:
+        return None
+    return sum(scores) / len(scores)
+
+
+def low_confidence_lines(page: OcrElement, threshold: float) -> list[OcrElement]:
+    """Return the horizontal lines of a page whose confidence is below threshold.
+
+    Lines of unknown confidence are not returned, nor are rotated lines, since
+    they cannot be cropped to a horizontal strip.
+    """
+    uncertain = []
+    for line in page.lines:
+        if line.bbox is None or line.textangle:
+            continue
+        confidence = line_confidence(line)
+        if confidence is not None and confidence < threshold:
+            uncertain.append(line)
+    return uncertain
+
+
+def line_crop_box(line: OcrElement, size: tuple[int, int]) -> tuple[int, int, int, int]:
+    """Region of the page image to crop to OCR a line again.
+
+    The line's bounding box is padded by a quarter of its height, since the
+    recognizer needs some background around the glyphs, and clipped to an
+    image of ``size``.
+    """
+    assert line.bbox is not None
+    pad = max(round(line.bbox.height / 4), 4)
+    return (
+        max(int(line.bbox.left) - pad, 0),
+        max(int(line.bbox.top) - pad, 0),
+        min(int(line.bbox.right) + pad, size[0]),
+        min(int(line.bbox.bottom) + pad, size[1]),
+    )
+
+
+def replace_line_words(
+    line: OcrElement, recognized: OcrElement, origin: tuple[int, int]
+) -> bool:
+    """Replace the words of ``line`` with those of a second OCR of the line.
+
+    Args:
+        line: A line in a page tree, modified in place.
+        recognized: The OCR tree of the line's cropped image.
+        origin: Position of the cropped image in the page image.
+
+    Returns:
+        True if the words were replaced. They are kept if the second OCR found
+        no words, or is less confident than the first.
+    """
+    words = recognized.words
+    new_line = OcrElement(ocr_class=line.ocr_class, children=words)
+    new_confidence = line_confidence(new_line)
+    if not words or new_confidence is None:
+        return False
+    old_confidence = line_confidence(line)
+    if old_confidence is not None and new_confidence <= old_confidence:
+        return False
+    dx, dy = origin
+    line.children = [
+        replace(
+            word,
+            bbox=_offset(word.bbox, dx, dy),
+            poly=(
+                [(x + dx, y + dy) for x, y in word.poly]
+                if word.poly is not None
+                else None
+            ),
+            children=[
+                replace(child, bbox=_offset(child.bbox, dx, dy))
+                for child in word.children
+            ],
+        )
+        for word in words
+    ]
+    return True
@@ -9,9 +9,11 @@ import logging
 import os
 import re
 from collections import deque
+from collections.abc import Mapping
 from os import fspath
 from pathlib import Path
 from subprocess import PIPE, CalledProcessError
+from typing import Any
 
 from packaging.version import Version
 from PIL import Image, UnidentifiedImageError
@@ -137,6 +139,7 @@ def rasterize_pdf(
     filter_vector: bool = False,
     stop_on_error: bool = False,
     use_cropbox: bool = False,
+    save_params: Mapping[str, Any] | None = None,
 ):
     """Rasterize one page of a PDF at resolution raster_dpi in canvas units.
 
@@ -152,6 +155,8 @@ def rasterize_pdf(
         stop_on_error: If True, stop rasterizing on the first error.
         use_cropbox: If True, rasterize the CropBox instead of MediaBox.
             Default is False (use MediaBox).
+        save_params: Extra parameters for Pillow when saving the final image,
+            whose format is determined by the suffix of ``output_file``.
     """
     _ensure_log_filter_installed()
     raster_dpi = raster_dpi.round(6)
@@ -254,7 +259,7 @@ def rasterize_pdf(
                     im = im.transpose(Image.Transpose.ROTATE_270)
                 if rotation % 180 == 90:
                     page_dpi = page_dpi.flip_axis()
-            im.save(output_file, dpi=page_dpi)
+            im.save(output_file, dpi=page_dpi, **(save_params or {}))
     except UnidentifiedImageError:
         log.error(
             f"Ghostscript (using {raster_device} at {raster_dpi} dpi) produced "
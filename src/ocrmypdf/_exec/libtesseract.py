@@ -0,0 +1,627 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+"""Interface to the Tesseract library, for OCR within the OCRmyPDF process.
+
+Running the ``tesseract`` program loads the language models from disk for
+every page, which for the LSTM models is a large share of the time spent on a
+typical page. Here libtesseract is loaded with :mod:`ctypes` and each worker
+thread keeps its own initialized ``TessBaseAPI`` for every combination of
+languages and settings it is asked for, so models are loaded once per worker.
+Page images are passed from memory, and the results are read with Tesseract's
+result iterator rather than by producing and parsing hOCR.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import math
+import os
+import threading
+import time
+import unicodedata
+from collections.abc import Sequence
+from functools import cache
+from os import fspath
+from typing import NamedTuple
+
+from PIL import Image
+
+from ocrmypdf._exec.tesseract import ThresholdingMethod, page_timedout
+from ocrmypdf._ocr_cache import SKIPPED_PAGE_TEXT
+from ocrmypdf.exceptions import MissingDependencyError
+from ocrmypdf.models.ocr_element import Baseline, BoundingBox, OcrClass, OcrElement
+
+log = logging.getLogger(__name__)
+
+# Names that ctypes.util.find_library may know libtesseract by
+_LIBRARY_NAMES = ('tesseract', 'libtesseract-5', 'tesseract50')
+
+# Page iterator levels (PageIteratorLevel)
+RIL_BLOCK = 0
+RIL_PARA = 1
+RIL_TEXTLINE = 2
+RIL_WORD = 3
+
+# Block types (PolyBlockType) that Tesseract's hOCR renderer distinguishes
+PT_HEADING_TEXT = 2
+PT_PULLOUT_TEXT = 3
+PT_CAPTION_TEXT = 8
+
+# Page segmentation mode for layout analysis only, as tesseract --psm 2
+PSM_AUTO_ONLY = 2
+
+ORIENTATION_PAGE_UP = 0
+WRITING_DIRECTION_RIGHT_TO_LEFT = 1
+
+_LINE_CLASSES = {
+    PT_HEADING_TEXT: OcrClass.HEADER,
+    PT_PULLOUT_TEXT: OcrClass.TEXTFLOAT,
+    PT_CAPTION_TEXT: OcrClass.CAPTION,
+}
+
+_c_int_p = ctypes.POINTER(ctypes.c_int)
+_c_float_p = ctypes.POINTER(ctypes.c_float)
+_c_char_pp = ctypes.POINTER(ctypes.c_char_p)
+
+_PROTOTYPES: dict[str, tuple[type | None, list[type]]] = {
+    'TessVersion': (ctypes.c_char_p, []),
+    'TessDeleteText': (None, [ctypes.c_void_p]),
+    'TessBaseAPICreate': (ctypes.c_void_p, []),
+    'TessBaseAPIDelete': (None, [ctypes.c_void_p]),
+    'TessBaseAPIInit4': (
+        ctypes.c_int,
+        [
+            ctypes.c_void_p,
+            ctypes.c_char_p,
+            ctypes.c_char_p,
+            ctypes.c_int,
+            _c_char_pp,
+            ctypes.c_int,
+            _c_char_pp,
+            _c_char_pp,
+            ctypes.c_size_t,
+            ctypes.c_int,
+        ],
+    ),
+    'TessBaseAPISetPageSegMode': (None, [ctypes.c_void_p, ctypes.c_int]),
+    'TessBaseAPISetVariable': (
+        ctypes.c_int,
+        [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p],
+    ),
+    'TessBaseAPISetImage': (
+        None,
+        [
+            ctypes.c_void_p,
+            ctypes.c_char_p,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_int,
+        ],
+    ),
+    'TessBaseAPISetSourceResolution': (None, [ctypes.c_void_p, ctypes.c_int]),
+    'TessBaseAPIRecognize': (ctypes.c_int, [ctypes.c_void_p, ctypes.c_void_p]),
+    'TessBaseAPIGetUTF8Text': (ctypes.c_void_p, [ctypes.c_void_p]),
+    'TessBaseAPIGetIterator': (ctypes.c_void_p, [ctypes.c_void_p]),
+    'TessBaseAPIClear': (None, [ctypes.c_void_p]),
+    'TessBaseAPIDetectOrientationScript': (
+        ctypes.c_int,
+        [ctypes.c_void_p, _c_int_p, _c_float_p, _c_char_pp, _c_float_p],
+    ),
+    'TessBaseAPIAnalyseLayout': (ctypes.c_void_p, [ctypes.c_void_p]),
+    'TessPageIteratorDelete': (None, [ctypes.c_void_p]),
+    'TessMonitorCreate': (ctypes.c_void_p, []),
+    'TessMonitorDelete': (None, [ctypes.c_void_p]),
+    'TessMonitorSetDeadlineMSecs': (None, [ctypes.c_void_p, ctypes.c_int]),
+    'TessResultIteratorDelete': (None, [ctypes.c_void_p]),
+    'TessResultIteratorNext': (ctypes.c_int, [ctypes.c_void_p, ctypes.c_int]),
+    'TessResultIteratorGetPageIterator': (ctypes.c_void_p, [ctypes.c_void_p]),
+    'TessResultIteratorGetUTF8Text': (
+        ctypes.c_void_p,
+        [ctypes.c_void_p, ctypes.c_int],
+    ),
+    'TessResultIteratorConfidence': (
+        ctypes.c_float,
+        [ctypes.c_void_p, ctypes.c_int],
+    ),
+    'TessResultIteratorWordRecognitionLanguage': (
+        ctypes.c_char_p,
+        [ctypes.c_void_p],
+    ),
+    'TessPageIteratorIsAtBeginningOf': (
+        ctypes.c_int,
+        [ctypes.c_void_p, ctypes.c_int],
+    ),
+    'TessPageIteratorBoundingBox': (
+        ctypes.c_int,
+        [ctypes.c_void_p, ctypes.c_int, _c_int_p, _c_int_p, _c_int_p, _c_int_p],
+    ),
+    'TessPageIteratorBaseline': (
+        ctypes.c_int,
+        [ctypes.c_void_p, ctypes.c_int, _c_int_p, _c_int_p, _c_int_p, _c_int_p],
+    ),
+    'TessPageIteratorBlockType': (ctypes.c_int, [ctypes.c_void_p]),
+    'TessPageIteratorOrientation': (
+        None,
+        [ctypes.c_void_p, _c_int_p, _c_int_p, _c_int_p, _c_float_p],
+    ),
+}
+
+
+class LibTesseractError(Exception):
+    """libtesseract could not initialize or could not recognize a page."""
+
+
+def _find_library() -> str | None:
+    for name in _LIBRARY_NAMES:
+        if path := ctypes.util.find_library(name):
+            return path
+    return None
+
+
+@cache
+def _load(path: str) -> ctypes.CDLL:
+    try:
+        lib = ctypes.CDLL(path)
+        for name, (restype, argtypes) in _PROTOTYPES.items():
+            func = getattr(lib, name)
+            func.restype = restype
+            func.argtypes = argtypes
+    except (OSError, AttributeError) as e:
+        raise MissingDependencyError(f"Could not load libtesseract: {e}") from e
+    return lib
+
+
+def load(omp_thread_limit: int | None = None) -> ctypes.CDLL:
+    """Load libtesseract and declare the C API functions used.
+
+    OpenMP reads ``OMP_THREAD_LIMIT`` once, when it is loaded along with
+    libtesseract, so the limit must be in the environment before the first
+    call; like the tesseract program, it is not overridden if already set.
+
+    Raises:
+        MissingDependencyError: if libtesseract cannot be found or lacks a
+            function that is needed.
+    """
+    path = _find_library()
+    if path is None:
+        raise MissingDependencyError("Could not find the libtesseract library")
+    if (
+        omp_thread_limit is not None
+        and not os.environ.get('OMP_THREAD_LIMIT', '').isnumeric()
+    ):
+        os.environ['OMP_THREAD_LIMIT'] = str(omp_thread_limit)
+    return _load(path)
+
+
+def available() -> bool:
+    """Is libtesseract installed?
+
+    This does not load the library, so that loading it can wait until the
+    OpenMP thread limit is known.
+    """
+    return _find_library() is not None
+
+
+def version() -> str:
+    """Return the version of the loaded libtesseract."""
+    return load().TessVersion().decode()
+
+
+def _take_text(lib: ctypes.CDLL, ptr: int | None) -> str:
+    """Decode a string allocated by libtesseract, and free it."""
+    if not ptr:
+        return ''
+    try:
+        return ctypes.string_at(ptr).decode('utf-8', errors='replace')
+    finally:
+        lib.TessDeleteText(ptr)
+
+
+class ResultIterator:
+    """Word by word access to the results of recognizing a page.
+
+    A thin wrapper around ``TessResultIterator``; :func:`build_page` only
+    depends on these methods.
+    """
+
+    def __init__(self, lib: ctypes.CDLL, handle: int):
+        self._lib = lib
+        self._handle = handle
+        self._page_it = lib.TessResultIteratorGetPageIterator(handle)
+
+    def is_at_beginning_of(self, level: int) -> bool:
+        return bool(self._lib.TessPageIteratorIsAtBeginningOf(self._page_it, level))
+
+    def _box(self, func, level: int) -> tuple[int, int, int, int] | None:
+        coords = [ctypes.c_int() for _ in range(4)]
+        if not func(self._page_it, level, *(ctypes.byref(c) for c in coords)):
+            return None
+        return tuple(c.value for c in coords)  # type: ignore[return-value]
+
+    def bounding_box(self, level: int) -> tuple[int, int, int, int] | None:
+        return self._box(self._lib.TessPageIteratorBoundingBox, level)
+
+    def baseline(self, level: int) -> tuple[int, int, int, int] | None:
+        return self._box(self._lib.TessPageIteratorBaseline, level)
+
+    def block_type(self) -> int:
+        return self._lib.TessPageIteratorBlockType(self._page_it)
+
+    def orientation(self) -> tuple[int, int]:
+        """Return the (orientation, writing direction) of the current block."""
+        orientation, direction, order = ctypes.c_int(), ctypes.c_int(), ctypes.c_int()
+        deskew = ctypes.c_float()
+        self._lib.TessPageIteratorOrientation(
+            self._page_it,
+            ctypes.byref(orientation),
+            ctypes.byref(direction),
+            ctypes.byref(order),
+            ctypes.byref(deskew),
+        )
+        return orientation.value, direction.value
+
+    def text(self, level: int) -> str:
+        return _take_text(
+            self._lib, self._lib.TessResultIteratorGetUTF8Text(self._handle, level)
+        )
+
+    def confidence(self, level: int) -> float:
+        return self._lib.TessResultIteratorConfidence(self._handle, level)
+
+    def language(self) -> str | None:
+        lang = self._lib.TessResultIteratorWordRecognitionLanguage(self._handle)
+        return lang.decode() if lang else None
+
+    def next(self, level: int) -> bool:
+        return bool(self._lib.TessResultIteratorNext(self._handle, level))
+
+
+def _bbox(box: tuple[int, int, int, int]) -> BoundingBox:
+    left, top, right, bottom = box
+    return BoundingBox(left=left, top=top, right=right, bottom=bottom)
+
+
+def _line_baseline(
+    bbox: BoundingBox, baseline: tuple[int, int, int, int] | None
+) -> Baseline | None:
+    """Express a baseline relative to the bottom left corner of its line.
+
+    This is the same calculation Tesseract makes for the hOCR ``baseline``
+    property.
+    """
+    if baseline is None:
+        return None
+    x1, y1, x2, y2 = baseline
+    if x2 == x1:
+        return Baseline(slope=0.0, intercept=float(y1 - bbox.bottom))
+    slope = (y2 - y1) / (x2 - x1)
+    intercept = y1 - bbox.bottom + slope * (bbox.left - x1)
+    return Baseline(slope=round(slope, 6), intercept=round(intercept))
+
+
+def build_page(
+    it: ResultIterator,
+    size: tuple[int, int],
+    *,
+    dpi: float | None,
+    page_number: int,
+) -> OcrElement:
+    """Build an OCR tree from Tesseract's result iterator.
+
+    The tree has the same structure that :class:`~ocrmypdf.hocrtransform.HocrParser`
+    produces from Tesseract's hOCR output: paragraphs of lines of words, with
+    empty lines and paragraphs left out.
+    """
+    page = OcrElement(
+        ocr_class=OcrClass.PAGE,
+        bbox=BoundingBox(left=0, top=0, right=size[0], bottom=size[1]),
+        dpi=dpi,
+        page_number=page_number,
+    )
+    paragraph: OcrElement | None = None
+    line: OcrElement | None = None
+    while True:
+        if paragraph is None or it.is_at_beginning_of(RIL_PARA):
+            _orientation, direction = it.orientation()
+            box = it.bounding_box(RIL_PARA)
+            paragraph = OcrElement(
+                ocr_class=OcrClass.PARAGRAPH,
+                bbox=_bbox(box) if box else None,
+                direction=(
+                    'rtl' if direction == WRITING_DIRECTION_RIGHT_TO_LEFT else 'ltr'
+                ),
+                language=it.language(),
+            )
+            page.children.append(paragraph)
+            line = None
+        if line is None or it.is_at_beginning_of(RIL_TEXTLINE):
+            orientation, _direction = it.orientation()
+            box = it.bounding_box(RIL_TEXTLINE)
+            line_bbox = _bbox(box) if box else None
+            line = OcrElement(
+                ocr_class=_LINE_CLASSES.get(it.block_type(), OcrClass.LINE),
+                bbox=line_bbox,
+                baseline=(
+                    _line_baseline(line_bbox, it.baseline(RIL_TEXTLINE))
+                    if line_bbox
+                    else None
+                ),
+                textangle=(
+                    float(360 - orientation * 90)
+                    if orientation != ORIENTATION_PAGE_UP
+                    else None
+                ),
+                direction=paragraph.direction,
+                language=paragraph.language,
+            )
+            paragraph.children.append(line)
+        text = unicodedata.normalize('NFKC', it.text(RIL_WORD)).strip()
+        box = it.bounding_box(RIL_WORD)
+        if text and box:
+            line.children.append(
+                OcrElement(
+                    ocr_class=OcrClass.WORD,
+                    bbox=_bbox(box),
+                    text=text,
+                    confidence=int(it.confidence(RIL_WORD)) / 100.0,
+                    direction=paragraph.direction,
+                    language=paragraph.language,
+                )
+            )
+        if not it.next(RIL_WORD):
+            break
+
+    for paragraph in page.children:
+        paragraph.children = [line for line in paragraph.children if line.children]
+    page.children = [par for par in page.children if par.children]
+    return page
+
+
+class _ApiKey(NamedTuple):
+    languages: tuple[str, ...]
+    engine_mode: int | None
+    configs: tuple[str, ...]
+    user_words: str | None
+    user_patterns: str | None
+
+
+class TessBaseAPI:
+    """An initialized ``TessBaseAPI``, with its language models loaded."""
+
+    def __init__(self, lib: ctypes.CDLL, key: _ApiKey):
+        self._lib = lib
+        self._handle = lib.TessBaseAPICreate()
+        init_vars = {}
+        if key.user_words:
+            init_vars['user_words_file'] = fspath(key.user_words)
+        if key.user_patterns:
+            init_vars['user_patterns_file'] = fspath(key.user_patterns)
+        configs = (ctypes.c_char_p * len(key.configs))(
+            *(c.encode() for c in key.configs)
+        )
+        names = (ctypes.c_char_p * len(init_vars))(*(k.encode() for k in init_vars))
+        values = (ctypes.c_char_p * len(init_vars))(
+            *(v.encode() for v in init_vars.values())
+        )
+        engine_mode = 3 if key.engine_mode is None else key.engine_mode
+        languages = '+'.join(key.languages) or 'eng'
+        status = lib.TessBaseAPIInit4(
+            self._handle,
+            None,
+            languages.encode(),
+            engine_mode,
+            configs,
+            len(key.configs),
+            names,
+            values,
+            len(init_vars),
+            0,
+        )
+        if status != 0:
+            lib.TessBaseAPIDelete(self._handle)
+            self._handle = None
+            raise LibTesseractError(
+                f"could not initialize Tesseract for languages {languages}"
+            )
+
+    def close(self) -> None:
+        """Free Tesseract and its language models."""
+        if getattr(self, '_handle', None):
+            self._lib.TessBaseAPIDelete(self._handle)
+            self._handle = None
+
+    def __del__(self):
+        self.close()
+
+    def _set_image(self, image: Image.Image) -> None:
+        if image.mode == '1':
+            # Tesseract wants bilevel rows packed differently from Pillow's
+            image = image.convert('L')
+        elif image.mode not in ('L', 'RGB', 'RGBA'):
+            image = image.convert('RGB')
+        bytes_per_pixel = len(image.getbands())
+        data = image.tobytes()
+        self._lib.TessBaseAPISetImage(
+            self._handle,
+            data,
+            image.width,
+            image.height,
+            bytes_per_pixel,
+            image.width * bytes_per_pixel,
+        )
+
+    def recognize(
+        self,
+        image: Image.Image,
+        *,
+        page_number: int,
+        pagesegmode: int | None,
+        thresholding: ThresholdingMethod,
+        timeout: float,
+    ) -> tuple[OcrElement, str]:
+        """Recognize a page image.
+
+        Returns:
+            The OCR tree of the page and its plain text. If recognition takes
+            longer than ``timeout`` seconds, the page is empty and the text is
+            ``SKIPPED_PAGE_TEXT``, as with the tesseract program.
+
+        Raises:
+            LibTesseractError: if Tesseract fails to recognize the page.
+        """
+        lib, handle = self._lib, self._handle
+        dpi = image.info.get('dpi', (0, 0))[0] or None
+        if timeout == 0:
+            # Like the tesseract program given no time at all
+            return empty_page(image.size, dpi, page_number), SKIPPED_PAGE_TEXT
+        lib.TessBaseAPISetPageSegMode(handle, 3 if pagesegmode is None else pagesegmode)
+        lib.TessBaseAPISetVariable(
+            handle, b'thresholding_method', str(int(thresholding)).encode()
+        )
+        # Tesseract copies the pixels, so they need not outlive this call
+        self._set_image(image)
+        if dpi:
+            lib.TessBaseAPISetSourceResolution(handle, round(dpi))
+        monitor = lib.TessMonitorCreate()
+        started = time.monotonic()
+        try:
+            lib.TessMonitorSetDeadlineMSecs(monitor, int(timeout * 1000))
+            status = lib.TessBaseAPIRecognize(handle, monitor)
+        finally:
+            lib.TessMonitorDelete(monitor)
+        try:
+            if status != 0:
+                if time.monotonic() - started >= timeout:
+                    page_timedout(timeout)
+                    page = empty_page(image.size, dpi, page_number)
+                    return page, SKIPPED_PAGE_TEXT
+                raise LibTesseractError("Tesseract could not recognize the page")
+            results = lib.TessBaseAPIGetIterator(handle)
+            if not results:
+                return empty_page(image.size, dpi, page_number), ''
+            try:
+                page = build_page(
+                    ResultIterator(lib, results),
+                    image.size,
+                    dpi=dpi,
+                    page_number=page_number,
+                )
+            finally:
+                lib.TessResultIteratorDelete(results)
+            return page, _take_text(lib, lib.TessBaseAPIGetUTF8Text(handle))
+        finally:
+            lib.TessBaseAPIClear(handle)
+
+    def page_geometry(
+        self, image: Image.Image, *, orientation: bool, deskew: bool
+    ) -> tuple[int, float, float]:
+        """Find the orientation and skew of a page image, from one copy of it.
+
+        The API must have been initialized with the ``osd`` model.
+
+        Returns:
+            The orientation in degrees, the confidence in it, and the deskew
+            angle in degrees, as the tesseract program reports them with
+            ``--psm 0`` and ``--psm 2``. Values not requested, or that
+            Tesseract could not find for lack of text, are 0.
+        """
+        lib, handle = self._lib, self._handle
+        angle, confidence, deskew_angle = 0, 0.0, 0.0
+        self._set_image(image)
+        if dpi := image.info.get('dpi', (0, 0))[0]:
+            lib.TessBaseAPISetSourceResolution(handle, round(dpi))
+        try:
+            if orientation:
+                orient_deg, orient_conf = ctypes.c_int(), ctypes.c_float()
+                script, script_conf = ctypes.c_char_p(), ctypes.c_float()
+                if lib.TessBaseAPIDetectOrientationScript(
+                    handle,
+                    ctypes.byref(orient_deg),
+                    ctypes.byref(orient_conf),
+                    ctypes.byref(script),
+                    ctypes.byref(script_conf),
+                ):
+                    angle, confidence = orient_deg.value, orient_conf.value
+            if deskew:
+                lib.TessBaseAPISetPageSegMode(handle, PSM_AUTO_ONLY)
+                layout = lib.TessBaseAPIAnalyseLayout(handle)
+                if layout:
+                    try:
+                        values = [ctypes.c_int() for _ in range(3)]
+                        radians = ctypes.c_float()
+                        lib.TessPageIteratorOrientation(
+                            layout,
+                            *(ctypes.byref(v) for v in values),
+                            ctypes.byref(radians),
+                        )
+                        deskew_angle = math.degrees(radians.value)
+                    finally:
+                        lib.TessPageIteratorDelete(layout)
+        finally:
+            lib.TessBaseAPIClear(handle)
+        return angle, confidence, deskew_angle
+
+
+def empty_page(
+    size: tuple[int, int], dpi: float | None, page_number: int
+) -> OcrElement:
+    """Return a page with no OCR content."""
+    return OcrElement(
+        ocr_class=OcrClass.PAGE,
+        bbox=BoundingBox(left=0, top=0, right=size[0], bottom=size[1]),
+        dpi=dpi,
+        page_number=page_number,
+    )
+
+
+_pool = threading.local()
+
+# Each thread keeps the most recently used APIs, so that pages alternating
+# between two sets of languages (see --detect-languages), and the orientation
+# model, do not load models for every page, but memory stays bounded however
+# many sets there are
+_APIS_PER_THREAD = 3
+
+
+def get_api(
+    *,
+    languages: Sequence[str],
+    engine_mode: int | None,
+    tessconfig: Sequence[str],
+    user_words: str | None,
+    user_patterns: str | None,
+    omp_thread_limit: int | None = None,
+) -> TessBaseAPI:
+    """Return this thread's ``TessBaseAPI`` for the given settings.
+
+    A ``TessBaseAPI`` must not be used by two threads at once, so each thread
+    has its own, created on first use. Each thread keeps the APIs for its most
+    recently used settings, and frees the others.
+
+    Raises:
+        MissingDependencyError: if libtesseract is not available.
+        LibTesseractError: if Tesseract could not be initialized.
+    """
+    lib = load(omp_thread_limit)
+    key = _ApiKey(
+        tuple(languages),
+        engine_mode,
+        tuple(tessconfig),
+        user_words and fspath(user_words),
+        user_patterns and fspath(user_patterns),
+    )
+    # Ordered from least to most recently used
+    apis: dict[_ApiKey, TessBaseAPI] = getattr(_pool, 'apis', None) or {}
+    _pool.apis = apis
+    api = apis.pop(key, None)
+    if api is None:
+        while len(apis) >= _APIS_PER_THREAD:
+            apis.pop(next(iter(apis))).close()
+        log.debug("Initializing libtesseract for %s", '+'.join(key.languages))
+        api = TessBaseAPI(lib, key)
+    apis[key] = api
+    return api
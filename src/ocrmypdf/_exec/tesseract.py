@@ -8,22 +8,27 @@ from __future__ import annotations
 import logging
 import os
 import re
+import threading
+from collections.abc import Sequence
 from contextlib import suppress
 from enum import IntEnum
 from math import pi
 from os import fspath
 from pathlib import Path
 from subprocess import PIPE, STDOUT, CalledProcessError, TimeoutExpired
+from tempfile import TemporaryDirectory
 
 from packaging.version import Version
 
+from ocrmypdf._batch import Batcher
 from ocrmypdf._exec._probe import ToolProbe
+from ocrmypdf._ocr_cache import SKIPPED_PAGE_TEXT
 from ocrmypdf.exceptions import (
     MissingDependencyError,
     SubprocessOutputError,
     TesseractConfigError,
 )
-from ocrmypdf.pluginspec import OrientationConfidence
+from ocrmypdf.pluginspec import OrientationConfidence, ScriptConfidence
 from ocrmypdf.subprocess import run
 
 log = logging.getLogger(__name__)
@@ -161,8 +166,12 @@ def get_languages() -> set[str]:
     return {lang.strip() for lang in rest}
 
 
-def tess_base_args(langs: list[str], engine_mode: int | None) -> list[str]:
+def tess_base_args(
+    langs: list[str], engine_mode: int | None, tessdata_dir: Path | None = None
+) -> list[str]:
     args = ['tesseract']
+    if tessdata_dir is not None:
+        args.extend(['--tessdata-dir', fspath(tessdata_dir)])
     if langs:
         args.extend(['-l', '+'.join(langs)])
     if engine_mode is not None:
@@ -181,12 +190,46 @@ def _parse_tesseract_output(binary_output: bytes) -> dict[str, str]:
     return dict(gen())
 
 
-def get_orientation(
+# Reports of the latest orientation and script detection runs, so that asking
+# for the orientation and then the script of an image runs Tesseract once
+_OSD_REPORTS: dict[tuple, dict[str, str]] = {}
+_OSD_REPORTS_MAX = 16
+_OSD_REPORTS_LOCK = threading.Lock()
+
+
+def _run_osd(
     input_file: Path,
     engine_mode: int | None,
     timeout: float,
     omp_thread_limit: int | None = None,
-) -> OrientationConfidence:
+) -> dict[str, str]:
+    """Run orientation and script detection, returning its report.
+
+    The report is empty if Tesseract timed out or found too little text. The
+    reports of recent runs are reused while the image file is unchanged.
+    """
+    try:
+        stat = Path(input_file).stat()
+    except OSError:
+        return _osd_report(input_file, engine_mode, timeout, omp_thread_limit)
+    key = (fspath(input_file), stat.st_mtime_ns, stat.st_size, engine_mode)
+    with _OSD_REPORTS_LOCK:
+        if key in _OSD_REPORTS:
+            return _OSD_REPORTS[key]
+    report = _osd_report(input_file, engine_mode, timeout, omp_thread_limit)
+    with _OSD_REPORTS_LOCK:
+        _OSD_REPORTS[key] = report
+        while len(_OSD_REPORTS) > _OSD_REPORTS_MAX:
+            del _OSD_REPORTS[next(iter(_OSD_REPORTS))]
+    return report
+
+
+def _osd_report(
+    input_file: Path,
+    engine_mode: int | None,
+    timeout: float,
+    omp_thread_limit: int | None,
+) -> dict[str, str]:
     args_tesseract = tess_base_args(['osd'], engine_mode) + [
         '--psm',
         '0',
@@ -204,7 +247,7 @@ def get_orientation(
             env=_tesseract_env(omp_thread_limit),
         )
     except TimeoutExpired:
-        return OrientationConfidence(angle=0, confidence=0.0)
+        return {}
     except CalledProcessError as e:
         tesseract_log_output(e.stdout)
         tesseract_log_output(e.stderr)
@@ -214,10 +257,19 @@ def get_orientation(
             b'Too few characters. Skipping this page' in all_output
             or b'Image too large' in all_output
         ):
-            return OrientationConfidence(0, 0)
+            return {}
         raise SubprocessOutputError() from e
 
-    osd = _parse_tesseract_output(p.stdout)
+    return _parse_tesseract_output(p.stdout)
+
+
+def get_orientation(
+    input_file: Path,
+    engine_mode: int | None,
+    timeout: float,
+    omp_thread_limit: int | None = None,
+) -> OrientationConfidence:
+    osd = _run_osd(input_file, engine_mode, timeout, omp_thread_limit)
     angle = int(osd.get('Orientation in degrees', 0))
     orient_conf = OrientationConfidence(
         angle=angle, confidence=float(osd.get('Orientation confidence', 0))
@@ -225,6 +277,20 @@ def get_orientation(
     return orient_conf
 
 
+def get_script(
+    input_file: Path,
+    engine_mode: int | None,
+    timeout: float,
+    omp_thread_limit: int | None = None,
+) -> ScriptConfidence:
+    """Gets the script (writing system) of the text on this page."""
+    osd = _run_osd(input_file, engine_mode, timeout, omp_thread_limit)
+    return ScriptConfidence(
+        script=osd.get('Script', ''),
+        confidence=float(osd.get('Script confidence', 0)),
+    )
+
+
 def _is_empty_page_error(exc):
     if b'Empty page!!' in exc.output:  # Tesseract 4.x
         return True
@@ -350,7 +416,7 @@ def _generate_null_hocr(output_hocr: Path, output_text: Path, image: Path) -> No
     Ensures page is the same size as the input image.
     """
     output_hocr.write_text('', encoding='utf-8')
-    output_text.write_text('[skipped page]', encoding='utf-8')
+    output_text.write_text(SKIPPED_PAGE_TEXT, encoding='utf-8')
 
 
 def generate_hocr(
@@ -367,11 +433,16 @@ def generate_hocr(
     user_words,
     user_patterns,
     omp_thread_limit: int | None = None,
+    tessdata_dir: Path | None = None,
 ) -> None:
-    """Generate a hOCR file, which must be converted to PDF."""
+    """Generate a hOCR file, which must be converted to PDF.
+
+    ``tessdata_dir`` selects a folder of language models other than
+    Tesseract's default.
+    """
     prefix = output_hocr.with_suffix('')
 
-    args_tesseract = tess_base_args(languages, engine_mode)
+    args_tesseract = tess_base_args(languages, engine_mode, tessdata_dir)
 
     if pagesegmode is not None:
         args_tesseract.extend(['--psm', str(pagesegmode)])
@@ -426,8 +497,231 @@ def generate_hocr(
             prefix.with_suffix('.txt').replace(output_text)
 
 
+def generate_hocr_stdout(
+    *,
+    input_file: Path,
+    languages: list[str],
+    engine_mode: int,
+    tessconfig: list[str],
+    timeout: float,
+    pagesegmode: int,
+    thresholding: ThresholdingMethod,
+    user_words,
+    user_patterns,
+    omp_thread_limit: int | None = None,
+    tessdata_dir: Path | None = None,
+) -> bytes | None:
+    """Generate hOCR for an image, returning it instead of writing files.
+
+    Tesseract writes the hOCR to its standard output, and its messages to
+    standard error. Arguments are as for :func:`generate_hocr`.
+
+    Returns:
+        The hOCR document, or None if the page was skipped because Tesseract
+        timed out, or found the image too large or empty.
+    """
+    args_tesseract = tess_base_args(languages, engine_mode, tessdata_dir)
+
+    if pagesegmode is not None:
+        args_tesseract.extend(['--psm', str(pagesegmode)])
+
+    if thresholding != ThresholdingMethod.AUTO and has_thresholding():
+        args_tesseract.extend(['-c', f'thresholding_method={thresholding}'])
+
+    if user_words:
+        args_tesseract.extend(['--user-words', user_words])
+
+    if user_patterns:
+        args_tesseract.extend(['--user-patterns', user_patterns])
+
+    args_tesseract.extend([fspath(input_file), 'stdout', 'hocr'])
+    args_tesseract.extend(tessconfig)
+    try:
+        p = run(
+            args_tesseract,
+            stdout=PIPE,
+            stderr=PIPE,
+            timeout=timeout,
+            check=True,
+            env=_tesseract_env(omp_thread_limit),
+        )
+    except TimeoutExpired:
+        page_timedout(timeout)
+        return None
+    except CalledProcessError as e:
+        tesseract_log_output(e.stderr)
+        all_output = (e.output or b'') + (e.stderr or b'')
+        if b'Image too large' in all_output or b'Empty page!!' in all_output:
+            return None
+        raise SubprocessOutputError() from e
+
+    tesseract_log_output(p.stderr)
+    if not _HOCR_PAGE_START.search(p.stdout.decode('utf-8', errors='replace')):
+        raise SubprocessOutputError(
+            "Tesseract exited successfully but did not write hOCR to stdout"
+        )
+    return p.stdout
+
+
+_HOCR_PAGE_START = re.compile(r"<div class=['\"]ocr_page['\"]")
+
+
+def split_hocr(hocr: str) -> list[str]:
+    """Split a multi-page hOCR document into one document per page.
+
+    Each page keeps the document's head, and its ``ppageno`` is reset to 0 so
+    that it reads like the output of OCRing that page alone.
+    """
+    starts = [m.start() for m in _HOCR_PAGE_START.finditer(hocr)]
+    if not starts:
+        return []
+    end = hocr.rindex('</body>')
+    header, footer = hocr[: starts[0]], hocr[end:]
+    pages = []
+    for start, next_start in zip(starts, [*starts[1:], end], strict=True):
+        page = re.sub(r'ppageno \d+', 'ppageno 0', hocr[start:next_start], count=1)
+        pages.append(header + page.rstrip() + '\n ' + footer)
+    return pages
+
+
+def generate_hocr_batch(
+    items: Sequence[tuple[Path, Path, Path]],
+    *,
+    languages: list[str],
+    engine_mode: int,
+    tessconfig: list[str],
+    timeout: float,
+    pagesegmode: int,
+    thresholding: ThresholdingMethod,
+    user_words,
+    user_patterns,
+    omp_thread_limit: int | None = None,
+    tessdata_dir: Path | None = None,
+) -> None:
+    """Generate hOCR files for several images with one Tesseract process.
+
+    Tesseract accepts a text file listing images in place of an image, and
+    OCRs them all with the language models it loaded once. The multi-page
+    hOCR and text output are split into a file per image.
+
+    ``items`` gives the (input image, output hOCR, output text) of each image.
+    The other arguments are as for :func:`generate_hocr`, except that
+    ``timeout`` is the time allowed per image.
+
+    Raises:
+        SubprocessOutputError: if Tesseract fails, or its output does not have
+            one page per image. Unlike :func:`generate_hocr`, a failure is not
+            attributed to any page, so callers should retry the images one at
+            a time.
+        TimeoutExpired: if Tesseract takes longer than ``timeout`` per image.
+    """
+    args_tesseract = tess_base_args(languages, engine_mode, tessdata_dir)
+    if pagesegmode is not None:
+        args_tesseract.extend(['--psm', str(pagesegmode)])
+    if thresholding != ThresholdingMethod.AUTO and has_thresholding():
+        args_tesseract.extend(['-c', f'thresholding_method={thresholding}'])
+    if user_words:
+        args_tesseract.extend(['--user-words', user_words])
+    if user_patterns:
+        args_tesseract.extend(['--user-patterns', user_patterns])
+
+    with TemporaryDirectory() as tmpdir:
+        filelist = Path(tmpdir) / 'filelist.txt'
+        filelist.write_text(
+            ''.join(f'{Path(input_file).resolve()}\n' for input_file, _, _ in items),
+            encoding='utf-8',
+        )
+        prefix = Path(tmpdir) / 'batch'
+        args_tesseract.extend([fspath(filelist), fspath(prefix), 'hocr', 'txt'])
+        args_tesseract.extend(tessconfig)
+        try:
+            p = run(
+                args_tesseract,
+                stdout=PIPE,
+                stderr=STDOUT,
+                timeout=timeout * len(items),
+                check=True,
+                env=_tesseract_env(omp_thread_limit),
+            )
+        except CalledProcessError as e:
+            tesseract_log_output(e.output)
+            raise SubprocessOutputError() from e
+        tesseract_log_output(p.stdout)
+
+        try:
+            hocr_pages = split_hocr(
+                prefix.with_suffix('.hocr').read_text(encoding='utf-8')
+            )
+            text_pages = prefix.with_suffix('.txt').read_text(encoding='utf-8')
+        except FileNotFoundError as e:
+            raise SubprocessOutputError(
+                "Tesseract did not produce the expected batch output"
+            ) from e
+        # Pages of text are separated, or followed, by form feeds
+        texts = text_pages.split('\f')
+        if len(texts) == len(items) + 1 and not texts[-1]:
+            texts.pop()
+        if len(hocr_pages) != len(items) or len(texts) != len(items):
+            raise SubprocessOutputError(
+                f"Tesseract produced {len(hocr_pages)} pages of hOCR and "
+                f"{len(texts)} pages of text for a batch of {len(items)} images"
+            )
+        for (_, output_hocr, output_text), hocr, text in zip(
+            items, hocr_pages, texts, strict=True
+        ):
+            output_hocr.write_text(hocr, encoding='utf-8')
+            output_text.write_text(text, encoding='utf-8')
+
+
+class HocrBatcher(Batcher[tuple[Path, Path, Path], None]):
+    """Combine hOCR requests from concurrent worker threads into batches.
+
+    Pages are batched with others OCRed with the same settings, and OCRed
+    with one Tesseract process. Pages alone in their batch, and the pages of a
+    batch that failed, are OCRed one at a time, so that errors, timeouts and
+    empty pages are handled for each page as usual.
+    """
+
+    def generate_hocr(self, *, batch_size: int = 1, **kwargs) -> None:
+        """Generate a hOCR file, possibly in a batch with other images.
+
+        Arguments are as for :func:`generate_hocr`; ``batch_size`` is the
+        largest number of images to OCR with one Tesseract process.
+        """
+        request = (
+            kwargs.pop('input_file'),
+            kwargs.pop('output_hocr'),
+            kwargs.pop('output_text'),
+        )
+
+        def run_batch(requests: list[tuple[Path, Path, Path]]) -> list[None]:
+            generate_hocr_batch(requests, **kwargs)
+            return [None] * len(requests)
+
+        def run_single(request: tuple[Path, Path, Path]) -> None:
+            input_file, output_hocr, output_text = request
+            generate_hocr(
+                input_file=input_file,
+                output_hocr=output_hocr,
+                output_text=output_text,
+                **kwargs,
+            )
+
+        self.submit(
+            tuple(
+                tuple(value) if isinstance(value, list) else value
+                for _, value in sorted(kwargs.items())
+            ),
+            request,
+            batch_size=batch_size,
+            run_batch=run_batch,
+            run_single=run_single,
+            name='tesseract',
+        )
+
+
 def use_skip_page(output_pdf: Path, output_text: Path) -> None:
-    output_text.write_text('[skipped page]', encoding='utf-8')
+    output_text.write_text(SKIPPED_PAGE_TEXT, encoding='utf-8')
 
     # A 0 byte file to the output to indicate a skip
     output_pdf.write_bytes(b'')
@@ -7,15 +7,18 @@ from __future__ import annotations
 
 import logging
 import os
-from collections.abc import Iterator
+import shutil
+from collections.abc import Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from decimal import Decimal
 from pathlib import Path
 from subprocess import PIPE, STDOUT
 from tempfile import TemporaryDirectory
+from typing import Any
 
 from PIL import Image
 
+from ocrmypdf._batch import Batcher
 from ocrmypdf._exec._probe import ToolProbe
 from ocrmypdf.exceptions import SubprocessOutputError
 from ocrmypdf.subprocess import run
@@ -51,6 +54,19 @@ version = PROBE.version
 available = PROBE.available
 
 
+_DEFAULT_CLEAN_ARGS = [
+    '--layout',
+    'none',
+    '--mask-scan-size',
+    '100',  # don't blank out narrow columns
+    '--no-border-align',  # don't align visible content to borders
+    '--no-mask-center',  # don't center visible content within page
+    '--no-grayfilter',  # don't remove light gray areas
+    '--no-blackfilter',  # don't remove solid black areas
+    '--no-deskew',  # don't deskew
+]
+
+
 @contextmanager
 def _setup_unpaper_io(input_file: Path) -> Iterator[tuple[Path, Path, Path]]:
     with Image.open(input_file) as im:
@@ -68,7 +84,12 @@ def _setup_unpaper_io(input_file: Path) -> Iterator[tuple[Path, Path, Path]]:
 
 
 def run_unpaper(
-    input_file: Path, output_file: Path, *, dpi: DecFloat, mode_args: list[str]
+    input_file: Path,
+    output_file: Path,
+    *,
+    dpi: DecFloat,
+    mode_args: list[str],
+    save_params: Mapping[str, Any] | None = None,
 ) -> None:
     args_unpaper = ['unpaper', '-v', '--dpi', str(round(dpi, 6))] + mode_args
 
@@ -92,7 +113,7 @@ def run_unpaper(
         )
         try:
             with Image.open(output_pnm) as imout:
-                imout.save(output_file, dpi=(dpi, dpi))
+                imout.save(output_file, dpi=(dpi, dpi), **(save_params or {}))
         except OSError as e:
             raise SubprocessOutputError(
                 "unpaper: failed to produce the expected output file. "
@@ -107,23 +128,140 @@ def clean(
     *,
     dpi: DecFloat,
     unpaper_args: list[str] | None = None,
+    save_params: Mapping[str, Any] | None = None,
 ) -> Path:
-    default_args = [
-        '--layout',
-        'none',
-        '--mask-scan-size',
-        '100',  # don't blank out narrow columns
-        '--no-border-align',  # don't align visible content to borders
-        '--no-mask-center',  # don't center visible content within page
-        '--no-grayfilter',  # don't remove light gray areas
-        '--no-blackfilter',  # don't remove solid black areas
-        '--no-deskew',  # don't deskew
-    ]
     if not unpaper_args:
-        unpaper_args = default_args
+        unpaper_args = _DEFAULT_CLEAN_ARGS
     try:
-        run_unpaper(input_file, output_file, dpi=dpi, mode_args=unpaper_args)
+        run_unpaper(
+            input_file,
+            output_file,
+            dpi=dpi,
+            mode_args=unpaper_args,
+            save_params=save_params,
+        )
         return output_file
     except UnpaperImageTooLargeError as e:
         log.warning(str(e))
         return input_file
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    try:
+        target.symlink_to(source.resolve())
+    except OSError:  # e.g. Windows without symlink privilege
+        shutil.copyfile(source, target)
+
+
+def clean_batch(
+    items: Sequence[tuple[Path, Path]],
+    *,
+    dpi: DecFloat,
+    unpaper_args: list[str] | None = None,
+    save_params: Mapping[str, Any] | None = None,
+) -> list[Path]:
+    """Clean several images with a single unpaper process.
+
+    unpaper processes a numbered sequence of sheets when its input and output
+    filenames contain a ``%d`` template, so the input images are linked into a
+    temporary folder under numbered names. All images must have the same
+    resolution and file format.
+
+    Returns:
+        For each (input, output) pair, the output file, or the input file if
+        the image is too large for unpaper.
+    """
+    results = [input_file for input_file, _ in items]
+    batch = []
+    for n, (input_file, output_file) in enumerate(items):
+        with Image.open(input_file) as im:
+            if im.width * im.height >= UNPAPER_IMAGE_PIXEL_LIMIT:
+                log.warning(str(UnpaperImageTooLargeError(w=im.width, h=im.height)))
+                continue
+        batch.append((n, input_file, output_file))
+    if not batch:
+        return results
+    if len({input_file.suffix for _, input_file, _ in batch}) != 1:
+        raise ValueError("all images in a batch must have the same file format")
+
+    args_unpaper = ['unpaper', '-v', '--dpi', str(round(dpi, 6))]
+    args_unpaper.extend(unpaper_args or _DEFAULT_CLEAN_ARGS)
+    with TemporaryDirectory(ignore_cleanup_errors=True) as tmpdir:
+        tmppath = Path(tmpdir)
+        suffix = batch[0][1].suffix
+        for sheet, (_, input_file, _) in enumerate(batch, start=1):
+            _link_or_copy(input_file, tmppath / f'input{sheet:06d}{suffix}')
+        # As for run_unpaper, user arguments may not contain paths, so these
+        # absolute paths in a private folder are the only files unpaper touches
+        args_unpaper.extend(
+            [
+                '--start-sheet',
+                '1',
+                '--end-sheet',
+                str(len(batch)),
+                os.fspath(tmppath / f'input%06d{suffix}'),
+                os.fspath(tmppath / 'output%06d.pnm'),
+            ]
+        )
+        run(
+            args_unpaper,
+            close_fds=True,
+            check=True,
+            stderr=STDOUT,
+            stdout=PIPE,
+            cwd=tmpdir,
+            logs_errors_to_stdout=True,
+        )
+        for sheet, (n, _, output_file) in enumerate(batch, start=1):
+            output_pnm = tmppath / f'output{sheet:06d}.pnm'
+            try:
+                with Image.open(output_pnm) as imout:
+                    imout.save(output_file, dpi=(dpi, dpi), **(save_params or {}))
+            except OSError as e:
+                raise SubprocessOutputError(
+                    "unpaper: failed to produce the expected output file. "
+                    + " Called with: "
+                    + str(args_unpaper)
+                ) from e
+            results[n] = output_file
+    return results
+
+
+class CleanBatcher(Batcher[tuple[Path, Path], Path]):
+    """Combine cleaning requests from concurrent worker threads into batches.
+
+    Pages are batched with others cleaned with the same settings, and cleaned
+    with one unpaper process. Pages alone in their batch, and the pages of a
+    batch that failed, are cleaned one at a time, so that an error is
+    reported against the page that caused it.
+    """
+
+    def clean(
+        self,
+        input_file: Path,
+        output_file: Path,
+        *,
+        dpi: DecFloat,
+        unpaper_args: list[str] | None = None,
+        save_params: Mapping[str, Any] | None = None,
+        batch_size: int = 1,
+    ) -> Path:
+        """Clean an image, possibly in a batch with other images.
+
+        Arguments are as for :func:`clean`; ``batch_size`` is the largest
+        number of images to clean with one unpaper process.
+        """
+        settings = dict(dpi=dpi, unpaper_args=unpaper_args, save_params=save_params)
+        return self.submit(
+            (
+                round(dpi, 6),
+                tuple(unpaper_args or ()),
+                tuple(sorted((save_params or {}).items())),
+                input_file.suffix,
+            ),
+            (input_file, output_file),
+            batch_size=batch_size,
+            run_batch=lambda requests: clean_batch(requests, **settings),
+            run_single=lambda request: clean(*request, **settings),
+            name='unpaper',
+        )
@@ -323,6 +323,7 @@ class OcrGrafter:
         self.output_file = context.get_path('graft_layers.pdf')
 
         self.emplacements = 1
+        self.replaced_old_text = False
         self.render_mode = RenderMode.UNDERNEATH
 
         # Check renderer type
@@ -333,6 +334,18 @@ class OcrGrafter:
         self.fpdf2_hocr_pages: list[Fpdf2PageInfo] = []
         self.fpdf2_parsed_pages: list[Fpdf2ParsedPage] = []
 
+    def _replaces_old_text(self, pageno: int) -> bool:
+        """Return True if new OCR text replaces the old invisible text on a page."""
+        options = self.context.options
+        if options.mode == ProcessingMode.redo:
+            return True
+        # In skip mode, pages with text are only OCRed if their text was poor
+        return (
+            options.mode == ProcessingMode.skip
+            and options.skip_text_quality is not None
+            and self.pdfinfo[pageno].has_text
+        )
+
     def graft_page(
         self,
         *,
@@ -410,7 +423,7 @@ class OcrGrafter:
                         pageno=pageno,
                         autorotate_correction=autorotate_correction,
                         emplaced_page=emplaced_page,
-                        dpi=self.pdfinfo[pageno].dpi.to_scalar(),
+                        dpi=ocr_tree.dpi or self.pdfinfo[pageno].dpi.to_scalar(),
                     )
                 )
             if ocr_output:
@@ -425,22 +438,20 @@ class OcrGrafter:
                 )
 
     def finalize(self):
-        # Can have hocr OR parsed pages OR neither (no OCR), but not both
-        assert not (self.fpdf2_hocr_pages and self.fpdf2_parsed_pages), (
-            "Can't have both hocr and ocrtree pages"
-        )
-
         if self.fpdf2_hocr_pages:
-            # Render all pages with fpdf2, then graft
-            parsed_pages = self._parse_hocr_pages()
-            self.fpdf2_parsed_pages = parsed_pages
+            # Render all pages with fpdf2, then graft. Pages that were OCRed in
+            # tiles already have an OCR tree, even if the engine produces hOCR.
+            self.fpdf2_parsed_pages.extend(self._parse_hocr_pages())
 
         if self.fpdf2_parsed_pages:
             self._render_and_graft_fpdf2_pages()
 
         discard_text_search_index(self.pdf_base)
         discard_page_thumbnails(self.pdf_base)
-        if self.context.options.mode in (ProcessingMode.force, ProcessingMode.redo):
+        if (
+            self.context.options.mode in (ProcessingMode.force, ProcessingMode.redo)
+            or self.replaced_old_text
+        ):
             discard_structure_tree(self.pdf_base)
         self.pdf_base.save(self.output_file)
         self.pdf_base.close()
@@ -609,9 +620,10 @@ class OcrGrafter:
 
         new_text_layer = Stream(self.pdf_base, pdf_draw_xobj)
 
-        # Strip old invisible text if redo mode is enabled
-        if self.context.options.mode == ProcessingMode.redo:
+        # Strip old invisible text if OCR is being redone
+        if self._replaces_old_text(pageno):
             strip_invisible_text(self.pdf_base, base_page)
+            self.replaced_old_text = True
 
         # Add text layer to base page
         base_page.contents_coalesce()
@@ -706,8 +718,9 @@ class OcrGrafter:
                     pdf_draw_xobj = b'q\n' + (b'%s Do\n' % text_xobj_name) + b'\nQ\n'
                 new_text_layer = Stream(self.pdf_base, pdf_draw_xobj)
 
-                if self.context.options.mode == ProcessingMode.redo:
+                if self._replaces_old_text(pageno):
                     strip_invisible_text(self.pdf_base, base_page)
+                    self.replaced_old_text = True
                 base_page.contents_coalesce()
                 base_page.contents_add(
                     new_text_layer, prepend=self.render_mode == RenderMode.UNDERNEATH
@@ -41,6 +41,11 @@ class PdfContext:
         self.origin = origin
         self.pdfinfo = pdfinfo
         self.plugin_manager = plugin_manager
+        #: Time (as from :func:`time.time`) by which OCR should finish, if any.
+        self.ocr_deadline: float | None = None
+        #: True if OCR was cut short on some pages to save time, so the
+        #: output is worse than it could have been.
+        self.degraded = False
 
     def get_path(self, name: str) -> Path:
         """Generate a ``Path`` for an intermediate file involved in processing.
@@ -87,6 +92,11 @@ class PageContext:
         self.pageno = pageno
         self.pageinfo = pdf_context.pdfinfo[pageno]
         self.plugin_manager = pdf_context.plugin_manager
+        self.page_count = len(pdf_context.pdfinfo)
+        self.ocr_deadline = pdf_context.ocr_deadline
+        #: True if the OCR engine gave up on this page, or a tile of it, for
+        #: taking too long.
+        self.ocr_timed_out = False
         # Ensure no reference to PdfContext which contains OcrOptions
         self._pdf_context = None
 
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+"""Combine OCR requests of concurrent pages into calls to generate_ocr_batch."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ocrmypdf._batch import Batcher
+from ocrmypdf._options import OcrOptions
+from ocrmypdf.pluginspec import OcrEngine
+
+if TYPE_CHECKING:
+    from ocrmypdf.models.ocr_element import OcrElement
+
+
+class OcrBatcher(Batcher[tuple[Path, int], 'tuple[OcrElement, str]']):
+    """Combine OCR requests from concurrent worker threads into batches.
+
+    Pages are batched with others OCRed by the same kind of engine with the
+    same options, and OCRed with one call to the engine's
+    :meth:`~ocrmypdf.pluginspec.OcrEngine.generate_ocr_batch`. Pages alone in
+    their batch, and the pages of a batch that failed, are OCRed one at a time
+    with :meth:`~ocrmypdf.pluginspec.OcrEngine.generate_ocr`.
+    """
+
+    def generate_ocr(
+        self,
+        engine: OcrEngine,
+        input_file: Path,
+        options: OcrOptions,
+        page_number: int = 0,
+        *,
+        batch_size: int = 1,
+    ) -> tuple[OcrElement, str]:
+        """OCR an image, possibly in a batch with other images.
+
+        Arguments are as for :meth:`~ocrmypdf.pluginspec.OcrEngine.generate_ocr`;
+        ``batch_size`` is the largest number of images to OCR in one call.
+        """
+
+        def run_batch(requests: list[tuple[Path, int]]) -> list[tuple[OcrElement, str]]:
+            return engine.generate_ocr_batch(
+                [input_file for input_file, _ in requests],
+                options,
+                [page_number for _, page_number in requests],
+            )
+
+        def run_single(request: tuple[Path, int]) -> tuple[OcrElement, str]:
+            return engine.generate_ocr(request[0], options, request[1])
+
+        return self.submit(
+            # Pages may have different options, such as languages chosen for them
+            (type(engine), options.model_dump_json_safe()),
+            (input_file, page_number),
+            batch_size=batch_size,
+            run_batch=run_batch,
+            run_single=run_single,
+            name=str(engine),
+        )
@@ -0,0 +1,289 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+"""Cache the results of an OCR engine, keyed by the exact image it was given."""
+
+from __future__ import annotations
+
+import json
+import logging
+import zipfile
+from collections.abc import Sequence
+from dataclasses import asdict
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, cast
+
+from ocrmypdf._cache import DiskCache, cache_key, file_digest
+from ocrmypdf._options import OcrOptions
+from ocrmypdf._version import __version__
+from ocrmypdf.models.ocr_element import Baseline, BoundingBox, FontInfo, OcrElement
+from ocrmypdf.pluginspec import (
+    OcrEngine,
+    OrientationConfidence,
+    PageGeometry,
+    ScriptConfidence,
+)
+
+log = logging.getLogger(__name__)
+
+# Text OCR engines give for a page they gave up on, as the tesseract program
+# does; never cached, so that a later run with more time can try again
+SKIPPED_PAGE_TEXT = '[skipped page]'
+
+
+def element_to_dict(element: OcrElement) -> dict[str, Any]:
+    """Convert an OCR tree to plain data that can be stored as JSON."""
+    return asdict(element)
+
+
+def element_from_dict(data: dict[str, Any]) -> OcrElement:
+    """Rebuild an OCR tree from :func:`element_to_dict` output."""
+    data = dict(data)
+    if data.get('bbox') is not None:
+        data['bbox'] = BoundingBox(**data['bbox'])
+    if data.get('poly') is not None:
+        data['poly'] = [tuple(point) for point in data['poly']]
+    if data.get('baseline') is not None:
+        data['baseline'] = Baseline(**data['baseline'])
+    if data.get('font') is not None:
+        data['font'] = FontInfo(**data['font'])
+    data['children'] = [element_from_dict(child) for child in data['children']]
+    return OcrElement(**data)
+
+
+class CachingOcrEngine(OcrEngine):
+    """Wrap an OCR engine so that its results are kept in a :class:`DiskCache`.
+
+    Each result is stored under a hash of the input image file, the engine's
+    class and version, the OCR languages and the engine's
+    :meth:`~ocrmypdf.pluginspec.OcrEngine.cache_parameters`. Output files of
+    a call are stored together as one zip archive, so that they are evicted
+    together.
+    """
+
+    def __init__(self, engine: OcrEngine, cache: DiskCache):
+        """Wrap ``engine``, storing its results in ``cache``."""
+        self._engine = engine
+        self._cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything else an engine offers, such as its own helper methods
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._engine, name)
+
+    def __str__(self) -> str:
+        return str(self._engine)
+
+    def version(self) -> str:
+        return self._engine.version()
+
+    def creator_tag(self, options: OcrOptions) -> str:
+        return self._engine.creator_tag(options)
+
+    def languages(self, options: OcrOptions):
+        return self._engine.languages(options)
+
+    def supports_generate_ocr(self) -> bool:
+        return self._engine.supports_generate_ocr()
+
+    def supports_page_geometry(self) -> bool:
+        return self._engine.supports_page_geometry()
+
+    def cache_parameters(self, options: OcrOptions) -> object | None:
+        return self._engine.cache_parameters(options)
+
+    def _key(self, method: str, input_file: Path, options: OcrOptions, *args):
+        params = self._engine.cache_parameters(options)
+        if params is None:
+            return None
+        engine_class = type(self._engine)
+        return cache_key(
+            file_digest(input_file),
+            __version__,
+            f'{engine_class.__module__}.{engine_class.__qualname__}',
+            self._engine.version(),
+            method,
+            options.languages,
+            params,
+            *args,
+        )
+
+    def _get(self, key: str | None, outputs: dict[str, Path]) -> bool:
+        """Extract a cached result to ``outputs``, which maps member to file."""
+        if key is None:
+            return False
+        with TemporaryDirectory() as tmpdir:
+            archive = Path(tmpdir) / 'entry.zip'
+            if not self._cache.get(key, archive):
+                return False
+            try:
+                with zipfile.ZipFile(archive) as zf:
+                    for member, output_file in outputs.items():
+                        output_file.write_bytes(zf.read(member))
+            except (zipfile.BadZipFile, KeyError) as e:
+                log.warning(f"Ignoring damaged OCR cache entry {key}: {e}")
+                return False
+        return True
+
+    def _put(self, key: str | None, outputs: dict[str, Path]) -> None:
+        if key is None:
+            return
+        with TemporaryDirectory() as tmpdir:
+            archive = Path(tmpdir) / 'entry.zip'
+            with zipfile.ZipFile(archive, 'w') as zf:
+                for member, output_file in outputs.items():
+                    zf.write(output_file, member)
+            self._cache.put(key, archive)
+
+    def _get_json(self, key: str | None) -> Any:
+        with TemporaryDirectory() as tmpdir:
+            result_file = Path(tmpdir) / 'result.json'
+            if not self._get(key, {'result.json': result_file}):
+                return None
+            return json.loads(result_file.read_text(encoding='utf-8'))
+
+    def _put_json(self, key: str | None, result: Any) -> None:
+        with TemporaryDirectory() as tmpdir:
+            result_file = Path(tmpdir) / 'result.json'
+            result_file.write_text(json.dumps(result), encoding='utf-8')
+            self._put(key, {'result.json': result_file})
+
+    def get_orientation(
+        self, input_file: Path, options: OcrOptions
+    ) -> OrientationConfidence:
+        key = self._key('get_orientation', input_file, options)
+        if (cached := self._get_json(key)) is not None:
+            return OrientationConfidence(*cached)
+        result = self._engine.get_orientation(input_file, options)
+        self._put_json(key, list(result))
+        return result
+
+    def get_deskew(self, input_file: Path, options: OcrOptions) -> float:
+        key = self._key('get_deskew', input_file, options)
+        if (cached := self._get_json(key)) is not None:
+            return cached
+        result = self._engine.get_deskew(input_file, options)
+        self._put_json(key, result)
+        return result
+
+    def get_script(
+        self, input_file: Path, options: OcrOptions
+    ) -> ScriptConfidence | None:
+        key = self._key('get_script', input_file, options)
+        if (cached := self._get_json(key)) is not None:
+            return ScriptConfidence(*cached)
+        result = self._engine.get_script(input_file, options)
+        if result is not None:
+            self._put_json(key, list(result))
+        return result
+
+    def get_page_geometry(
+        self,
+        input_file: Path,
+        options: OcrOptions,
+        *,
+        orientation: bool = True,
+        deskew: bool = True,
+    ) -> PageGeometry:
+        key = self._key('get_page_geometry', input_file, options, orientation, deskew)
+        if (cached := self._get_json(key)) is not None:
+            return PageGeometry(*cached)
+        result = self._engine.get_page_geometry(
+            input_file, options, orientation=orientation, deskew=deskew
+        )
+        self._put_json(key, list(result))
+        return result
+
+    def generate_hocr(
+        self,
+        input_file: Path,
+        output_hocr: Path,
+        output_text: Path,
+        options: OcrOptions,
+    ) -> None:
+        key = self._key('generate_hocr', input_file, options)
+        outputs = {'hocr': output_hocr, 'text': output_text}
+        if self._get(key, outputs):
+            return
+        self._engine.generate_hocr(input_file, output_hocr, output_text, options)
+        if output_text.read_text(encoding='utf-8') != SKIPPED_PAGE_TEXT:
+            self._put(key, outputs)
+
+    def generate_pdf(
+        self,
+        input_file: Path,
+        output_pdf: Path,
+        output_text: Path,
+        options: OcrOptions,
+    ) -> None:
+        key = self._key('generate_pdf', input_file, options)
+        outputs = {'pdf': output_pdf, 'text': output_text}
+        if self._get(key, outputs):
+            return
+        self._engine.generate_pdf(input_file, output_pdf, output_text, options)
+        if output_text.read_text(encoding='utf-8') != SKIPPED_PAGE_TEXT:
+            self._put(key, outputs)
+
+    def generate_ocr(
+        self,
+        input_file: Path,
+        options: OcrOptions,
+        page_number: int = 0,
+    ) -> tuple[OcrElement, str]:
+        key = self._key('generate_ocr', input_file, options)
+        if (cached := self._get_json(key)) is not None:
+            tree = element_from_dict(cached['tree'])
+            tree.page_number = page_number
+            return tree, cached['text']
+        tree, text = self._engine.generate_ocr(input_file, options, page_number)
+        if text != SKIPPED_PAGE_TEXT:
+            self._put_json(key, {'tree': element_to_dict(tree), 'text': text})
+        return tree, text
+
+    def supports_generate_ocr_batch(self) -> bool:
+        return self._engine.supports_generate_ocr_batch()
+
+    def generate_ocr_batch(
+        self,
+        input_files: Sequence[Path],
+        options: OcrOptions,
+        page_numbers: Sequence[int],
+    ) -> list[tuple[OcrElement, str]]:
+        keys = [
+            self._key('generate_ocr', input_file, options) for input_file in input_files
+        ]
+        results: list[tuple[OcrElement, str] | None] = []
+        for key, page_number in zip(keys, page_numbers, strict=True):
+            if (cached := self._get_json(key)) is not None:
+                tree = element_from_dict(cached['tree'])
+                tree.page_number = page_number
+                results.append((tree, cached['text']))
+            else:
+                results.append(None)
+        misses = [n for n, result in enumerate(results) if result is None]
+        if misses:
+            new_results = self._engine.generate_ocr_batch(
+                [input_files[n] for n in misses],
+                options,
+                [page_numbers[n] for n in misses],
+            )
+            for n, (tree, text) in zip(misses, new_results, strict=True):
+                results[n] = tree, text
+                if text != SKIPPED_PAGE_TEXT:
+                    self._put_json(
+                        keys[n], {'tree': element_to_dict(tree), 'text': text}
+                    )
+        return cast(list[tuple[OcrElement, str]], results)
+
+
+def ocr_cache(options: OcrOptions) -> DiskCache | None:
+    """Return the OCR result cache requested by the options, if any."""
+    if not getattr(options, 'ocr_cache', None):
+        return None
+    return DiskCache(
+        options.ocr_cache,
+        int(options.ocr_cache_size * 1024 * 1024),
+        name='OCR',
+    )
@@ -21,6 +21,7 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator, model_valida
 from ocrmypdf._defaults import DEFAULT_LANGUAGE, DEFAULT_ROTATE_PAGES_THRESHOLD
 from ocrmypdf.exceptions import BadArgsError
 from ocrmypdf.helpers import monotonic
+from ocrmypdf.imageops import INTERMEDIATE_IMAGE_FORMATS, OCR_IMAGE_MODES
 
 # Import plugin option models - these will be available after plugins are loaded
 # We'll use forward references and handle imports dynamically
@@ -185,6 +186,7 @@ class OcrOptions(BaseModel):
     # Image processing
     image_dpi: int | None = None
     deskew: bool = False
+    deskew_method: str = 'engine'
     clean: bool = False
     clean_final: bool = False
     rotate_pages: bool = False
@@ -192,9 +194,18 @@ class OcrOptions(BaseModel):
     remove_vectors: bool = False
     oversample: int = 0
     unpaper_args: list[str] | None = None
+    unpaper_batch_size: int = 1
 
     # OCR behavior
     skip_big: float | None = None
+    skip_text_quality: float | None = None
+    skip_text_wordlist: Path | None = None
+    skip_blank: float | None = None
+    blank_ink_level: int = 128
+    skip_blank_processing: bool = False
+    detect_languages: bool = False
+    ocr_deadline: float | None = None
+    adaptive_ocr_resolution: bool = False
     pages: str | set[int] | None = None  # Can be string or set after validation
     invalidate_digital_signatures: bool = False
     tagged_pdf_mode: TaggedPdfMode = TaggedPdfMode.default
@@ -229,11 +240,21 @@ class OcrOptions(BaseModel):
     pdf_renderer: str = 'auto'
     ocr_engine: str = 'auto'
     rasterizer: str = 'auto'
+    intermediate_image_format: str = 'png'
+    ocr_image_mode: str = 'color'
     rotate_pages_threshold: float = DEFAULT_ROTATE_PAGES_THRESHOLD
     user_words: os.PathLike | None = None
     user_patterns: os.PathLike | None = None
     fast_web_view: float = 1.0
     continue_on_soft_render_error: bool | None = None
+    ocr_tile_size: int | None = None
+    ocr_batch_size: int = 1
+    raster_cache: Path | None = None
+    raster_cache_size: float = 1024.0
+    ocr_cache: Path | None = None
+    ocr_cache_size: float = 1024.0
+    output_cache: Path | None = None
+    output_cache_size: float = 1024.0
 
     # Tesseract options - also accessible via options.tesseract.<field>
     tesseract_config: list[str] = []
@@ -244,6 +265,9 @@ class OcrOptions(BaseModel):
     tesseract_non_ocr_timeout: float | None = None
     tesseract_downsample_above: int = 32767
     tesseract_downsample_large_images: bool | None = None
+    tesseract_batch_size: int = 1
+    tesseract_fast_tessdata: Path | None = None
+    tesseract_escalate_below: float = 75.0
 
     # Ghostscript options - also accessible via options.ghostscript.<field>
     pdfa_image_compression: str | None = None
@@ -289,6 +313,34 @@ class OcrOptions(BaseModel):
             raise ValueError(f"pdf_renderer must be one of {all_accepted}")
         return v
 
+    @field_validator('intermediate_image_format')
+    @classmethod
+    def validate_intermediate_image_format(cls, v):
+        """Validate intermediate image format is one of the allowed values."""
+        valid_formats = set(INTERMEDIATE_IMAGE_FORMATS)
+        if v not in valid_formats:
+            raise ValueError(
+                f"intermediate_image_format must be one of {valid_formats}"
+            )
+        return v
+
+    @field_validator('ocr_image_mode')
+    @classmethod
+    def validate_ocr_image_mode(cls, v):
+        """Validate OCR image mode is one of the allowed values."""
+        if v not in OCR_IMAGE_MODES:
+            raise ValueError(f"ocr_image_mode must be one of {OCR_IMAGE_MODES}")
+        return v
+
+    @field_validator('deskew_method')
+    @classmethod
+    def validate_deskew_method(cls, v):
+        """Validate deskew method is one of the allowed values."""
+        valid_methods = {'engine', 'projection'}
+        if v not in valid_methods:
+            raise ValueError(f"deskew_method must be one of {valid_methods}")
+        return v
+
     @field_validator('rasterizer')
     @classmethod
     def validate_rasterizer(cls, v):
@@ -455,6 +507,25 @@ class OcrOptions(BaseModel):
             )
         return self
 
+    @model_validator(mode='after')
+    def validate_skip_text_quality_options(self):
+        """Validate options for redoing OCR of pages with poor existing text."""
+        if self.skip_text_wordlist is not None and self.skip_text_quality is None:
+            raise ValueError("--skip-text-wordlist requires --skip-text-quality")
+        if self.skip_text_quality is None:
+            return self
+        if self.mode != ProcessingMode.skip:
+            raise ValueError(
+                "--skip-text-quality requires --skip-text (or --mode skip)"
+            )
+        if self.deskew or self.clean_final or self.remove_background:
+            # Pages below the threshold are reprocessed as in redo mode
+            raise ValueError(
+                "--skip-text-quality is not currently compatible with "
+                "--deskew, --clean-final, and --remove-background"
+            )
+        return self
+
     @model_validator(mode='after')
     def validate_output_type_compatibility(self):
         """Validate output type is compatible with output file."""
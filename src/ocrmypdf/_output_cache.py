@@ -0,0 +1,214 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+"""Cache finished output files, so that resubmitting a file skips processing."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+import zipfile
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import TYPE_CHECKING
+
+from ocrmypdf._cache import DiskCache, cache_key, file_digest
+from ocrmypdf._exec import ghostscript, jbig2enc, pngquant, unpaper
+from ocrmypdf._options import OcrOptions
+from ocrmypdf._pipeline import copy_final
+from ocrmypdf._version import __version__
+from ocrmypdf.exceptions import MissingDependencyError
+
+if TYPE_CHECKING:
+    from ocrmypdf._plugin_manager import OcrmypdfPluginManager
+
+log = logging.getLogger(__name__)
+
+# Options that do not change the output: where files are read and written, how
+# much work is done in parallel, what is logged, and other caches
+_IGNORED_OPTIONS = frozenset(
+    {
+        'input_file',
+        'output_file',
+        'sidecar',
+        'output_folder',
+        'work_folder',
+        'jobs',
+        'use_threads',
+        'progress_bar',
+        'quiet',
+        'verbose',
+        'keep_temporary_files',
+        'no_overwrite',
+        'plugins',
+        'raster_cache',
+        'raster_cache_size',
+        'ocr_cache',
+        'ocr_cache_size',
+        'output_cache',
+        'output_cache_size',
+    }
+)
+
+# Options that name files, or lists of files, whose contents change the output
+_FILE_OPTIONS = (
+    'user_words',
+    'user_patterns',
+    'skip_text_wordlist',
+    'tesseract_config',
+)
+
+_OUTPUT_MEMBER = 'output.pdf'
+_SIDECAR_MEMBER = 'sidecar.txt'
+_INFO_MEMBER = 'info.json'
+
+
+def output_cache(options: OcrOptions) -> DiskCache | None:
+    """Return the output cache requested by the options, if any."""
+    if not getattr(options, 'output_cache', None):
+        return None
+    return DiskCache(
+        options.output_cache,
+        int(options.output_cache_size * 1024 * 1024),
+        name='output',
+    )
+
+
+def _tool_version(version: Callable[[], object]) -> str | None:
+    try:
+        return str(version())
+    except MissingDependencyError:
+        return None
+
+
+def _file_digests(value) -> list[str]:
+    paths = value if isinstance(value, list | tuple) else [value]
+    return [file_digest(path) for path in paths if path and Path(path).is_file()]
+
+
+def output_cache_key(
+    input_file: Path, options: OcrOptions, plugin_manager: OcrmypdfPluginManager
+) -> str:
+    """Identify the output of processing ``input_file`` with ``options``.
+
+    The key covers the contents of the input file, the options that affect
+    the output, the contents of files named by options, the plugins loaded,
+    the versions of OCRmyPDF, the OCR engine and the external programs used,
+    and the settings the OCR engine reports as affecting its results (see
+    :meth:`~ocrmypdf.pluginspec.OcrEngine.cache_parameters`).
+    """
+    settings = {
+        name: value
+        for name, value in json.loads(options.model_dump_json_safe()).items()
+        if name not in _IGNORED_OPTIONS
+    }
+    settings['sidecar'] = options.sidecar is not None
+    files = {
+        name: digests
+        for name in _FILE_OPTIONS
+        if (digests := _file_digests(getattr(options, name, None)))
+    }
+
+    pm = plugin_manager.pluggy_manager
+    plugins = sorted(name for name, _plugin in pm.list_name_plugin())
+    distributions = sorted(
+        (dist.project_name, dist.version) for _plugin, dist in pm.list_plugin_distinfo()
+    )
+
+    engine = plugin_manager.get_ocr_engine(options=options)
+    tools = {
+        'ocr_engine': (
+            str(engine),
+            _tool_version(engine.version),
+            repr(engine.cache_parameters(options)),
+        ),
+        'ghostscript': _tool_version(ghostscript.PROBE.version),
+    }
+    if options.clean:
+        tools['unpaper'] = _tool_version(unpaper.PROBE.version)
+    if options.optimize:
+        tools['pngquant'] = _tool_version(pngquant.PROBE.version)
+        tools['jbig2'] = _tool_version(jbig2enc.version)
+
+    return cache_key(
+        file_digest(input_file),
+        __version__,
+        json.dumps(settings, sort_keys=True),
+        sorted(files.items()),
+        plugins,
+        distributions,
+        sorted(tools.items()),
+    )
+
+
+def restore_output(cache: DiskCache, key: str, options: OcrOptions) -> bool:
+    """Copy a cached output PDF and sidecar to their destinations, if present."""
+    with TemporaryDirectory() as tmpdir:
+        archive = Path(tmpdir) / 'entry.zip'
+        if not cache.get(key, archive):
+            return False
+        try:
+            with zipfile.ZipFile(archive) as zf:
+                members = set(zf.namelist())
+                if options.output_type != 'none' and _OUTPUT_MEMBER not in members:
+                    return False
+                if options.sidecar and _SIDECAR_MEMBER not in members:
+                    return False
+                zf.extractall(tmpdir, members=members - {_INFO_MEMBER})
+        except (zipfile.BadZipFile, OSError) as e:
+            log.warning(f"Could not read from output cache: {e}")
+            return False
+        # Copy only after the whole entry was read, so that a damaged entry
+        # does not leave a partial result behind
+        if options.output_type != 'none':
+            copy_final(Path(tmpdir) / _OUTPUT_MEMBER, options.output_file)
+        if options.sidecar:
+            copy_final(Path(tmpdir) / _SIDECAR_MEMBER, options.sidecar)
+    return True
+
+
+def _is_readable_path(file) -> bool:
+    return (
+        file != '-'
+        and not hasattr(file, 'writable')
+        and isinstance(file, str | bytes | os.PathLike)
+        and Path(os.fsdecode(file)).is_file()
+    )
+
+
+def store_output(
+    cache: DiskCache, key: str, options: OcrOptions, input_name: str
+) -> None:
+    """Keep the output PDF and sidecar written by a successful run.
+
+    Outputs written to standard output or to a stream cannot be read back, so
+    they are not cached.
+    """
+    outputs = {}
+    if options.output_type != 'none':
+        outputs[_OUTPUT_MEMBER] = options.output_file
+    if options.sidecar:
+        outputs[_SIDECAR_MEMBER] = options.sidecar
+    if not outputs or not all(_is_readable_path(f) for f in outputs.values()):
+        log.debug("Output is not a file, so it is not cached")
+        return
+    info = {'input': input_name, 'created': time.time(), 'version': __version__}
+    with TemporaryDirectory() as tmpdir:
+        archive = Path(tmpdir) / 'entry.zip'
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr(_INFO_MEMBER, json.dumps(info))
+            for member, output_file in outputs.items():
+                zf.write(os.fsdecode(output_file), member)
+        cache.put(key, archive)
+
+
+def describe_entry(path: Path) -> str | None:
+    """Return the input file name recorded in an output cache entry, if any."""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            return json.loads(zf.read(_INFO_MEMBER))['input']
+    except (zipfile.BadZipFile, KeyError, OSError, ValueError):
+        return None
@@ -10,8 +10,13 @@ import logging
 import os
 import re
 import sys
+import threading
 from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError
+from importlib.metadata import version as package_version
 from io import BytesIO
 from pathlib import Path
 from shutil import copyfileobj
@@ -22,28 +27,49 @@ if TYPE_CHECKING:
 
 import img2pdf
 import pikepdf
-from PIL import Image, ImageColor, ImageDraw
+from PIL import Image, ImageDraw
 
+from ocrmypdf._cache import DiskCache, cache_key, page_fingerprint
 from ocrmypdf._concurrent import Executor
-from ocrmypdf._exec import unpaper
+from ocrmypdf._exec import ghostscript, unpaper
 from ocrmypdf._jobcontext import PageContext, PdfContext
 from ocrmypdf._metadata import repair_docinfo_nuls
+from ocrmypdf._ocr_batch import OcrBatcher
+from ocrmypdf._ocr_cache import SKIPPED_PAGE_TEXT
 from ocrmypdf._options import OcrOptions, PathOrIO, ProcessingMode, TaggedPdfMode
 from ocrmypdf._pageboxes import log_box_repairs, repair_page_boxes
 from ocrmypdf._stdoutprotect import get_protected_stdout_fd
+from ocrmypdf._version import __version__
 from ocrmypdf.exceptions import (
     ColorConversionNeededError,
     DigitalSignatureError,
     DpiError,
     EncryptedPdfError,
     InputFileError,
+    MissingDependencyError,
     NonEmbeddedFontsError,
     PriorOcrFoundError,
     SubprocessOutputError,
     TaggedPDFError,
     UnsupportedImageFormatError,
 )
-from ocrmypdf.helpers import IMG2PDF_KWARGS, Resolution, safe_symlink
+from ocrmypdf.helpers import (
+    IMG2PDF_KWARGS,
+    Resolution,
+    available_cpu_count,
+    safe_symlink,
+)
+from ocrmypdf.imageops import (
+    downsample_image,
+    estimate_skew,
+    ink_coverage,
+    intermediate_image_format,
+    ocr_image_mode,
+    remove_background,
+    rotate_page_image,
+    text_line_height,
+)
+from ocrmypdf.languages import languages_for_script
 from ocrmypdf.pdfa import (
     file_claims_pdfa,
     find_nonembedded_cid_fonts,
@@ -52,6 +78,7 @@ from ocrmypdf.pdfa import (
 )
 from ocrmypdf.pdfinfo import Colorspace, Encoding, FloatRect, Ink, PageInfo, PdfInfo
 from ocrmypdf.pluginspec import GhostscriptRasterDevice, OrientationConfidence
+from ocrmypdf.quality import OcrQualityDictionary, measure_text_quality
 
 try:
     from pi_heif import register_heif_opener
@@ -66,6 +93,32 @@ log = logging.getLogger(__name__)
 
 VECTOR_PAGE_DPI = 400
 
+# Tesseract's "Script confidence" below which the detected script is ignored
+SCRIPT_CONFIDENCE_THRESHOLD = 2.0
+
+# For --adaptive-ocr-resolution: OCR accuracy no longer improves once lowercase
+# letters are about 30 pixels tall, roughly half the height of a line of text
+OCR_TARGET_LINE_HEIGHT = 60
+# ...but never OCR below this resolution, for the sake of any smaller print
+MIN_ADAPTIVE_OCR_DPI = 150
+# Downsampling by less than this is not worth the time it takes
+_MIN_ADAPTIVE_OCR_REDUCTION = 0.8
+
+_ROTATION_TRANSPOSE = {
+    90: Image.Transpose.ROTATE_90,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_270,
+}
+
+# Shared by the worker threads of this process, so they can batch unpaper runs
+_UNPAPER_BATCHER = unpaper.CleanBatcher()
+_OCR_BATCHER = OcrBatcher()
+
+# Limits on how many tiles the worker threads of this process OCR at once,
+# by number of tiles allowed
+_TILE_SLOTS: dict[int, threading.Semaphore] = {}
+_TILE_SLOTS_LOCK = threading.Lock()
+
 
 register_heif_opener()
 
@@ -334,6 +387,31 @@ def get_canvas_square_dpi(
     return Resolution(units, units)
 
 
+@lru_cache(maxsize=4)
+def _load_quality_dictionary(wordlist: Path) -> OcrQualityDictionary:
+    with wordlist.open(encoding='utf-8') as f:
+        return OcrQualityDictionary(wordlist=(line.strip() for line in f))
+
+
+def existing_text_quality(pageinfo: PageInfo, options: OcrOptions) -> float:
+    """Score the existing OCR text of a page for ``--skip-text-quality``.
+
+    Only invisible text is scored, since visible text is not replaced when OCR
+    is redone. Pages without invisible text score 1.0, and pages with text that
+    cannot be mapped to Unicode score 0.0.
+    """
+    if next(iter(pageinfo.get_textareas(visible=False)), None) is None:
+        return 1.0
+    if pageinfo.has_corrupt_text:
+        return 0.0
+    dictionary = (
+        _load_quality_dictionary(Path(options.skip_text_wordlist))
+        if options.skip_text_wordlist is not None
+        else None
+    )
+    return measure_text_quality(pageinfo.get_text(visible=False), dictionary)
+
+
 def is_ocr_required(page_context: PageContext) -> bool:
     """Check if the page needs to be OCR'd."""
     pageinfo = page_context.pageinfo
@@ -368,8 +446,23 @@ def is_ocr_required(page_context: PageContext) -> bool:
                 log.info("redoing OCR")
             ocr_required = True
         elif options.mode == ProcessingMode.skip:
-            log.info("skipping all processing on this page")
-            ocr_required = False
+            if options.skip_text_quality is None:
+                log.info("skipping all processing on this page")
+                ocr_required = False
+            else:
+                quality = existing_text_quality(pageinfo, options)
+                if quality >= options.skip_text_quality:
+                    log.info(
+                        f"existing text quality {quality:.2f} - "
+                        "skipping all processing on this page"
+                    )
+                    ocr_required = False
+                else:
+                    log.info(
+                        f"existing text quality {quality:.2f} is below "
+                        f"--skip-text-quality {options.skip_text_quality} - "
+                        "redoing OCR"
+                    )
     elif not pageinfo.images and not options.lossless_reconstruction:
         # We found a page with no images and no text. That means it may
         # have vector art that the user wants to OCR. If we determined
@@ -415,29 +508,50 @@ def is_ocr_required(page_context: PageContext) -> bool:
     return ocr_required
 
 
-def rasterize_preview(input_file: Path, page_context: PageContext) -> Path:
-    """Generate a lower quality preview image."""
+def create_preview_image(image: Path, page_context: PageContext) -> Path:
+    """Create a lower quality preview image from the page raster.
+
+    The preview is used for orientation and skew detection only, so it is
+    derived from the full resolution raster in memory rather than rendered
+    separately. It is converted to grayscale and downsampled to at most 300 DPI.
+    """
     output_file = page_context.get_path('rasterize_preview.jpg')
-    canvas_dpi = Resolution(300.0, 300.0).take_min(
-        [get_canvas_square_dpi(page_context)]
-    )
-    page_dpi = Resolution(300.0, 300.0).take_min([get_page_square_dpi(page_context)])
-    page_context.plugin_manager.rasterize_pdf_page(
-        input_file=input_file,
-        output_file=output_file,
-        raster_device=GhostscriptRasterDevice.JPEGGRAY,
-        raster_dpi=canvas_dpi,
-        pageno=page_context.pageinfo.pageno + 1,
-        page_dpi=page_dpi,
-        rotation=0,
-        filter_vector=False,
-        stop_on_soft_error=not page_context.options.continue_on_soft_render_error,
-        options=page_context.options,
-        use_cropbox=False,
-    )
+    im: Image.Image
+    with Image.open(image) as im:
+        dpi = Resolution(*im.info['dpi'])
+        preview_dpi = Resolution(300.0, 300.0).take_min([dpi])
+        size = (
+            max(1, round(im.width * preview_dpi.x / dpi.x)),
+            max(1, round(im.height * preview_dpi.y / dpi.y)),
+        )
+        # Convert to grayscale before resizing so that 1-bit and palette
+        # images are downsampled with interpolation
+        preview = downsample_image(im, size, mode='L')
+        preview.save(output_file, format='JPEG', dpi=preview.info['dpi'])
     return output_file
 
 
+def is_blank_page(preview: Path, page_context: PageContext) -> bool:
+    """Check if a page is blank, in which case OCR can be skipped.
+
+    Args:
+        preview: The preview image created by :func:`create_preview_image`.
+        page_context: The page context object.
+    """
+    options = page_context.options
+    if not options.skip_blank:
+        return False
+    with Image.open(preview) as im:
+        coverage = ink_coverage(im, ink_level=options.blank_ink_level)
+    if coverage * 100 >= options.skip_blank:
+        return False
+    log.info(
+        f"page is blank ({coverage:.3%} ink < {options.skip_blank}% "
+        "--skip-blank) - skipping OCR"
+    )
+    return True
+
+
 def describe_rotation(
     page_context: PageContext, orient_conf: OrientationConfidence, correction: int
 ) -> str:
@@ -464,10 +578,12 @@ def describe_rotation(
     return f"{facing}, confidence {orient_conf.confidence:.2f} - {action}"
 
 
-def get_orientation_correction(preview: Path, page_context: PageContext) -> int:
-    """Work out orientation correction for each page.
+def get_page_geometry(
+    preview: Path, page_context: PageContext
+) -> tuple[int, float | None]:
+    """Work out orientation correction and skew angle for each page.
 
-    We ask Ghostscript to draw a preview page, which will rasterize with the
+    We derive a preview image from the page raster, which is rendered with the
     current /Rotate applied, and then ask OCR which way the page is
     oriented. If the value of /Rotate is correct (e.g., a user already
     manually fixed rotation), then OCR will say the page is pointing
@@ -475,15 +591,71 @@ def get_orientation_correction(preview: Path, page_context: PageContext) -> int:
     OCR represents the clockwise rotation, or the counterclockwise
     correction to rotation.
 
-    When we draw the real page for OCR, we rotate it by the CCW correction,
-    which points it (hopefully) upright. _graft.py takes care of the orienting
+    The page raster is then rotated by the CCW correction, which points it
+    (hopefully) upright. _graft.py takes care of the orienting
     the image and text layers.
+
+    If deskewing, engines that analyze the page once for both orientation and
+    skew are asked for the skew angle in the same call. Other engines measure
+    the skew after the orientation is known. Turning the page upside down does
+    not change its skew angle, but the engine cannot measure the skew of
+    sideways text lines, so if the page must be turned by 90 or 270 degrees,
+    the engine measures the skew on an upright copy of the preview.
+
+    Returns:
+        The orientation correction (0 if ``--rotate-pages`` is not in effect),
+        and the deskew angle in degrees (None if ``--deskew`` is not in effect).
     """
-    ocr_engine = page_context.plugin_manager.get_ocr_engine(
-        options=page_context.options
-    )
-    orient_conf = ocr_engine.get_orientation(preview, page_context.options)
+    options = page_context.options
+    want_engine_deskew = options.deskew and options.deskew_method == 'engine'
+    correction = 0
+    deskew_angle = None
+    if options.rotate_pages or want_engine_deskew:
+        ocr_engine = page_context.plugin_manager.get_ocr_engine(options=options)
+        together = ocr_engine.supports_page_geometry() or not options.rotate_pages
+        geometry = ocr_engine.get_page_geometry(
+            preview,
+            options,
+            orientation=options.rotate_pages,
+            deskew=want_engine_deskew and together,
+        )
+        if options.rotate_pages:
+            correction = orientation_correction(geometry.orientation, page_context)
+        if want_engine_deskew:
+            if correction % 180 == 90:
+                deskew_angle = ocr_engine.get_deskew(
+                    _upright_preview(preview, correction, page_context), options
+                )
+            elif together:
+                deskew_angle = geometry.deskew
+            else:
+                deskew_angle = ocr_engine.get_deskew(preview, options)
+    if options.deskew and options.deskew_method == 'projection':
+        with Image.open(preview) as im:
+            # Text lines must be horizontal for the projection profile
+            deskew_angle = estimate_skew(
+                im.transpose(_ROTATION_TRANSPOSE[correction]) if correction else im
+            )
+    return correction, deskew_angle
+
+
+def _upright_preview(preview: Path, correction: int, page_context: PageContext) -> Path:
+    """Save a copy of the preview image turned upright by ``correction``."""
+    output_file = page_context.get_path('rasterize_preview_upright.jpg')
+    with Image.open(preview) as im:
+        dpi = Resolution(*im.info['dpi'])
+        if correction % 180 == 90:
+            dpi = dpi.flip_axis()
+        im.transpose(_ROTATION_TRANSPOSE[correction]).save(
+            output_file, format='JPEG', dpi=(dpi.x, dpi.y)
+        )
+    return output_file
+
 
+def orientation_correction(
+    orient_conf: OrientationConfidence, page_context: PageContext
+) -> int:
+    """Return the orientation correction to apply, given the OCR's finding."""
     correction = orient_conf.angle % 360
     log.info(describe_rotation(page_context, orient_conf, correction))
     if (
@@ -495,6 +667,37 @@ def get_orientation_correction(preview: Path, page_context: PageContext) -> int:
     return 0
 
 
+def select_page_languages(preview: Path, page_context: PageContext) -> None:
+    """OCR the page with only the languages written in the page's script.
+
+    With ``--detect-languages`` and more than one language, the OCR engine is
+    asked which script the page is written in, from the preview image that
+    orientation detection also uses, so the engine may answer both at once.
+    If it is confident, the page options are narrowed to the requested
+    languages that use that script, so the engine loads fewer models.
+    Languages of unknown script are kept. Otherwise, and if no requested
+    language uses the script, all are kept.
+    """
+    options = page_context.options
+    if not options.detect_languages or len(options.languages) < 2:
+        return
+    ocr_engine = page_context.plugin_manager.get_ocr_engine(options=options)
+    detected = ocr_engine.get_script(preview, options)
+    if detected is None or detected.confidence < SCRIPT_CONFIDENCE_THRESHOLD:
+        log.debug("Script not detected; using all languages")
+        return
+    languages = languages_for_script(options.languages, detected.script)
+    if not languages:
+        log.info(
+            f"Detected {detected.script} script, which none of the languages "
+            "use; using all languages"
+        )
+        return
+    log.info(f"Detected {detected.script} script; using {'+'.join(languages)}")
+    if languages != options.languages:
+        page_context.options = options.model_copy(update={'languages': languages})
+
+
 def calculate_image_dpi(page_context: PageContext) -> Resolution:
     """Calculate the DPI for the page image."""
     pageinfo = page_context.pageinfo
@@ -570,6 +773,168 @@ def _select_raster_device(pageinfo: PageInfo) -> GhostscriptRasterDevice:
     return colorspaces[device_idx]
 
 
+def _intermediate_path(page_context: PageContext, name: str) -> Path:
+    """Return the path for an intermediate page image, in the configured format."""
+    image_format = intermediate_image_format(
+        page_context.options.intermediate_image_format
+    )
+    return page_context.get_path(name + image_format.suffix)
+
+
+def _save_intermediate(
+    im: Image.Image, output_file: Path, page_context: PageContext, **kwargs
+) -> None:
+    """Save an intermediate page image, which is never shown to the user."""
+    image_format = intermediate_image_format(
+        page_context.options.intermediate_image_format
+    )
+    im.save(output_file, format=image_format.format, **image_format.params, **kwargs)
+
+
+def _raster_cache(options: OcrOptions) -> DiskCache | None:
+    if not options.raster_cache:
+        return None
+    return DiskCache(
+        options.raster_cache,
+        int(options.raster_cache_size * 1024 * 1024),
+        name='raster',
+    )
+
+
+@lru_cache(maxsize=1)
+def _rasterizer_versions() -> tuple[str | None, str | None]:
+    """Return the versions of Ghostscript and pypdfium2, if installed.
+
+    Either may rasterize a page, so both are part of a raster cache key, and a
+    new version of either does not reuse rasters rendered by the old one.
+    """
+    try:
+        gs_version = str(ghostscript.version())
+    except MissingDependencyError:
+        gs_version = None
+    try:
+        pdfium_version = package_version('pypdfium2')
+    except PackageNotFoundError:
+        pdfium_version = None
+    return gs_version, pdfium_version
+
+
+def _is_single_full_page_image(pageinfo: PageInfo) -> bool:
+    """Check if the page is drawn by exactly one upright image covering the page.
+
+    Such pages (typical scanner output) look exactly like their image, so the
+    image can be decoded directly instead of rendering the page.
+    """
+    if pageinfo.has_text or pageinfo.has_vector or pageinfo.rotation % 360 != 0:
+        return False
+    if len(pageinfo.images) != 1:
+        return False
+    image = pageinfo.images[0]
+    if image.type_ != 'image' or not image.renderable:
+        return False
+
+    a, b, c, d, e, f = (float(v) for v in image.shorthand)
+    userunit = float(pageinfo.userunit)
+    x0, y0, x1, y1 = (float(v) * userunit for v in pageinfo.mediabox)
+    tolerance = 0.5  # points
+    return (
+        abs(b) < 1e-6
+        and abs(c) < 1e-6
+        and abs(a - (x1 - x0)) < tolerance
+        and abs(d - (y1 - y0)) < tolerance
+        and abs(e - x0) < tolerance
+        and abs(f - y0) < tolerance
+    )
+
+
+def extract_page_image(
+    input_file: Path,
+    page_context: PageContext,
+    correction: int = 0,
+    output_tag: str = '',
+) -> Path | None:
+    """Decode the page image directly, if it is identical to the rendered page.
+
+    For pages that consist of a single unmasked image exactly covering the
+    page, decoding the image is bit-exact and much faster than rasterizing.
+
+    Args:
+        input_file: The input PDF file path.
+        page_context: The page context object.
+        correction: The orientation correction angle. Defaults to 0.
+        output_tag: The output tag. Defaults to ''.
+
+    Returns:
+        The output PNG file path, or ``None`` if the page must be rasterized.
+    """
+    pageinfo = page_context.pageinfo
+    if not _is_single_full_page_image(pageinfo):
+        return None
+    image_info = pageinfo.images[0]
+    canvas_dpi, page_dpi = calculate_raster_dpi(page_context)
+    x0, y0, x1, y1 = pageinfo.mediabox
+    expected_size = (
+        round((x1 - x0) / 72.0 * canvas_dpi.x),
+        round((y1 - y0) / 72.0 * canvas_dpi.y),
+    )
+    if (
+        abs(image_info.width - expected_size[0]) > 1
+        or abs(image_info.height - expected_size[1]) > 1
+    ):
+        # The rasterizer would resample the image; let it do so.
+        return None
+
+    with pikepdf.open(input_file) as pdf:
+        page = pdf.pages[pageinfo.pageno]
+        xobjects = page.obj.get(pikepdf.Name.Resources, {}).get(
+            pikepdf.Name.XObject, {}
+        )
+        if any(
+            xobj.get(pikepdf.Name.Subtype) == pikepdf.Name.Form
+            for xobj in xobjects.values()
+        ):
+            return None
+        stream = xobjects.get(image_info.name)
+        if stream is None or stream.get(pikepdf.Name.Subtype) != pikepdf.Name.Image:
+            return None
+        if any(
+            key in stream
+            for key in (pikepdf.Name.SMask, pikepdf.Name.Mask, pikepdf.Name.Decode)
+        ):
+            return None
+        try:
+            pim = pikepdf.PdfImage(stream)
+            if pim.image_mask or (pim.width, pim.height) != (
+                image_info.width,
+                image_info.height,
+            ):
+                return None
+            im = pim.as_pil_image()
+        except (
+            pikepdf.PdfError,
+            pikepdf.DependencyError,
+            pikepdf.UnsupportedImageTypeError,
+            NotImplementedError,
+            OSError,
+            ValueError,
+        ) as e:
+            log.debug(f"Could not extract page image directly: {e!r}")
+            return None
+
+    with im:
+        if im.mode not in ('1', 'L', 'P', 'RGB'):
+            return None
+        correction %= 360
+        if correction:
+            im = im.transpose(_ROTATION_TRANSPOSE[correction])
+            if correction % 180 == 90:
+                page_dpi = page_dpi.flip_axis()
+        output_file = _intermediate_path(page_context, f'rasterize{output_tag}')
+        _save_intermediate(im, output_file, page_context, dpi=page_dpi)
+    log.debug(f"Extracted page image {image_info.name} directly, rotation {correction}")
+    return output_file
+
+
 def rasterize(
     input_file: Path,
     page_context: PageContext,
@@ -594,7 +959,15 @@ def rasterize(
     if remove_vectors is None:
         remove_vectors = page_context.options.remove_vectors
 
-    output_file = page_context.get_path(f'rasterize{output_tag}.png')
+    # An explicitly chosen rasterizer always renders the page
+    if page_context.options.rasterizer == 'auto':
+        extracted = extract_page_image(
+            input_file, page_context, correction=correction, output_tag=output_tag
+        )
+        if extracted is not None:
+            return extracted
+
+    output_file = _intermediate_path(page_context, f'rasterize{output_tag}')
     pageinfo = page_context.pageinfo
 
     device = _select_raster_device(pageinfo)
@@ -605,6 +978,26 @@ def rasterize(
 
     canvas_dpi, page_dpi = calculate_raster_dpi(page_context)
 
+    cache = _raster_cache(page_context.options)
+    if cache is not None:
+        with pikepdf.open(input_file) as pdf:
+            fingerprint = page_fingerprint(pdf.pages[pageinfo.pageno])
+        key = cache_key(
+            fingerprint,
+            __version__,
+            page_context.options.rasterizer,
+            _rasterizer_versions(),
+            page_context.options.intermediate_image_format,
+            page_context.options.plugins,
+            device,
+            canvas_dpi,
+            page_dpi,
+            correction,
+            remove_vectors,
+        )
+        if cache.get(key, output_file):
+            return output_file
+
     page_context.plugin_manager.rasterize_pdf_page(
         input_file=input_file,
         output_file=output_file,
@@ -618,61 +1011,143 @@ def rasterize(
         options=page_context.options,
         use_cropbox=False,
     )
+    if cache is not None:
+        cache.put(key, output_file)
+    return output_file
+
+
+def rotate_raster(
+    image: Path, page_context: PageContext, correction: int, deskew_angle: float = 0.0
+) -> Path:
+    """Rotate a page raster by a cardinal angle, and optionally deskew it.
+
+    This produces the same image as rasterizing the page with ``rotation=correction``
+    but reuses the existing raster instead of rendering the page again. The
+    cardinal rotation alone does not resample the image. If a deskew angle is
+    given, both rotations are done in one resampling pass, instead of
+    transposing here and resampling again in :func:`preprocess_deskew`.
+
+    Args:
+        image: The page image, as produced by :func:`rasterize`.
+        page_context: The page context object.
+        correction: Cardinal angle, clockwise, to rotate the page.
+        deskew_angle: Counterclockwise angle in degrees to deskew the page by.
+
+    Returns:
+        Path: The rotated PNG file path, or ``image`` if no rotation is needed.
+    """
+    correction %= 360
+    if correction == 0 and not deskew_angle:
+        return image
+    output_file = _intermediate_path(page_context, 'rasterize_rotated')
+    im: Image.Image
+    with Image.open(image) as im:
+        dpi = Resolution(*im.info['dpi'])
+        # correction is a clockwise angle and Image.ROTATE_* is counterclockwise,
+        # so this cancels out the rotation (same as the rasterizers do)
+        rotated = rotate_page_image(im, correction, deskew_angle)
+        if correction % 180 == 90:
+            dpi = dpi.flip_axis()
+        _save_intermediate(rotated, output_file, page_context, dpi=dpi)
     return output_file
 
 
 def preprocess_remove_background(input_file: Path, page_context: PageContext) -> Path:
-    """Remove the background from the input image (temporarily disabled)."""
-    if any(image.bpc > 1 for image in page_context.pageinfo.images):
-        raise NotImplementedError("--remove-background is temporarily not implemented")
-        # output_file = page_context.get_path('pp_rm_bg.png')
-        # leptonica.remove_background(input_file, output_file)
-        # return output_file
-    log.info("background removal skipped on mono page")
-    return input_file
+    """Remove the background from the input image, making it white.
+
+    Pages whose images are all monochrome have no background to remove and
+    are passed through unchanged.
+    """
+    if not any(image.bpc > 1 for image in page_context.pageinfo.images):
+        log.info("background removal skipped on mono page")
+        return input_file
 
+    output_file = _intermediate_path(page_context, 'pp_rm_bg')
+    dpi = get_page_square_dpi(page_context, calculate_image_dpi(page_context))
+    with Image.open(input_file) as im:
+        cleaned = remove_background(im, dpi=float(im.info.get('dpi', dpi)[0]))
+        _save_intermediate(cleaned, output_file, page_context, dpi=dpi)
+    return output_file
 
-def preprocess_deskew(input_file: Path, page_context: PageContext) -> Path:
-    """Deskews the input image using the OCR engine and saves the output to a file.
+
+def preprocess_deskew(
+    input_file: Path, page_context: PageContext, deskew_angle: float | None = None
+) -> Path:
+    """Deskews the input image and saves the output to a file.
+
+    Unless already known, the skew angle is measured by the OCR engine, or
+    estimated from the image itself if ``--deskew-method projection`` is in
+    effect.
 
     Args:
         input_file: The input image file to deskew.
         page_context: The context of the page being processed.
+        deskew_angle: The skew angle in degrees, if already known.
 
     Returns:
         Path: The path to the deskewed image file.
     """
-    output_file = page_context.get_path('pp_deskew.png')
+    output_file = _intermediate_path(page_context, 'pp_deskew')
     dpi = get_page_square_dpi(page_context, calculate_image_dpi(page_context))
 
-    ocr_engine = page_context.plugin_manager.get_ocr_engine(
-        options=page_context.options
-    )
-    deskew_angle_degrees = ocr_engine.get_deskew(input_file, page_context.options)
-
     with Image.open(input_file) as im:
-        # According to Pillow docs, .rotate() will automatically use Image.NEAREST
-        # resampling if image is mode '1' or 'P'
-        deskewed = im.rotate(
-            deskew_angle_degrees,
-            resample=Image.Resampling.BICUBIC,
-            fillcolor=ImageColor.getcolor('white', mode=im.mode),  # type: ignore
-        )
-        deskewed.save(output_file, dpi=dpi)
+        if deskew_angle is not None:
+            deskew_angle_degrees = deskew_angle
+        elif page_context.options.deskew_method == 'projection':
+            deskew_angle_degrees = estimate_skew(im)
+        else:
+            ocr_engine = page_context.plugin_manager.get_ocr_engine(
+                options=page_context.options
+            )
+            deskew_angle_degrees = ocr_engine.get_deskew(
+                input_file, page_context.options
+            )
+
+        deskewed = rotate_page_image(im, 0, deskew_angle_degrees)
+        _save_intermediate(deskewed, output_file, page_context, dpi=dpi)
 
     return output_file
 
 
 def preprocess_clean(input_file: Path, page_context: PageContext) -> Path:
     """Clean the input image using unpaper."""
-    output_file = page_context.get_path('pp_clean.png')
+    output_file = _intermediate_path(page_context, 'pp_clean')
     dpi = get_page_square_dpi(page_context, calculate_image_dpi(page_context))
-    return unpaper.clean(
+    options = page_context.options
+    image_format = intermediate_image_format(options.intermediate_image_format)
+    return _UNPAPER_BATCHER.clean(
         input_file,
         output_file,
         dpi=dpi.to_scalar(),
-        unpaper_args=page_context.options.unpaper_args,
+        unpaper_args=options.unpaper_args,
+        save_params=image_format.params,
+        # Only worker threads of one process can share a batch
+        batch_size=options.unpaper_batch_size if options.use_threads else 1,
+    )
+
+
+def adapt_ocr_resolution(im: Image.Image) -> Image.Image:
+    """Downsample an OCR image whose text is larger than OCR needs.
+
+    The text line height is measured on the image, and the image is reduced
+    so that lines are about :data:`OCR_TARGET_LINE_HEIGHT` pixels tall.
+    Images with small text, or too little text to measure, are returned as is.
+    """
+    dpi = Resolution(*im.info['dpi'])
+    line_height = text_line_height(im, dpi.y)
+    if line_height is None:
+        return im
+    scale = max(
+        OCR_TARGET_LINE_HEIGHT / line_height, MIN_ADAPTIVE_OCR_DPI / min(dpi.x, dpi.y)
+    )
+    if scale > _MIN_ADAPTIVE_OCR_REDUCTION:
+        return im
+    log.debug(
+        f"Text lines are {line_height:.0f} pixels tall; "
+        f"OCRing at {dpi.y * scale:.0f} DPI"
     )
+    size = (max(1, round(im.width * scale)), max(1, round(im.height * scale)))
+    return downsample_image(im, size, mode='L' if im.mode in ('1', 'P') else None)
 
 
 def create_ocr_image(image: Path, page_context: PageContext) -> Path:
@@ -681,7 +1156,7 @@ def create_ocr_image(image: Path, page_context: PageContext) -> Path:
     Might not be the same as the display image depending on preprocessing.
     This image will never be shown to the user.
     """
-    output_file = page_context.get_path('ocr.png')
+    output_file = _intermediate_path(page_context, 'ocr')
     options = page_context.options
     im: Image.Image
     with Image.open(image) as im:
@@ -691,7 +1166,10 @@ def create_ocr_image(image: Path, page_context: PageContext) -> Path:
             # Do not mask text areas when forcing OCR, because we need to OCR
             # all text areas
             mask = None  # Exclude both visible and invisible text from OCR
-            if options.mode == ProcessingMode.redo:
+            if options.mode == ProcessingMode.redo or (
+                # Pages with text are only OCRed in skip mode to redo poor OCR
+                options.mode == ProcessingMode.skip and page_context.pageinfo.has_text
+            ):
                 mask = True  # Mask visible text, but not invisible text
 
             draw = ImageDraw.ImageDraw(im)
@@ -713,6 +1191,10 @@ def create_ocr_image(image: Path, page_context: PageContext) -> Path:
                 draw.rectangle(pixcoords, fill='white')
                 # draw.rectangle(pixcoords, outline='pink')
 
+        if options.adaptive_ocr_resolution:
+            im = adapt_ocr_resolution(im)
+        im = ocr_image_mode(im, options.ocr_image_mode, dpi=im.info['dpi'][1])
+
         filter_im = page_context.plugin_manager.filter_ocr_image(
             page=page_context, image=im
         )
@@ -721,10 +1203,16 @@ def create_ocr_image(image: Path, page_context: PageContext) -> Path:
 
         # Pillow requires integer DPI
         dpi = tuple(round(coord) for coord in im.info['dpi'])
-        im.save(output_file, dpi=dpi)
+        _save_intermediate(im, output_file, page_context, dpi=dpi)
     return output_file
 
 
+def _note_skipped_page(text: str, page_context: PageContext) -> None:
+    """Note if the OCR engine gave up on the page for taking too long."""
+    if text == SKIPPED_PAGE_TEXT:
+        page_context.ocr_timed_out = True
+
+
 def ocr_engine_hocr(input_file: Path, page_context: PageContext) -> tuple[Path, Path]:
     """Run the OCR engine and generate hOCR output."""
     hocr_out = page_context.get_path('ocr_hocr.hocr')
@@ -738,6 +1226,7 @@ def ocr_engine_hocr(input_file: Path, page_context: PageContext) -> tuple[Path,
         output_text=hocr_text_out,
         options=options,
     )
+    _note_skipped_page(hocr_text_out.read_text(encoding='utf-8'), page_context)
     return hocr_out, hocr_text_out
 
 
@@ -760,18 +1249,133 @@ def ocr_engine_direct(
     options = page_context.options
 
     ocr_engine = page_context.plugin_manager.get_ocr_engine(options=options)
-    ocr_tree, text_content = ocr_engine.generate_ocr(
-        input_file=input_file,
-        options=options,
-        page_number=page_context.pageno,
+    batch_size = 1
+    if options.use_threads and ocr_engine.supports_generate_ocr_batch():
+        batch_size = options.ocr_batch_size
+    ocr_tree, text_content = _OCR_BATCHER.generate_ocr(
+        ocr_engine,
+        input_file,
+        options,
+        page_context.pageno,
+        batch_size=batch_size,
     )
 
+    _note_skipped_page(text_content, page_context)
     # Write text sidecar file
     text_out.write_text(text_content, encoding='utf-8')
 
     return ocr_tree, text_out
 
 
+def should_tile_ocr_image(image: Path, page_context: PageContext) -> bool:
+    """Check if the OCR image is large enough to be OCRed in tiles."""
+    tile_size = page_context.options.ocr_tile_size
+    if not tile_size:
+        return False
+    with Image.open(image) as im:
+        return im.width > tile_size or im.height > tile_size
+
+
+def _ocr_tile(tile_image: Path, page_context: PageContext) -> OcrElement:
+    """Run the OCR engine on one tile and return its OcrElement tree."""
+    options = page_context.options
+    ocr_engine = page_context.plugin_manager.get_ocr_engine(options=options)
+    if ocr_engine.supports_generate_ocr():
+        ocr_tree, text = ocr_engine.generate_ocr(
+            input_file=tile_image,
+            options=options,
+            page_number=page_context.pageno,
+        )
+        _note_skipped_page(text, page_context)
+        return ocr_tree
+
+    from ocrmypdf.hocrtransform.hocr_parser import HocrParser
+
+    hocr_out = tile_image.with_suffix('.hocr')
+    text_out = tile_image.with_suffix('.txt')
+    ocr_engine.generate_hocr(
+        input_file=tile_image,
+        output_hocr=hocr_out,
+        output_text=text_out,
+        options=options,
+    )
+    _note_skipped_page(text_out.read_text(encoding='utf-8'), page_context)
+    return HocrParser(hocr_out).parse()
+
+
+def _tile_slots(page_context: PageContext) -> threading.Semaphore:
+    """Return the semaphore that limits how many tiles this process OCRs at once.
+
+    Worker threads share ``--jobs`` slots, so that several large pages at once
+    do not start more OCR engines than there are jobs. Each worker process
+    gets its share of the jobs not taken by the other workers.
+    """
+    options = page_context.options
+    slots = options.jobs or available_cpu_count()
+    if not options.use_threads:
+        slots = max(1, slots // min(page_context.page_count, slots))
+    with _TILE_SLOTS_LOCK:
+        return _TILE_SLOTS.setdefault(slots, threading.Semaphore(slots))
+
+
+def ocr_engine_tiled(
+    input_file: Path, page_context: PageContext
+) -> tuple[OcrElement, Path]:
+    """Run the OCR engine on overlapping tiles of the image and merge the results.
+
+    Used for very large page images, which would otherwise have to be
+    downsampled or skipped. Tiles are OCRed concurrently, within the limit of
+    ``--jobs`` shared with other pages, and the OCR engine only ever sees an
+    image of at most ``--ocr-tile-size`` pixels per side.
+
+    Args:
+        input_file: The image file to OCR.
+        page_context: The page context with options and path utilities.
+
+    Returns:
+        A tuple of (OcrElement tree, path to text sidecar file).
+    """
+    from ocrmypdf._tiles import merge_tile_trees, plan_tiles, tree_text
+
+    options = page_context.options
+    tile_size = options.ocr_tile_size
+    assert tile_size
+    text_out = page_context.get_path('ocr_tiled.txt')
+
+    im: Image.Image
+    with Image.open(input_file) as im:
+        size = im.size
+        dpi = im.info.get('dpi', (None,))[0]
+        tiles = plan_tiles(size, tile_size, overlap=tile_size // 8)
+        tile_images = []
+        for n, tile in enumerate(tiles):
+            tile_image = _intermediate_path(page_context, f'ocr_tile_{n:03d}')
+            _save_intermediate(
+                im.crop(tile.box), tile_image, page_context, dpi=im.info.get('dpi')
+            )
+            tile_images.append(tile_image)
+    log.debug(f"OCR image {size[0]}×{size[1]} split into {len(tiles)} tiles")
+
+    slots = _tile_slots(page_context)
+
+    def ocr_tile(tile_image: Path) -> OcrElement:
+        with slots:
+            return _ocr_tile(tile_image, page_context)
+
+    jobs = min(options.jobs or available_cpu_count(), len(tiles))
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        tile_trees = list(pool.map(ocr_tile, tile_images))
+
+    ocr_tree = merge_tile_trees(
+        list(zip(tiles, tile_trees, strict=True)),
+        size,
+        dpi=float(dpi) if dpi else None,
+        page_number=page_context.pageno,
+    )
+    text_out.write_text(tree_text(ocr_tree), encoding='utf-8')
+    return ocr_tree, text_out
+
+
 def should_visible_page_image_use_jpg(pageinfo: PageInfo) -> bool:
     """Determines whether the visible page image should be saved as a JPEG.
 
@@ -871,6 +1475,7 @@ def ocr_engine_textonly_pdf(
         output_text=output_text,
         options=options,
     )
+    _note_skipped_page(output_text.read_text(encoding='utf-8'), page_context)
     return output_pdf, output_text
 
 
@@ -10,6 +10,7 @@ import os
 import shutil
 import sys
 import threading
+from collections import Counter
 from collections.abc import Callable, Sequence
 from concurrent.futures.process import BrokenProcessPool
 from concurrent.futures.thread import BrokenThreadPool
@@ -26,6 +27,7 @@ import PIL.Image
 from pikepdf import Pdf
 
 from ocrmypdf._annots import remove_broken_goto_annotations
+from ocrmypdf._budget import Effort
 from ocrmypdf._concurrent import Executor, setup_executor
 from ocrmypdf._jobcontext import PageContext, PdfContext
 from ocrmypdf._logging import PageNumberFilter
@@ -35,17 +37,20 @@ from ocrmypdf._pipeline import (
     convert_to_pdfa,
     create_ocr_image,
     create_pdf_page_from_image,
+    create_preview_image,
     create_visible_page_jpg,
     generate_postscript_stub,
-    get_orientation_correction,
+    get_page_geometry,
     get_pdf_save_settings,
     get_pdfinfo,
+    is_blank_page,
     optimize_pdf,
     preprocess_clean,
     preprocess_deskew,
     preprocess_remove_background,
     rasterize,
-    rasterize_preview,
+    rotate_raster,
+    select_page_languages,
     should_linearize,
     should_visible_page_image_use_jpg,
     try_auto_pdfa,
@@ -113,6 +118,18 @@ class PageResult(NamedTuple):
     ocr_tree: OcrElement | None = None
     """Direct OcrElement tree (when using generate_ocr() API)."""
 
+    cache_counts: Counter[str] | None = None
+    """Cache hits and misses while processing this page."""
+
+    blank: bool = False
+    """True if OCR was skipped because the page is blank."""
+
+    effort: Effort | None = None
+    """Effort spent on the page to meet ``--ocr-deadline``, if one was given."""
+
+    timed_out: bool = False
+    """True if the OCR engine gave up on the page, or part of it, as too slow."""
+
 
 class HOCRResultEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -358,7 +375,7 @@ def do_get_pdfinfo(pdf_path: Path, executor: Executor, options) -> PdfInfo:
     return get_pdfinfo(
         pdf_path,
         executor=executor,
-        detailed_analysis=options.redo_ocr,
+        detailed_analysis=options.redo_ocr or options.skip_text_quality is not None,
         progbar=options.progress_bar,
         max_workers=options.jobs,
         use_threads=options.use_threads,
@@ -372,38 +389,49 @@ def preprocess(
     remove_background: bool,
     deskew: bool,
     clean: bool,
+    deskew_angle: float | None = None,
 ) -> Path:
     """Preprocess an image."""
     if remove_background:
         image = preprocess_remove_background(image, page_context)
     if deskew:
-        image = preprocess_deskew(image, page_context)
+        image = preprocess_deskew(image, page_context, deskew_angle)
     if clean:
         image = preprocess_clean(image, page_context)
     return image
 
 
 def make_intermediate_images(
-    page_context: PageContext, orientation_correction: int
+    page_context: PageContext,
+    rasterize_out: Path,
+    orientation_correction: int,
+    deskew_angle: float | None = None,
+    raster_deskewed: bool = False,
 ) -> tuple[Path, Path | None]:
-    """Create intermediate and preprocessed images for OCR."""
+    """Create intermediate and preprocessed images for OCR.
+
+    Args:
+        page_context: The page context object.
+        rasterize_out: The page raster, already rotated by the orientation
+            correction.
+        orientation_correction: The orientation correction, used if the page
+            must be rasterized again (for example, to remove vectors).
+        deskew_angle: The skew angle, if already measured.
+        raster_deskewed: True if ``rasterize_out`` is already deskewed.
+    """
     options = page_context.options
+    deskew = options.deskew and not raster_deskewed
 
     ocr_image = preprocess_out = None
-    rasterize_out = rasterize(
-        page_context.origin,
-        page_context,
-        correction=orientation_correction,
-        remove_vectors=False,
-    )
 
     if not any([options.clean, options.clean_final, options.remove_vectors]):
         ocr_image = preprocess_out = preprocess(
             page_context,
             rasterize_out,
             options.remove_background,
-            options.deskew,
+            deskew,
             clean=False,
+            deskew_angle=deskew_angle,
         )
     else:
         if not options.lossless_reconstruction:
@@ -411,8 +439,9 @@ def make_intermediate_images(
                 page_context,
                 rasterize_out,
                 options.remove_background,
-                options.deskew,
+                deskew,
                 clean=options.clean_final,
+                deskew_angle=deskew_angle,
             )
         if options.remove_vectors:
             rasterize_ocr_out = rasterize(
@@ -437,41 +466,96 @@ def make_intermediate_images(
                 page_context,
                 rasterize_ocr_out,
                 options.remove_background,
-                options.deskew,
+                deskew if rasterize_ocr_out == rasterize_out else options.deskew,
                 clean=options.clean,
+                deskew_angle=deskew_angle,
             )
     return ocr_image, preprocess_out
 
 
-def process_page(page_context: PageContext) -> tuple[Path, Path | None, int]:
-    """Process page to create OCR image, visible page image and orientation."""
+def make_visible_page(
+    page_context: PageContext, preprocess_out: Path, orientation_correction: int
+) -> Path:
+    """Create the single page PDF that replaces the page's visible content."""
+    visible_image_out = preprocess_out
+    if should_visible_page_image_use_jpg(page_context.pageinfo):
+        visible_image_out = create_visible_page_jpg(visible_image_out, page_context)
+    filtered_image = page_context.plugin_manager.filter_page_image(
+        page=page_context, image_filename=visible_image_out
+    )
+    if filtered_image is not None:  # None if no hook is present
+        visible_image_out = filtered_image
+    return create_pdf_page_from_image(
+        visible_image_out, page_context, orientation_correction
+    )
+
+
+def process_page(page_context: PageContext) -> tuple[Path | None, Path | None, int]:
+    """Process page to create OCR image, visible page image and orientation.
+
+    If the page is blank (see ``--skip-blank``), there is no OCR image, and
+    the visible page image is only created if the page would otherwise be
+    modified.
+    """
     options = page_context.options
+    rasterize_out = rasterize(page_context.origin, page_context, remove_vectors=False)
+
+    preview_out = None
+    if options.skip_blank:
+        preview_out = create_preview_image(rasterize_out, page_context)
+        if is_blank_page(preview_out, page_context):
+            if options.skip_blank_processing or options.lossless_reconstruction:
+                return None, None, 0
+            # A blank page has no orientation or skew worth correcting
+            preprocess_out = preprocess(
+                page_context,
+                rasterize_out,
+                options.remove_background,
+                False,
+                clean=options.clean_final,
+            )
+            return None, make_visible_page(page_context, preprocess_out, 0), 0
+
     orientation_correction = 0
-    if options.rotate_pages:
-        # Rasterize
-        rasterize_preview_out = rasterize_preview(page_context.origin, page_context)
-        orientation_correction = get_orientation_correction(
-            rasterize_preview_out, page_context
+    deskew_angle = None
+    raster_deskewed = False
+    if options.rotate_pages or options.deskew:
+        # Find the orientation and skew from a downsampled copy of the page
+        # raster, and if a correction is needed, rotate the raster instead of
+        # rendering again
+        if preview_out is None:
+            preview_out = create_preview_image(rasterize_out, page_context)
+        orientation_correction, deskew_angle = get_page_geometry(
+            preview_out, page_context
+        )
+        # Unless the background must be removed before deskewing, correct the
+        # orientation and skew together, so the page is resampled only once
+        raster_deskewed = options.deskew and not options.remove_background
+        rasterize_out = rotate_raster(
+            rasterize_out,
+            page_context,
+            orientation_correction,
+            (deskew_angle or 0.0) if raster_deskewed else 0.0,
         )
 
     ocr_image, preprocess_out = make_intermediate_images(
-        page_context, orientation_correction
+        page_context,
+        rasterize_out,
+        orientation_correction,
+        deskew_angle,
+        raster_deskewed,
     )
     ocr_image_out = create_ocr_image(ocr_image, page_context)
+    if options.detect_languages:
+        if preview_out is None:
+            preview_out = create_preview_image(rasterize_out, page_context)
+        select_page_languages(preview_out, page_context)
 
     pdf_page_from_image_out = None
     if not options.lossless_reconstruction:
         assert preprocess_out
-        visible_image_out = preprocess_out
-        if should_visible_page_image_use_jpg(page_context.pageinfo):
-            visible_image_out = create_visible_page_jpg(visible_image_out, page_context)
-        filtered_image = page_context.plugin_manager.filter_page_image(
-            page=page_context, image_filename=visible_image_out
-        )
-        if filtered_image is not None:  # None if no hook is present
-            visible_image_out = filtered_image
-        pdf_page_from_image_out = create_pdf_page_from_image(
-            visible_image_out, page_context, orientation_correction
+        pdf_page_from_image_out = make_visible_page(
+            page_context, preprocess_out, orientation_correction
         )
     return ocr_image_out, pdf_page_from_image_out, orientation_correction
 
@@ -43,8 +43,9 @@ def _exec_hocrtransform_sync(page_context: PageContext) -> HOCRResult:
         # No hOCR file, so no OCR was performed on this page.
         return HOCRResult(pageno=page_context.pageno)
     hocr_result = HOCRResult.from_json(hocr_json.read_text())
-    # hOCR path is passed directly to the grafting phase where fpdf2 renders it
-    hocr_result.textpdf = page_context.get_path('ocr_hocr.hocr')
+    if hocr_result.hocr is not None:  # None if the page is blank
+        # hOCR path is passed directly to the grafting phase where fpdf2 renders it
+        hocr_result.textpdf = page_context.get_path('ocr_hocr.hocr')
     return hocr_result
 
 
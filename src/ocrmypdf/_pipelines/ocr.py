@@ -8,6 +8,8 @@ from __future__ import annotations
 
 import logging
 import logging.handlers
+import time
+from collections import Counter
 from collections.abc import Sequence
 from functools import partial
 from pathlib import Path
@@ -15,10 +17,19 @@ from tempfile import mkdtemp
 
 import PIL
 
+from ocrmypdf import _budget
+from ocrmypdf._budget import Effort
+from ocrmypdf._cache import take_cache_counts
 from ocrmypdf._concurrent import Executor
 from ocrmypdf._graft import OcrGrafter
 from ocrmypdf._jobcontext import PageContext, PdfContext
 from ocrmypdf._options import OcrOptions
+from ocrmypdf._output_cache import (
+    output_cache,
+    output_cache_key,
+    restore_output,
+    store_output,
+)
 from ocrmypdf._pipeline import (
     copy_final,
     is_ocr_required,
@@ -26,6 +37,8 @@ from ocrmypdf._pipeline import (
     ocr_engine_direct,
     ocr_engine_hocr,
     ocr_engine_textonly_pdf,
+    ocr_engine_tiled,
+    should_tile_ocr_image,
     triage,
     validate_pdfinfo_options,
 )
@@ -66,6 +79,9 @@ def _image_to_ocr_text(
     if pdf_renderer in ('auto', 'fpdf2'):
         # Use generate_ocr() if the engine supports it, otherwise use hOCR path
         ocr_engine = page_context.plugin_manager.get_ocr_engine(options=options)
+        if ocr_engine and should_tile_ocr_image(ocr_image_out, page_context):
+            ocr_tree, text_out = ocr_engine_tiled(ocr_image_out, page_context)
+            return None, text_out, ocr_tree
         if ocr_engine and ocr_engine.supports_generate_ocr():
             ocr_tree, text_out = ocr_engine_direct(ocr_image_out, page_context)
             return None, text_out, ocr_tree
@@ -80,14 +96,37 @@ def _image_to_ocr_text(
 def _exec_page_sync(page_context: PageContext) -> PageResult:
     """Execute a pipeline for a single page synchronously."""
     set_thread_pageno(page_context.pageno + 1)
+    take_cache_counts()
 
     if not is_ocr_required(page_context):
         return PageResult(pageno=page_context.pageno)
 
+    started = time.monotonic()
+    effort = None
+    if page_context.ocr_deadline is not None:
+        options = page_context.options
+        page_context.options, effort = _budget.plan_page(
+            options,
+            deadline=page_context.ocr_deadline,
+            pageno=page_context.pageno,
+            page_count=page_context.page_count,
+            workers=options.jobs or available_cpu_count(),
+        )
+
     ocr_image_out, pdf_page_from_image_out, orientation_correction = process_page(
         page_context
     )
+    if ocr_image_out is None:
+        # Blank page
+        return PageResult(
+            pageno=page_context.pageno,
+            pdf_page_from_image=pdf_page_from_image_out,
+            cache_counts=take_cache_counts(),
+            blank=True,
+        )
     ocr_out, text_out, ocr_tree = _image_to_ocr_text(page_context, ocr_image_out)
+    if effort is not None:
+        _budget.record_page(effort, time.monotonic() - started)
     return PageResult(
         pageno=page_context.pageno,
         pdf_page_from_image=pdf_page_from_image_out,
@@ -95,9 +134,38 @@ def _exec_page_sync(page_context: PageContext) -> PageResult:
         text=text_out,
         orientation_correction=orientation_correction,
         ocr_tree=ocr_tree,
+        cache_counts=take_cache_counts(),
+        effort=effort,
+        timed_out=page_context.ocr_timed_out,
     )
 
 
+def _report_cache_counts(cache_counts: Counter[str]) -> None:
+    if not cache_counts:
+        return
+    for name in sorted({key.rsplit('_', 1)[0] for key in cache_counts}):
+        log.info(
+            "%s cache: %d hits, %d misses",
+            name[:1].upper() + name[1:],
+            cache_counts[f'{name}_hits'],
+            cache_counts[f'{name}_misses'],
+        )
+
+
+def _report_degraded_pages(efforts: dict[int, Effort], page_count: int) -> None:
+    for effort in (Effort.reduced, Effort.fast):
+        pages = sorted(pageno + 1 for pageno, e in efforts.items() if e == effort)
+        if pages:
+            log.warning(
+                "To meet --ocr-deadline, %d of %d pages were processed with "
+                "%s effort: %s",
+                len(pages),
+                page_count,
+                effort.name,
+                ', '.join(str(page) for page in pages),
+            )
+
+
 def exec_concurrent(context: PdfContext, executor: Executor) -> Sequence[str]:
     """Execute the OCR pipeline concurrently."""
     options = context.options
@@ -107,6 +175,12 @@ def exec_concurrent(context: PdfContext, executor: Executor) -> Sequence[str]:
         log.info("Starting processing with %d workers concurrently", max_workers)
 
     sidecars: list[Path | None] = [None] * len(context.pdfinfo)
+    cache_counts: Counter[str] = Counter()
+    blank_pages: list[int] = []
+    efforts: dict[int, Effort] = {}
+    if options.ocr_deadline is not None:
+        context.ocr_deadline = time.time() + options.ocr_deadline
+        _budget.reset()
     ocrgraft = OcrGrafter(context)
 
     def update_page(result: PageResult, pbar: ProgressBar):
@@ -114,6 +188,14 @@ def exec_concurrent(context: PdfContext, executor: Executor) -> Sequence[str]:
         try:
             set_thread_pageno(result.pageno + 1)
             sidecars[result.pageno] = result.text
+            if result.cache_counts:
+                cache_counts.update(result.cache_counts)
+            if result.blank:
+                blank_pages.append(result.pageno)
+            if result.effort is not None:
+                efforts[result.pageno] = result.effort
+            if result.timed_out or result.effort not in (None, Effort.full):
+                context.degraded = True
             pbar.update(0.5)
             ocrgraft.graft_page(
                 pageno=result.pageno,
@@ -141,6 +223,15 @@ def exec_concurrent(context: PdfContext, executor: Executor) -> Sequence[str]:
         task_finished=update_page,
     )
 
+    _report_cache_counts(cache_counts)
+    if blank_pages:
+        log.info(
+            "Skipped OCR on %d of %d pages because they are blank",
+            len(blank_pages),
+            len(context.pdfinfo),
+        )
+    _report_degraded_pages(efforts, len(context.pdfinfo))
+
     # Output sidecar text
     if options.sidecar:
         text = merge_sidecars(sidecars, context)
@@ -177,6 +268,14 @@ def _run_pipeline(
         check_requested_output_file(options)
         start_input_file, original_filename = create_input_file(options, work_folder)
 
+        cache = output_cache(options)
+        key = None
+        if cache is not None:
+            key = output_cache_key(start_input_file, options, plugin_manager)
+            if restore_output(cache, key, options):
+                log.info("Output copied from --output-cache")
+                return ExitCode.ok
+
         # Triage image or pdf
         origin_pdf = triage(
             original_filename, start_input_file, work_folder / 'origin.pdf', options
@@ -193,6 +292,12 @@ def _run_pipeline(
         optimize_messages = exec_concurrent(context, executor)
 
         exitcode = report_output_pdf(options, start_input_file, optimize_messages)
+        if cache is not None and key is not None and exitcode == ExitCode.ok:
+            if context.degraded:
+                # A later run, with more time, may do better
+                log.debug("OCR was cut short on some pages; output not cached")
+            else:
+                store_output(cache, key, options, original_filename)
         return exitcode
 
 
@@ -47,7 +47,9 @@ def _exec_page_hocr_sync(page_context: PageContext) -> HOCRResult:
     ocr_image_out, pdf_page_from_image_out, orientation_correction = process_page(
         page_context
     )
-    hocr_out, _ = ocr_engine_hocr(ocr_image_out, page_context)
+    hocr_out = None
+    if ocr_image_out is not None:  # None if the page is blank
+        hocr_out, _ = ocr_engine_hocr(ocr_image_out, page_context)
 
     result = HOCRResult(
         pageno=page_context.pageno,
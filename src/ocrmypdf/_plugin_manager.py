@@ -20,6 +20,7 @@ from pydantic import BaseModel
 
 import ocrmypdf.builtin_plugins
 from ocrmypdf import Executor, PdfContext, pluginspec
+from ocrmypdf._ocr_cache import CachingOcrEngine, ocr_cache
 from ocrmypdf._options import OcrOptions
 from ocrmypdf._plugin_registry import PluginOptionRegistry
 from ocrmypdf._progressbar import ProgressBar
@@ -198,6 +199,8 @@ class OcrmypdfPluginManager:
         result = self._pm.hook.get_ocr_engine(options=options)
         if result is None:
             raise ValueError('No OCR engine selected')
+        if options is not None and (cache := ocr_cache(options)) is not None:
+            return CachingOcrEngine(result, cache)
         return result
 
     def generate_pdfa(
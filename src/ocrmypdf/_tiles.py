@@ -0,0 +1,308 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+"""Split oversized page images into overlapping tiles and merge their OCR."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from functools import partial
+from typing import NamedTuple
+
+from ocrmypdf.models.ocr_element import Baseline, BoundingBox, OcrClass, OcrElement
+
+
+class Tile(NamedTuple):
+    """A tile of a page image, in pixel coordinates of the page image.
+
+    ``box`` is the region that is cropped and sent for OCR. ``core`` is the
+    part of ``box`` that this tile is responsible for. The cores of all tiles
+    partition the page, so every word is kept from exactly one tile: the one
+    whose core contains the center of the word.
+    """
+
+    box: tuple[int, int, int, int]
+    core: tuple[int, int, int, int]
+
+
+def _spans(length: int, tile_size: int, overlap: int) -> list[tuple[int, int, int]]:
+    """Divide ``length`` into overlapping spans, returning (start, end, core_end)."""
+    if length <= tile_size:
+        return [(0, length, length)]
+    step = tile_size - overlap
+    count = -(-(length - overlap) // step)  # ceil division
+    # Spread the tiles evenly rather than leaving a sliver at the end
+    step = -(-(length - overlap) // count)
+    spans = []
+    for n in range(count):
+        start = n * step
+        end = min(start + step + overlap, length)
+        core_end = end if n == count - 1 else end - overlap // 2
+        spans.append((start, end, core_end))
+    return spans
+
+
+def plan_tiles(size: tuple[int, int], tile_size: int, overlap: int) -> list[Tile]:
+    """Cover an image of ``size`` with tiles no larger than ``tile_size``.
+
+    Adjacent tiles overlap by ``overlap`` pixels, which should be larger than
+    the largest word expected, so that every word lies entirely within the
+    tile that owns it.
+    """
+    if overlap >= tile_size:
+        raise ValueError("overlap must be smaller than tile_size")
+    width, height = size
+    tiles = []
+    x_spans = _spans(width, tile_size, overlap)
+    y_spans = _spans(height, tile_size, overlap)
+    for y_index, (top, bottom, core_bottom) in enumerate(y_spans):
+        core_top = 0 if y_index == 0 else y_spans[y_index - 1][2]
+        for x_index, (left, right, core_right) in enumerate(x_spans):
+            core_left = 0 if x_index == 0 else x_spans[x_index - 1][2]
+            tiles.append(
+                Tile(
+                    box=(left, top, right, bottom),
+                    core=(core_left, core_top, core_right, core_bottom),
+                )
+            )
+    return tiles
+
+
+def _offset(bbox: BoundingBox | None, dx: float, dy: float) -> BoundingBox | None:
+    if bbox is None:
+        return None
+    return BoundingBox(
+        left=bbox.left + dx,
+        top=bbox.top + dy,
+        right=bbox.right + dx,
+        bottom=bbox.bottom + dy,
+    )
+
+
+def _center_in(bbox: BoundingBox, core: tuple[int, int, int, int]) -> bool:
+    x = (bbox.left + bbox.right) / 2
+    y = (bbox.top + bbox.bottom) / 2
+    return core[0] <= x < core[2] and core[1] <= y < core[3]
+
+
+def _union(boxes: list[BoundingBox]) -> BoundingBox:
+    return BoundingBox(
+        left=min(box.left for box in boxes),
+        top=min(box.top for box in boxes),
+        right=max(box.right for box in boxes),
+        bottom=max(box.bottom for box in boxes),
+    )
+
+
+def _with_children(element: OcrElement, children: list[OcrElement]) -> OcrElement:
+    """Replace the children of a container, fitting its bbox to them.
+
+    The baseline, which is relative to the bottom left of the bbox, is moved to
+    stay in place on the page. A polygon that no longer matches is dropped.
+    """
+    boxes = [child.bbox for child in children if child.bbox is not None]
+    if not boxes:
+        return replace(element, children=children)
+    bbox = _union(boxes)
+    if bbox == element.bbox:
+        return replace(element, children=children)
+    baseline = element.baseline
+    if baseline is not None and element.bbox is not None:
+        old = element.bbox
+        baseline = Baseline(
+            slope=baseline.slope,
+            intercept=old.bottom
+            + baseline.slope * (bbox.left - old.left)
+            + baseline.intercept
+            - bbox.bottom,
+        )
+    return replace(element, bbox=bbox, poly=None, baseline=baseline, children=children)
+
+
+def _claim(
+    element: OcrElement, dx: float, dy: float, core: tuple[int, int, int, int]
+) -> OcrElement | None:
+    """Translate an element to page coordinates, keeping only what the tile owns.
+
+    Words (and leaf elements) are owned by the tile whose core contains their
+    center. Containers are kept if they still contain any owned element, with
+    their bbox fitted to what they contain.
+    """
+    bbox = _offset(element.bbox, dx, dy)
+    poly = (
+        [(x + dx, y + dy) for x, y in element.poly]
+        if element.poly is not None
+        else None
+    )
+    if element.ocr_class == OcrClass.WORD or not element.children:
+        if bbox is not None and not _center_in(bbox, core):
+            return None
+        children = [
+            replace(child, bbox=_offset(child.bbox, dx, dy))
+            for child in element.children
+        ]
+        return replace(element, bbox=bbox, poly=poly, children=children)
+
+    children = [
+        claimed
+        for child in element.children
+        if (claimed := _claim(child, dx, dy, core)) is not None
+    ]
+    if not children:
+        return None
+    return _with_children(replace(element, bbox=bbox, poly=poly), children)
+
+
+def _same_line(a: BoundingBox, b: BoundingBox) -> bool:
+    """Whether two line fragments are parts of one line of text.
+
+    The fragments must overlap vertically by at least half the height of the
+    shorter one, and be no further apart than the height of the taller one.
+    """
+    overlap = min(a.bottom, b.bottom) - max(a.top, b.top)
+    gap = max(a.left, b.left) - min(a.right, b.right)
+    return overlap > min(a.height, b.height) / 2 and gap < max(a.height, b.height)
+
+
+class _Groups:
+    """Elements that are to be merged into one, tracked by identity."""
+
+    def __init__(self):
+        self._parent: dict[int, int] = {}
+
+    def find(self, element: OcrElement) -> int:
+        key = id(element)
+        while (parent := self._parent.get(key, key)) != key:
+            key = parent
+        return key
+
+    def union(self, a: OcrElement, b: OcrElement) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self._parent[root_b] = root_a
+
+
+def _find_lines(
+    element: OcrElement, ancestors: list[OcrElement]
+) -> list[list[OcrElement]]:
+    """The lines within an element, each with its chain of ancestors."""
+    chain = [*ancestors, element]
+    if element.ocr_class in OcrClass.LINE_TYPES:
+        return [chain]
+    if element.ocr_class == OcrClass.WORD:
+        return []
+    return [line for child in element.children for line in _find_lines(child, chain)]
+
+
+def _join_split_lines(blocks: list[tuple[int, OcrElement]], groups: _Groups) -> None:
+    """Group the fragments of lines that cross tile boundaries.
+
+    The paragraphs and other containers of the fragments are grouped too, so
+    that a paragraph crossing a boundary also becomes one paragraph.
+    """
+    lines = sorted(
+        (
+            (tile_index, chain)
+            for tile_index, block in blocks
+            for chain in _find_lines(block, [])
+            if chain[-1].bbox is not None
+        ),
+        key=lambda item: item[1][-1].bbox.top,
+    )
+    for n, (tile_index, chain) in enumerate(lines):
+        bbox = chain[-1].bbox
+        for other_index, other in lines[n + 1 :]:
+            if other[-1].bbox.top >= bbox.bottom:
+                break
+            if other_index == tile_index or not _same_line(bbox, other[-1].bbox):
+                continue
+            for a, b in zip(reversed(chain), reversed(other), strict=False):
+                if a.ocr_class != b.ocr_class:
+                    break
+                groups.union(a, b)
+
+
+def _position(element: OcrElement) -> tuple[float, float]:
+    if element.bbox is None:
+        return (float('inf'), float('inf'))
+    return (element.bbox.top, element.bbox.left)
+
+
+def _x_position(word: OcrElement, *, rtl: bool) -> float:
+    if word.bbox is None:
+        return 0.0
+    return -word.bbox.right if rtl else word.bbox.left
+
+
+def _rebuild(elements: list[OcrElement], groups: _Groups) -> list[OcrElement]:
+    """Merge each group of elements into one, and sort them by position."""
+    grouped: dict[int, list[OcrElement]] = {}
+    for element in elements:
+        grouped.setdefault(groups.find(element), []).append(element)
+    merged = []
+    for members in grouped.values():
+        first = members[0]
+        if first.ocr_class == OcrClass.WORD or not first.children:
+            merged.extend(members)
+            continue
+        children = [child for member in members for child in member.children]
+        if first.ocr_class in OcrClass.LINE_TYPES:
+            if len(members) > 1:
+                children.sort(key=partial(_x_position, rtl=first.direction == 'rtl'))
+        else:
+            children = _rebuild(children, groups)
+        merged.append(_with_children(first, children))
+    return sorted(merged, key=_position)
+
+
+def merge_tile_trees(
+    tile_trees: list[tuple[Tile, OcrElement]],
+    size: tuple[int, int],
+    *,
+    dpi: float | None,
+    page_number: int | None,
+) -> OcrElement:
+    """Merge the OCR results of tiles into one page tree.
+
+    Each word is kept from one tile only. Lines that cross the boundary
+    between tiles are joined back into one line, and so are their paragraphs.
+    Paragraphs and lines are sorted by their position on the page.
+
+    Args:
+        tile_trees: Each tile with the OCR tree (an ``ocr_page``) produced for
+            the tile's cropped image.
+        size: Size of the whole page image in pixels.
+        dpi: Resolution of the page image.
+        page_number: Page number to record on the merged page.
+
+    Returns:
+        An ``ocr_page`` element in page image coordinates, with the content of
+        the overlapping regions taken from one tile only.
+    """
+    blocks = []
+    for tile_index, (tile, tree) in enumerate(tile_trees):
+        left, top = tile.box[0], tile.box[1]
+        for child in tree.children:
+            claimed = _claim(child, left, top, tile.core)
+            if claimed is not None:
+                blocks.append((tile_index, claimed))
+    groups = _Groups()
+    _join_split_lines(blocks, groups)
+    return OcrElement(
+        ocr_class=OcrClass.PAGE,
+        bbox=BoundingBox(left=0, top=0, right=size[0], bottom=size[1]),
+        dpi=dpi,
+        page_number=page_number,
+        children=_rebuild([block for _, block in blocks], groups),
+    )
+
+
+def tree_text(page: OcrElement) -> str:
+    """Plain text of a page tree, one line per OCR line."""
+    paragraphs = []
+    for paragraph in page.paragraphs or [page]:
+        lines = [line.get_text_recursive() for line in paragraph.lines]
+        if not lines:
+            lines = [word.text for word in paragraph.words]
+        paragraphs.append('\n'.join(line for line in lines if line))
+    return '\n\n'.join(p for p in paragraphs if p) + '\n'
@@ -156,9 +156,18 @@ def check_options_strip(options: OcrOptions) -> None:
         )
 
 
+def check_options_skip_text_quality(options: OcrOptions) -> None:
+    wordlist = options.skip_text_wordlist
+    if wordlist is not None and not Path(wordlist).is_file():
+        raise BadArgsError(
+            f"--skip-text-wordlist {options.skip_text_wordlist} is not a file"
+        )
+
+
 def _check_plugin_invariant_options(options: OcrOptions) -> None:
     check_platform()
     check_options_strip(options)
+    check_options_skip_text_quality(options)
     check_options_sidecar(options)
     check_options_preprocessing(options)
 
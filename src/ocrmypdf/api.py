@@ -457,9 +457,11 @@ def ocr(
     rotate_pages: bool | None = None,
     remove_background: bool | None = None,
     deskew: bool | None = None,
+    deskew_method: str | None = None,
     clean: bool | None = None,
     clean_final: bool | None = None,
     unpaper_args: str | None = None,
+    unpaper_batch_size: int | None = None,
     oversample: int | None = None,
     remove_vectors: bool | None = None,
     mode: str | None = None,
@@ -467,6 +469,14 @@ def ocr(
     skip_text: bool | None = None,
     redo_ocr: bool | None = None,
     skip_big: float | None = None,
+    skip_text_quality: float | None = None,
+    skip_text_wordlist: os.PathLike | str | None = None,
+    skip_blank: float | None = None,
+    blank_ink_level: int | None = None,
+    skip_blank_processing: bool | None = None,
+    detect_languages: bool | None = None,
+    ocr_deadline: float | None = None,
+    adaptive_ocr_resolution: bool | None = None,
     optimize: int | None = None,
     jpeg_quality: int | None = None,
     jpg_quality: int | None = None,  # Deprecated, use jpeg_quality instead
@@ -482,10 +492,15 @@ def ocr(
     tesseract_thresholding: int | None = None,
     pdf_renderer: str | None = None,
     rasterizer: str | None = None,
+    intermediate_image_format: str | None = None,
+    ocr_image_mode: str | None = None,
     tesseract_timeout: float | None = None,
     tesseract_non_ocr_timeout: float | None = None,
     tesseract_downsample_above: int | None = None,
     tesseract_downsample_large_images: bool | None = None,
+    tesseract_batch_size: int | None = None,
+    tesseract_fast_tessdata: os.PathLike | None = None,
+    tesseract_escalate_below: float | None = None,
     rotate_pages_threshold: float | None = None,
     pdfa_image_compression: str | None = None,
     color_conversion_strategy: str | None = None,
@@ -493,6 +508,14 @@ def ocr(
     user_patterns: os.PathLike | None = None,
     fast_web_view: float | None = None,
     continue_on_soft_render_error: bool | None = None,
+    ocr_tile_size: int | None = None,
+    ocr_batch_size: int | None = None,
+    raster_cache: os.PathLike | str | None = None,
+    raster_cache_size: float | None = None,
+    ocr_cache: os.PathLike | str | None = None,
+    ocr_cache_size: float | None = None,
+    output_cache: os.PathLike | str | None = None,
+    output_cache_size: float | None = None,
     invalidate_digital_signatures: bool | None = None,
     tagged_pdf_mode: str | None = None,
     no_overwrite: bool | None = None,
@@ -521,9 +544,11 @@ def ocr(  # noqa: D417
     rotate_pages: bool | None = None,
     remove_background: bool | None = None,
     deskew: bool | None = None,
+    deskew_method: str | None = None,
     clean: bool | None = None,
     clean_final: bool | None = None,
     unpaper_args: str | None = None,
+    unpaper_batch_size: int | None = None,
     oversample: int | None = None,
     remove_vectors: bool | None = None,
     mode: str | None = None,
@@ -531,6 +556,14 @@ def ocr(  # noqa: D417
     skip_text: bool | None = None,  # Legacy, use mode='skip' instead
     redo_ocr: bool | None = None,  # Legacy, use mode='redo' instead
     skip_big: float | None = None,
+    skip_text_quality: float | None = None,
+    skip_text_wordlist: os.PathLike | str | None = None,
+    skip_blank: float | None = None,
+    blank_ink_level: int | None = None,
+    skip_blank_processing: bool | None = None,
+    detect_languages: bool | None = None,
+    ocr_deadline: float | None = None,
+    adaptive_ocr_resolution: bool | None = None,
     optimize: int | None = None,
     jpeg_quality: int | None = None,
     jpg_quality: int | None = None,  # Deprecated, use jpeg_quality instead
@@ -546,10 +579,15 @@ def ocr(  # noqa: D417
     tesseract_thresholding: int | None = None,
     pdf_renderer: str | None = None,
     rasterizer: str | None = None,
+    intermediate_image_format: str | None = None,
+    ocr_image_mode: str | None = None,
     tesseract_timeout: float | None = None,
     tesseract_non_ocr_timeout: float | None = None,
     tesseract_downsample_above: int | None = None,
     tesseract_downsample_large_images: bool | None = None,
+    tesseract_batch_size: int | None = None,
+    tesseract_fast_tessdata: os.PathLike | None = None,
+    tesseract_escalate_below: float | None = None,
     rotate_pages_threshold: float | None = None,
     pdfa_image_compression: str | None = None,
     color_conversion_strategy: str | None = None,
@@ -557,6 +595,14 @@ def ocr(  # noqa: D417
     user_patterns: os.PathLike | None = None,
     fast_web_view: float | None = None,
     continue_on_soft_render_error: bool | None = None,
+    ocr_tile_size: int | None = None,
+    ocr_batch_size: int | None = None,
+    raster_cache: os.PathLike | str | None = None,
+    raster_cache_size: float | None = None,
+    ocr_cache: os.PathLike | str | None = None,
+    ocr_cache_size: float | None = None,
+    output_cache: os.PathLike | str | None = None,
+    output_cache_size: float | None = None,
     invalidate_digital_signatures: bool | None = None,
     tagged_pdf_mode: str | None = None,
     no_overwrite: bool | None = None,
@@ -774,9 +820,11 @@ def _pdf_to_hocr(  # noqa: D417
     rotate_pages: bool | None = None,
     remove_background: bool | None = None,
     deskew: bool | None = None,
+    deskew_method: str | None = None,
     clean: bool | None = None,
     clean_final: bool | None = None,
     unpaper_args: str | None = None,
+    unpaper_batch_size: int | None = None,
     oversample: int | None = None,
     remove_vectors: bool | None = None,
     mode: str | None = None,
@@ -784,6 +832,14 @@ def _pdf_to_hocr(  # noqa: D417
     skip_text: bool | None = None,  # Legacy, use mode='skip' instead
     redo_ocr: bool | None = None,  # Legacy, use mode='redo' instead
     skip_big: float | None = None,
+    skip_text_quality: float | None = None,
+    skip_text_wordlist: os.PathLike | str | None = None,
+    skip_blank: float | None = None,
+    blank_ink_level: int | None = None,
+    skip_blank_processing: bool | None = None,
+    detect_languages: bool | None = None,
+    ocr_deadline: float | None = None,
+    adaptive_ocr_resolution: bool | None = None,
     pages: str | None = None,
     max_image_mpixels: float | None = None,
     tesseract_config: Iterable[str] | None = None,
@@ -794,11 +850,24 @@ def _pdf_to_hocr(  # noqa: D417
     tesseract_non_ocr_timeout: float | None = None,
     tesseract_downsample_above: int | None = None,
     tesseract_downsample_large_images: bool | None = None,
+    tesseract_batch_size: int | None = None,
+    tesseract_fast_tessdata: os.PathLike | None = None,
+    tesseract_escalate_below: float | None = None,
     rotate_pages_threshold: float | None = None,
     rasterizer: str | None = None,
+    intermediate_image_format: str | None = None,
+    ocr_image_mode: str | None = None,
     user_words: os.PathLike | None = None,
     user_patterns: os.PathLike | None = None,
     continue_on_soft_render_error: bool | None = None,
+    ocr_tile_size: int | None = None,
+    ocr_batch_size: int | None = None,
+    raster_cache: os.PathLike | str | None = None,
+    raster_cache_size: float | None = None,
+    ocr_cache: os.PathLike | str | None = None,
+    ocr_cache_size: float | None = None,
+    output_cache: os.PathLike | str | None = None,
+    output_cache_size: float | None = None,
     invalidate_digital_signatures: bool | None = None,
     plugin_manager=None,
     plugins: Sequence[Path | str] | None = None,
@@ -17,6 +17,7 @@ from ocrmypdf import hookimpl
 from ocrmypdf._exec import ghostscript
 from ocrmypdf._options import ProcessingMode
 from ocrmypdf.exceptions import MissingDependencyError
+from ocrmypdf.imageops import intermediate_image_format
 from ocrmypdf.subprocess import check_external_program
 
 log = logging.getLogger(__name__)
@@ -271,6 +272,9 @@ def rasterize_pdf_page(
         filter_vector=filter_vector,
         stop_on_error=stop_on_soft_error,
         use_cropbox=use_cropbox,
+        save_params=intermediate_image_format(
+            options.intermediate_image_format if options is not None else None
+        ).params,
     )
     return output_file
 
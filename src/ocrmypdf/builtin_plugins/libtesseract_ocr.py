@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+"""Built-in plugin implementing OCR with libtesseract, within the OCRmyPDF process.
+
+The engine recognizes text with the same Tesseract models and options as the
+``tesseract`` engine, but keeps the models loaded between pages instead of
+starting the ``tesseract`` program for each page. Orientation and skew are
+found together, from one copy of the page image. Script detection and the
+sandwich renderer still use the ``tesseract`` program.
+
+Usage:
+    ocrmypdf --ocr-engine libtesseract input.pdf output.pdf
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from PIL import Image
+
+from ocrmypdf import hookimpl
+from ocrmypdf._exec import libtesseract
+from ocrmypdf.builtin_plugins.tesseract_ocr import TesseractOcrEngine
+from ocrmypdf.exceptions import BadArgsError, MissingDependencyError
+from ocrmypdf.hocrtransform import OcrElement
+from ocrmypdf.pluginspec import PageGeometry
+
+log = logging.getLogger(__name__)
+
+
+class LibTesseractOcrEngine(TesseractOcrEngine):
+    """Implements OCR with libtesseract, loading models once per worker."""
+
+    def __str__(self):
+        return f"Tesseract OCR {TesseractOcrEngine.version()} (libtesseract)"
+
+    @staticmethod
+    def generate_ocr(
+        input_file: Path, options, page_number: int = 0
+    ) -> tuple[OcrElement, str]:
+        tess = options.tesseract
+        try:
+            api = libtesseract.get_api(
+                languages=options.languages,
+                engine_mode=tess.oem,
+                tessconfig=tess.config,
+                user_words=tess.user_words,
+                user_patterns=tess.user_patterns,
+                omp_thread_limit=tess.omp_thread_limit,
+            )
+            with Image.open(input_file) as im:
+                return api.recognize(
+                    im,
+                    page_number=page_number,
+                    pagesegmode=tess.pagesegmode,
+                    thresholding=tess.thresholding,
+                    timeout=tess.timeout,
+                )
+        except (MissingDependencyError, libtesseract.LibTesseractError) as e:
+            log.warning(f"libtesseract failed ({e}); using the tesseract program")
+        return TesseractOcrEngine.generate_ocr(input_file, options, page_number)
+
+    @staticmethod
+    def supports_page_geometry() -> bool:
+        return True
+
+    def get_page_geometry(
+        self, input_file: Path, options, *, orientation=True, deskew=True
+    ) -> PageGeometry:
+        tess = options.tesseract
+        if tess.non_ocr_timeout == 0:
+            # Like the tesseract program given no time at all
+            return PageGeometry()
+        try:
+            api = libtesseract.get_api(
+                languages=['osd'],
+                engine_mode=tess.oem,
+                tessconfig=[],
+                user_words=None,
+                user_patterns=None,
+                omp_thread_limit=tess.omp_thread_limit,
+            )
+            with Image.open(input_file) as im:
+                return PageGeometry(
+                    *api.page_geometry(im, orientation=orientation, deskew=deskew)
+                )
+        except (MissingDependencyError, libtesseract.LibTesseractError) as e:
+            log.warning(f"libtesseract failed ({e}); using the tesseract program")
+        return super().get_page_geometry(
+            input_file, options, orientation=orientation, deskew=deskew
+        )
+
+
+@hookimpl
+def check_options(options):
+    if options.ocr_engine != 'libtesseract':
+        return
+    if options.tesseract.fast_tessdata:
+        raise BadArgsError(
+            "--tesseract-fast-tessdata cannot be used with --ocr-engine "
+            "libtesseract. Use --ocr-engine tesseract instead."
+        )
+    if not libtesseract.available():
+        log.warning(
+            "--ocr-engine libtesseract was requested, but the libtesseract library "
+            "could not be found. The tesseract program will be used instead."
+        )
+
+
+@hookimpl
+def get_ocr_engine(options):
+    """Return LibTesseractOcrEngine when --ocr-engine libtesseract is selected."""
+    if options is None or getattr(options, 'ocr_engine', 'auto') != 'libtesseract':
+        return None
+    if not libtesseract.available():
+        return TesseractOcrEngine()
+    return LibTesseractOcrEngine()
@@ -13,6 +13,7 @@ Usage:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -99,6 +100,26 @@ class NullOcrEngine(OcrEngine):
 
         return page, ""
 
+    @staticmethod
+    def supports_generate_ocr_batch() -> bool:
+        """Return True - this engine supports the generate_ocr_batch() API."""
+        return True
+
+    def generate_ocr_batch(
+        self,
+        input_files: Sequence[Path],
+        options: OcrOptions,
+        page_numbers: Sequence[int],
+    ) -> list[tuple[OcrElement, str]]:
+        """Generate empty OCR results for several images.
+
+        Useful for testing how the pipeline batches pages.
+        """
+        return [
+            self.generate_ocr(input_file, options, page_number)
+            for input_file, page_number in zip(input_files, page_numbers, strict=True)
+        ]
+
     @staticmethod
     def generate_hocr(
         input_file: Path,
@@ -6,9 +6,10 @@ from __future__ import annotations
 
 import logging
 import threading
+from collections.abc import Mapping
 from contextlib import closing
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
     import pypdfium2 as pdfium
@@ -22,6 +23,7 @@ from PIL import Image
 from ocrmypdf import hookimpl
 from ocrmypdf.exceptions import MissingDependencyError
 from ocrmypdf.helpers import Resolution
+from ocrmypdf.imageops import intermediate_image_format
 
 log = logging.getLogger(__name__)
 
@@ -216,9 +218,14 @@ def _process_image_for_output(
     return pil_image, format_name
 
 
-def _save_image(pil_image: Image.Image, output_file: Path, format_name: str) -> None:
+def _save_image(
+    pil_image: Image.Image,
+    output_file: Path,
+    format_name: str,
+    save_params: Mapping[str, Any] | None = None,
+) -> None:
     """Save PIL image to file with appropriate DPI metadata."""
-    save_kwargs = {}
+    save_kwargs = dict(save_params or {})
     if (
         format_name in ('PNG', 'TIFF')
         and 'dpi' in pil_image.info
@@ -283,6 +290,13 @@ def rasterize_pdf_page(
         expected_height,
     )
 
-    _save_image(pil_image, output_file, format_name)
+    save_params = None
+    if format_name == 'PNG':
+        # Page images are intermediate files; encode them as the user prefers
+        image_format = intermediate_image_format(
+            options.intermediate_image_format if options is not None else None
+        )
+        format_name, save_params = image_format.format, image_format.params
+    _save_image(pil_image, output_file, format_name, save_params)
 
     return output_file
@@ -7,19 +7,33 @@ from __future__ import annotations
 import argparse
 import logging
 import os
+from io import BytesIO
+from pathlib import Path
+from subprocess import TimeoutExpired
+from tempfile import TemporaryDirectory
 from typing import Annotated
 
 from PIL import Image
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from ocrmypdf import hookimpl
+from ocrmypdf._cache import file_digest
+from ocrmypdf._escalate import line_crop_box, low_confidence_lines, replace_line_words
 from ocrmypdf._exec import tesseract
 from ocrmypdf._exec.tesseract import ThresholdingMethod
 from ocrmypdf._jobcontext import PageContext
+from ocrmypdf._ocr_cache import SKIPPED_PAGE_TEXT
+from ocrmypdf._tiles import tree_text
 from ocrmypdf.cli import numeric
-from ocrmypdf.exceptions import BadArgsError, MissingDependencyError
+from ocrmypdf.exceptions import (
+    BadArgsError,
+    MissingDependencyError,
+    SubprocessOutputError,
+)
 from ocrmypdf.helpers import available_cpu_count, clamp
+from ocrmypdf.hocrtransform import HocrParser
 from ocrmypdf.imageops import calculate_downsample, downsample_image
+from ocrmypdf.models.ocr_element import BoundingBox, OcrClass, OcrElement
 from ocrmypdf.pluginspec import OcrEngine
 from ocrmypdf.subprocess import check_external_program
 
@@ -88,6 +102,26 @@ class TesseractOptions(BaseModel):
             description="Downsample images larger than this pixel size",
         ),
     ] = 32767
+    batch_size: Annotated[
+        int,
+        Field(
+            ge=1,
+            le=100,
+            description="Largest number of pages to OCR with one Tesseract process",
+        ),
+    ] = 1
+    fast_tessdata: Annotated[
+        str | None,
+        Field(description="Folder of fast language models to OCR with first"),
+    ] = None
+    escalate_below: Annotated[
+        float,
+        Field(
+            ge=0,
+            le=100,
+            description="OCR lines again with the default models below this confidence",
+        ),
+    ] = 75.0
     user_words: Annotated[
         str | None, Field(description="Path to Tesseract user words file")
     ] = None
@@ -229,6 +263,48 @@ class TesseractOptions(BaseModel):
             ),
         )
 
+        tess.add_argument(
+            f'--{namespace}-batch-size',
+            metavar='PAGES',
+            type=numeric(int, 1, 100),
+            default=1,
+            dest=f'{namespace}_batch_size',
+            help=(
+                "OCR up to this many pages with one Tesseract process, when pages "
+                "with the same OCR settings are ready at the same time in "
+                "different worker threads. Tesseract loads its language models "
+                "once per process, so this saves time on documents with many "
+                "small pages, but pages in a batch are OCRed one after another. "
+                "Has no effect with --no-use-threads. Default 1 (no batching)."
+            ),
+        )
+
+        tess.add_argument(
+            f'--{namespace}-fast-tessdata',
+            metavar='DIR',
+            dest=f'{namespace}_fast_tessdata',
+            help=(
+                "OCR each page first with the language models in DIR, such as "
+                "a copy of the tessdata_fast models, then OCR again with the "
+                "default models only those lines whose mean word confidence is "
+                f"below --{namespace}-escalate-below. The fast models must be "
+                "available for every language given with -l. Only used with the "
+                "fpdf2 renderer, and not with --ocr-engine libtesseract."
+            ),
+        )
+
+        tess.add_argument(
+            f'--{namespace}-escalate-below',
+            metavar='PERCENT',
+            type=numeric(float, 0, 100),
+            default=75.0,
+            dest=f'{namespace}_escalate_below',
+            help=(
+                f"With --{namespace}-fast-tessdata, the confidence (0-100) below "
+                "which a line is OCRed again with the default models. Default 75."
+            ),
+        )
+
         tess.add_argument(
             '--user-words',
             metavar='FILE',
@@ -306,6 +382,9 @@ def add_options(parser):
 @hookimpl
 def check_options(options):
     """Check external dependencies and version compatibility for Tesseract."""
+    if options.ocr_engine not in ('auto', 'tesseract', 'libtesseract'):
+        # Another OCR engine was selected, so Tesseract is not needed
+        return
     check_external_program(
         program='tesseract',
         package={'linux': 'tesseract-ocr'},
@@ -382,6 +461,25 @@ def filter_ocr_image(page: PageContext, image: Image.Image) -> Image.Image:
     return image
 
 
+# Shared by the worker threads of this process, so they can batch OCR runs
+_HOCR_BATCHER = tesseract.HocrBatcher()
+
+
+def _hocr_settings(options) -> dict:
+    """Arguments of tesseract.generate_hocr that are set by options."""
+    return dict(
+        languages=options.languages,
+        engine_mode=options.tesseract.oem,
+        tessconfig=options.tesseract.config,
+        timeout=options.tesseract.timeout,
+        pagesegmode=options.tesseract.pagesegmode,
+        thresholding=options.tesseract.thresholding,
+        user_words=options.tesseract.user_words,
+        user_patterns=options.tesseract.user_patterns,
+        omp_thread_limit=options.tesseract.omp_thread_limit,
+    )
+
+
 class TesseractOcrEngine(OcrEngine):
     """Implements OCR with Tesseract."""
 
@@ -435,23 +533,59 @@ class TesseractOcrEngine(OcrEngine):
             omp_thread_limit=options.tesseract.omp_thread_limit,
         )
 
+    @staticmethod
+    def get_script(input_file, options):
+        return tesseract.get_script(
+            input_file,
+            engine_mode=options.tesseract.oem,
+            timeout=options.tesseract.non_ocr_timeout,
+            omp_thread_limit=options.tesseract.omp_thread_limit,
+        )
+
+    @staticmethod
+    def cache_parameters(options):
+        tess = options.tesseract
+
+        def contents(path):
+            # Config names may also refer to Tesseract's own configs/ folder
+            if path and Path(path).is_file():
+                return file_digest(path)
+            return path
+
+        return (
+            tess.oem,
+            tess.pagesegmode,
+            int(tess.thresholding),
+            [contents(config) for config in tess.config],
+            contents(tess.user_words),
+            contents(tess.user_patterns),
+            os.environ.get('TESSDATA_PREFIX'),
+        )
+
     @staticmethod
     def generate_hocr(input_file, output_hocr, output_text, options):
-        tesseract.generate_hocr(
+        _HOCR_BATCHER.generate_hocr(
+            # Only worker threads of one process can share a batch
+            batch_size=options.tesseract.batch_size if options.use_threads else 1,
             input_file=input_file,
             output_hocr=output_hocr,
             output_text=output_text,
-            languages=options.languages,
-            engine_mode=options.tesseract.oem,
-            tessconfig=options.tesseract.config,
-            timeout=options.tesseract.timeout,
-            pagesegmode=options.tesseract.pagesegmode,
-            thresholding=options.tesseract.thresholding,
-            user_words=options.tesseract.user_words,
-            user_patterns=options.tesseract.user_patterns,
-            omp_thread_limit=options.tesseract.omp_thread_limit,
+            **_hocr_settings(options),
         )
 
+    @classmethod
+    def supports_generate_ocr(cls) -> bool:
+        # Plugins that subclass this engine to customize generate_hocr, but not
+        # generate_ocr, expect the fpdf2 renderer to call generate_hocr
+        return (
+            cls.generate_hocr is TesseractOcrEngine.generate_hocr
+            or cls.generate_ocr is not TesseractOcrEngine.generate_ocr
+        )
+
+    @staticmethod
+    def generate_ocr(input_file: Path, options, page_number: int = 0):
+        return _generate_ocr(input_file, options, page_number)
+
     @staticmethod
     def generate_pdf(input_file, output_pdf, output_text, options):
         tesseract.generate_pdf(
@@ -470,6 +604,137 @@ class TesseractOcrEngine(OcrEngine):
         )
 
 
+def _empty_page(input_file: Path) -> OcrElement:
+    with Image.open(input_file) as im:
+        return OcrElement(
+            ocr_class=OcrClass.PAGE,
+            bbox=BoundingBox(left=0, top=0, right=im.width, bottom=im.height),
+            dpi=im.info.get('dpi', (0, 0))[0] or None,
+        )
+
+
+def _generate_ocr(
+    input_file: Path, options, page_number: int, **overrides
+) -> tuple[OcrElement, str]:
+    """OCR a page with the tesseract program, parsing its hOCR in this worker.
+
+    Tesseract writes the hOCR to a pipe, unless pages are being batched, which
+    requires one file per page. ``overrides`` replace arguments of
+    :func:`tesseract.generate_hocr` that are set by the options.
+    """
+    settings = _hocr_settings(options) | overrides
+    batch_size = options.tesseract.batch_size if options.use_threads else 1
+    text = None
+    if batch_size > 1:
+        with TemporaryDirectory(dir=input_file.parent) as tmpdir:
+            hocr_file = Path(tmpdir) / 'ocr.hocr'
+            text_file = Path(tmpdir) / 'ocr.txt'
+            _HOCR_BATCHER.generate_hocr(
+                batch_size=batch_size,
+                input_file=input_file,
+                output_hocr=hocr_file,
+                output_text=text_file,
+                **settings,
+            )
+            hocr = hocr_file.read_bytes() or None
+            text = text_file.read_text(encoding='utf-8')
+    else:
+        hocr = tesseract.generate_hocr_stdout(input_file=input_file, **settings)
+
+    if hocr is None:
+        # The page timed out or was too large or empty
+        page, text = _empty_page(input_file), SKIPPED_PAGE_TEXT
+    else:
+        page = HocrParser(BytesIO(hocr)).parse()
+    page.page_number = page_number
+    return page, text if text is not None else tree_text(page)
+
+
+# Tesseract page segmentation mode for an image containing a single text line
+_PSM_SINGLE_LINE = 7
+
+
+class TwoTierTesseractOcrEngine(TesseractOcrEngine):
+    """Implements OCR with fast Tesseract models, escalating unsure lines.
+
+    Each page is OCRed with the models in ``--tesseract-fast-tessdata``. The
+    lines whose mean word confidence is below ``--tesseract-escalate-below``
+    are cropped from the page image and OCRed again, all with one Tesseract
+    process, using the default models. The words of the second OCR replace
+    those of the first if Tesseract is more confident of them.
+    """
+
+    def __str__(self):
+        return f"Tesseract OCR {TesseractOcrEngine.version()} (fast, escalating)"
+
+    @staticmethod
+    def cache_parameters(options):
+        return (
+            TesseractOcrEngine.cache_parameters(options),
+            options.tesseract.fast_tessdata,
+            options.tesseract.escalate_below,
+        )
+
+    @staticmethod
+    def generate_ocr(input_file: Path, options, page_number: int = 0):
+        tess = options.tesseract
+        page, page_text = _generate_ocr(
+            input_file, options, page_number, tessdata_dir=Path(tess.fast_tessdata)
+        )
+        lines = low_confidence_lines(page, tess.escalate_below / 100)
+        if lines:
+            with TemporaryDirectory(dir=input_file.parent) as tmpdir:
+                if TwoTierTesseractOcrEngine._escalate(
+                    input_file, lines, options, Path(tmpdir)
+                ):
+                    page_text = tree_text(page)
+        return page, page_text
+
+    @staticmethod
+    def _escalate(input_file: Path, lines, options, tmpdir: Path) -> int:
+        """OCR lines again with the default models; return how many changed."""
+        items = []
+        origins = []
+        with Image.open(input_file) as im:
+            # Without the resolution, Tesseract would guess it for each line
+            dpi = tuple(round(coord) for coord in im.info['dpi'])
+            for n, line in enumerate(lines):
+                box = line_crop_box(line, im.size)
+                line_image = tmpdir / f'line{n:06d}.png'
+                im.crop(box).save(line_image, dpi=dpi)
+                items.append(
+                    (line_image, line_image.with_suffix('.hocr'), tmpdir / f'{n}.txt')
+                )
+                origins.append(box[:2])
+        settings = _hocr_settings(options) | {'pagesegmode': _PSM_SINGLE_LINE}
+        try:
+            if len(items) == 1:
+                tesseract.generate_hocr(
+                    input_file=items[0][0],
+                    output_hocr=items[0][1],
+                    output_text=items[0][2],
+                    **settings,
+                )
+            else:
+                tesseract.generate_hocr_batch(items, **settings)
+        except (SubprocessOutputError, TimeoutExpired) as e:
+            log.warning(
+                f"Could not OCR {len(lines)} low confidence lines again ({e}); "
+                "keeping the fast OCR"
+            )
+            return 0
+        replaced = 0
+        for line, (_, line_hocr, _), origin in zip(lines, items, origins, strict=True):
+            if line_hocr.stat().st_size == 0:
+                continue
+            if replace_line_words(line, HocrParser(line_hocr).parse(), origin):
+                replaced += 1
+        log.debug(
+            f"OCRed {len(lines)} low confidence lines again, replacing {replaced}"
+        )
+        return replaced
+
+
 @hookimpl
 def get_ocr_engine(options):
     """Return TesseractOcrEngine when selected or as default."""
@@ -478,4 +743,7 @@ def get_ocr_engine(options):
         # Tesseract is selected if explicitly requested or if 'auto'
         if ocr_engine not in ('auto', 'tesseract'):
             return None
+        tess = getattr(options, 'tesseract', None)
+        if getattr(tess, 'fast_tessdata', None):
+            return TwoTierTesseractOcrEngine()
     return TesseractOcrEngine()
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+"""Inspect and prune the folders of --raster-cache, --ocr-cache and --output-cache.
+
+Usage:
+    python -m ocrmypdf.cache info DIR
+    python -m ocrmypdf.cache list DIR
+    python -m ocrmypdf.cache prune DIR [--max-size MEGABYTES] [--older-than DAYS]
+    python -m ocrmypdf.cache clear DIR
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import sys
+from pathlib import Path
+
+from ocrmypdf._cache import CacheEntry, DiskCache
+from ocrmypdf._output_cache import describe_entry
+from ocrmypdf.cli import numeric
+
+_MEGABYTE = 1024 * 1024
+_DAY = 24 * 60 * 60
+
+
+def _megabytes(size: float) -> str:
+    return f"{size / _MEGABYTE:.1f} MB"
+
+
+def _timestamp(seconds: float) -> str:
+    return dt.datetime.fromtimestamp(seconds).isoformat(sep=' ', timespec='seconds')
+
+
+def _summary(entries: list[CacheEntry]) -> str:
+    return f"{len(entries)} entries, {_megabytes(sum(e.size for e in entries))}"
+
+
+def get_parser() -> argparse.ArgumentParser:
+    """Return the argument parser for the cache command."""
+    parser = argparse.ArgumentParser(
+        prog='python -m ocrmypdf.cache',
+        description="Inspect and prune the folders of OCRmyPDF's --raster-cache, "
+        "--ocr-cache and --output-cache. Caches may be pruned while OCRmyPDF is "
+        "using them.",
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('info', help="Show the number and size of entries")
+    commands.add_parser(
+        'list',
+        help="List entries, least recently used first, with the input file "
+        "of each --output-cache entry",
+    )
+    prune = commands.add_parser(
+        'prune', help="Delete least recently used or old entries"
+    )
+    prune.add_argument(
+        '--max-size',
+        type=numeric(float, 0.0),
+        metavar='MEGABYTES',
+        help="Delete least recently used entries until the cache is no larger "
+        "than this.",
+    )
+    prune.add_argument(
+        '--older-than',
+        type=numeric(float, 0.0),
+        metavar='DAYS',
+        help="Delete entries that have not been used for this many days.",
+    )
+    commands.add_parser('clear', help="Delete all entries")
+    for subparser in commands.choices.values():
+        subparser.add_argument('cache_folder', type=Path, metavar='DIR')
+    return parser
+
+
+def main(args: list[str] | None = None) -> int:
+    """Run the cache command."""
+    parser = get_parser()
+    ns = parser.parse_args(args)
+    if not ns.cache_folder.is_dir():
+        parser.error(f"{ns.cache_folder} is not a folder")
+    cache = DiskCache(ns.cache_folder, 0, name='cache')
+
+    if ns.command == 'info':
+        entries = cache.entries()
+        print(_summary(entries))
+        if entries:
+            print(f"Least recently used: {_timestamp(entries[0].last_used)}")
+            print(f"Most recently used: {_timestamp(entries[-1].last_used)}")
+    elif ns.command == 'list':
+        for entry in cache.entries():
+            description = describe_entry(entry.path) or ''
+            print(
+                f"{_timestamp(entry.last_used)}  {_megabytes(entry.size):>10}  "
+                f"{entry.key}  {description}".rstrip()
+            )
+    elif ns.command == 'prune':
+        if ns.max_size is None and ns.older_than is None:
+            parser.error("prune requires --max-size or --older-than")
+        removed = cache.prune(
+            max_bytes=ns.max_size * _MEGABYTE if ns.max_size is not None else None,
+            older_than=ns.older_than * _DAY if ns.older_than is not None else None,
+        )
+        print(f"Deleted {_summary(removed)}")
+    elif ns.command == 'clear':
+        print(f"Deleted {_summary(cache.clear())}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,6 +8,7 @@ from __future__ import annotations
 import argparse
 from argparse import ArgumentParser
 from collections.abc import Callable, Mapping
+from pathlib import Path
 from typing import Any, TypeVar
 
 from ocrmypdf._defaults import DEFAULT_ROTATE_PAGES_THRESHOLD
@@ -272,7 +273,8 @@ Online documentation is located at:
         '--remove-background',
         action='store_true',
         help="Attempt to remove background from gray or color pages, setting it "
-        "to white ",
+        "to white. Useful for yellowed paper, colored stock and uneven scanner "
+        "lighting.",
     )
     preprocessing.add_argument(
         '-d',
@@ -280,6 +282,16 @@ Online documentation is located at:
         action='store_true',
         help="Deskew each page before performing OCR",
     )
+    preprocessing.add_argument(
+        '--deskew-method',
+        choices=['engine', 'projection'],
+        default='engine',
+        help="How --deskew measures the skew angle. 'engine' (the default) asks "
+        "the OCR engine, which for Tesseract means running page layout "
+        "analysis on the page. 'projection' estimates the angle from a "
+        "reduced copy of the page image, which is much faster and does not "
+        "depend on the OCR engine, but only corrects skew of up to 10 degrees.",
+    )
     preprocessing.add_argument(
         '-c',
         '--clean',
@@ -302,6 +314,16 @@ Online documentation is located at:
         help="A quoted string of arguments to pass to unpaper. Requires --clean. "
         "Example: --unpaper-args '--layout double'.",
     )
+    preprocessing.add_argument(
+        '--unpaper-batch-size',
+        metavar='PAGES',
+        type=numeric(int, 1, 100),
+        default=1,
+        help="Clean up to this many pages with one unpaper process, when pages "
+        "are being cleaned at the same time by different worker threads. "
+        "Reduces process launches, but pages in a batch are cleaned one after "
+        "another. Has no effect with --no-use-threads. Default 1 (no batching).",
+    )
     preprocessing.add_argument(
         '--oversample',
         metavar='DPI',
@@ -360,6 +382,25 @@ Online documentation is located at:
         "not be changed. If there is no existing OCR, OCR will be added. "
         "Equivalent to --mode redo.",
     )
+    ocrsettings.add_argument(
+        '--skip-text-quality',
+        type=numeric(float, 0.0, 1.0),
+        metavar='SCORE',
+        help="With --skip-text, redo OCR on pages whose existing invisible text "
+        "scores below this quality, from 0 to 1, instead of skipping them. The "
+        "score is the share of plausible words and characters in the text; "
+        "text with characters that cannot be mapped to Unicode scores 0. "
+        "Pages with only visible text are always skipped. Old OCR is replaced "
+        "as with --redo-ocr. 0.7 is a reasonable starting point.",
+    )
+    ocrsettings.add_argument(
+        '--skip-text-wordlist',
+        type=Path,
+        metavar='FILE',
+        help="Score existing text for --skip-text-quality by the share of its "
+        "words found in this file, which lists one word per line, instead of "
+        "by the form of its words.",
+    )
     ocrsettings.add_argument(
         '--skip-big',
         type=numeric(float, 0.0, 5000.0),
@@ -367,6 +408,62 @@ Online documentation is located at:
         help="Skip OCR on pages larger than the specified amount of megapixels, "
         "but include skipped pages in final output",
     )
+    ocrsettings.add_argument(
+        '--skip-blank',
+        type=numeric(float, 0.0, 100.0),
+        metavar='PERCENT',
+        help="Skip OCR on blank pages, where less than the specified percentage "
+        "of the page (e.g. 0.05) is covered by ink, but include skipped pages in "
+        "final output. Blank pages are detected from a downsampled copy of the "
+        "page image, ignoring a narrow margin around the edges.",
+    )
+    ocrsettings.add_argument(
+        '--blank-ink-level',
+        type=numeric(int, 1, 255),
+        metavar='LEVEL',
+        default=128,
+        help="For --skip-blank, pixels darker than this gray level (0 is black, "
+        "255 is white) count as ink. Default 128.",
+    )
+    ocrsettings.add_argument(
+        '--skip-blank-processing',
+        action='store_true',
+        help="For --skip-blank, also skip image processing such as --clean-final "
+        "and --remove-background on blank pages, leaving them unchanged in the "
+        "output.",
+    )
+    ocrsettings.add_argument(
+        '--detect-languages',
+        action='store_true',
+        help="When several languages are given with -l, detect the script "
+        "(writing system) of each page and OCR it with only those languages "
+        "written in that script, such as -l eng+deu+rus reading a page of "
+        "Cyrillic with rus alone. Loading fewer language models makes OCR "
+        "faster. Pages whose script cannot be detected with confidence are "
+        "OCRed with all languages.",
+    )
+    ocrsettings.add_argument(
+        '--ocr-deadline',
+        type=numeric(float, 0),
+        metavar='SECONDS',
+        help="Try to finish OCR of the whole document within this many seconds. "
+        "When pages are taking too long to meet the deadline, later pages are "
+        "processed with less effort: first without deskewing, cleaning or "
+        "background removal, then also without --oversample, with "
+        "--adaptive-ocr-resolution, with only the "
+        "--tesseract-fast-tessdata models, and with a Tesseract timeout of "
+        "their share of the remaining time. Pages processed with less effort "
+        "are listed at the end. Unlike --tesseract-timeout, which gives up on "
+        "one page, this lets most pages get some OCR rather than none.",
+    )
+    ocrsettings.add_argument(
+        '--adaptive-ocr-resolution',
+        action='store_true',
+        help="Measure the size of the text on each page and OCR it at a lower "
+        "resolution when its text is larger than OCR needs, such as 12 pt text "
+        "scanned at 600 DPI. The visible page image keeps its full resolution. "
+        "Speeds up OCR of high resolution scans.",
+    )
     ocrsettings.add_argument(
         '--invalidate-digital-signatures',
         action='store_true',
@@ -416,10 +513,13 @@ Online documentation is located at:
     )
     advanced.add_argument(
         '--ocr-engine',
-        choices=['auto', 'tesseract', 'none'],
+        choices=['auto', 'tesseract', 'libtesseract', 'none'],
         default='auto',
         help="OCR engine to use. 'auto' (default) selects the best available engine. "
         "'tesseract' uses Tesseract OCR. "
+        "'libtesseract' uses the Tesseract library within OCRmyPDF, so that "
+        "language models are loaded once per worker instead of once per page; "
+        "if the library cannot be found, the tesseract program is used. "
         "'none' skips OCR entirely, useful for PDF/A conversion or image processing "
         "without text recognition.",
     )
@@ -435,6 +535,29 @@ Online documentation is located at:
         "pypdfium2 rasterizer (requires the pypdfium2 package); 'ghostscript' "
         "forces the traditional Ghostscript rasterizer.",
     )
+    advanced.add_argument(
+        '--intermediate-image-format',
+        choices=['png', 'png-fast', 'tiff'],
+        default='png',
+        help="Encoding of the temporary page images passed between rendering, "
+        "preprocessing and OCR. These are never included in the output. 'png' "
+        "(the default) uses the least disk space; 'png-fast' uses the fastest "
+        "PNG compression; 'tiff' writes uncompressed images, which is fastest "
+        "but uses the most disk space in the temporary folder.",
+    )
+    advanced.add_argument(
+        '--ocr-image-mode',
+        choices=['color', 'gray', 'otsu', 'sauvola'],
+        default='color',
+        help="Color mode of the page images given to the OCR engine; the "
+        "visible page image is not affected. 'color' (the default) keeps the "
+        "colors of the rendered page; 'gray' converts to grayscale; 'otsu' "
+        "converts to black and white with one threshold for the whole page; "
+        "'sauvola' converts to black and white with a threshold adapted to "
+        "each region, which keeps text on shaded or unevenly lit areas. "
+        "Smaller OCR images are faster to write and read, and Tesseract skips "
+        "its own thresholding for black and white images.",
+    )
     advanced.add_argument(
         '--rotate-pages-threshold',
         default=DEFAULT_ROTATE_PAGES_THRESHOLD,
@@ -463,6 +586,83 @@ Online documentation is located at:
         "rendered, but may result in visual differences compared to the input "
         "file. Missing fonts are a typical source of these errors.",
     )
+    advanced.add_argument(
+        '--ocr-tile-size',
+        type=numeric(int, 1000, 32767),
+        metavar='PIXELS',
+        help="OCR page images larger than this many pixels in either dimension "
+        "in overlapping tiles, which are processed concurrently and merged. "
+        "Useful for posters and large drawings, which would otherwise need "
+        "to be downsampled or skipped. Tiling is only used with the fpdf2 "
+        "PDF renderer.",
+    )
+    advanced.add_argument(
+        '--ocr-batch-size',
+        metavar='PAGES',
+        type=numeric(int, 1, 100),
+        default=1,
+        help="For OCR engines that can recognize several pages in one call, "
+        "combine up to this many pages that are being OCRed at the same time "
+        "by different worker threads. Has no effect with --no-use-threads, or "
+        "with engines that OCR one page at a time, such as Tesseract (see "
+        "--tesseract-batch-size). Default 1 (no batching).",
+    )
+    advanced.add_argument(
+        '--raster-cache',
+        type=Path,
+        metavar='DIR',
+        help="Cache rendered page images in this folder and reuse them when an "
+        "identical page (same content, resources and rendering parameters) is "
+        "rasterized again, in this or a later run. Useful when many files share "
+        "cover sheets, separator pages or forms. The folder may be shared by "
+        "concurrent runs.",
+    )
+    advanced.add_argument(
+        '--raster-cache-size',
+        type=numeric(float, 0.0),
+        default=1024.0,
+        metavar='MEGABYTES',
+        help="Maximum size of the --raster-cache folder. Least recently used "
+        "page images are removed when it grows beyond this size.",
+    )
+    advanced.add_argument(
+        '--ocr-cache',
+        type=Path,
+        metavar='DIR',
+        help="Cache OCR results in this folder and reuse them when the OCR "
+        "engine is given an identical page image with the same languages and "
+        "OCR settings, in this or a later run. Rerunning a file with different "
+        "output settings, such as --optimize or --output-type, then skips OCR. "
+        "The folder may be shared by concurrent runs. Clear it after replacing "
+        "the OCR engine's language data without changing its version.",
+    )
+    advanced.add_argument(
+        '--ocr-cache-size',
+        type=numeric(float, 0.0),
+        default=1024.0,
+        metavar='MEGABYTES',
+        help="Maximum size of the --ocr-cache folder. Least recently used "
+        "results are removed when it grows beyond this size.",
+    )
+    advanced.add_argument(
+        '--output-cache',
+        type=Path,
+        metavar='DIR',
+        help="Cache output files in this folder. When an identical input file "
+        "is processed again with the same options, plugins and versions of "
+        "OCRmyPDF, the OCR engine and Ghostscript, the cached output file and "
+        "sidecar are copied instead of processing the file. Outputs written to "
+        "standard output are not cached. The folder may be shared by "
+        "concurrent runs. Use 'python -m ocrmypdf.cache' to inspect or prune it.",
+    )
+    advanced.add_argument(
+        '--output-cache-size',
+        type=numeric(float, 0.0),
+        default=1024.0,
+        metavar='MEGABYTES',
+        help="Maximum size of the --output-cache folder. Least recently used "
+        "outputs are removed when it grows beyond this size.",
+    )
     advanced.add_argument(
         '--plugin',
         dest='plugins',
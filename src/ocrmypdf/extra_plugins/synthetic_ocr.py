@@ -0,0 +1,436 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+r"""Synthetic OCR engine, for benchmarking the pipeline without real OCR.
+
+The engine takes a configurable, random amount of time to "OCR" each page,
+either sleeping (like an engine that runs in another process) or keeping a CPU
+busy (like an engine that runs in Python), and returns made up words laid out
+in lines across the page, so that rendering the text layer and grafting it
+take as long as for a real page of text. Pages can be made to fail or time out
+at random.
+
+Results are random but reproducible: they depend only on ``--synthetic-seed``
+and the page number, not on which worker processes the page or when.
+
+Usage:
+    ocrmypdf --plugin ocrmypdf.extra_plugins.synthetic_ocr \
+        --synthetic-latency 2 --synthetic-cpu-fraction 0.5 input.pdf output.pdf
+
+When this plugin is loaded, it is used instead of the ``--ocr-engine``, and
+Tesseract need not be installed.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import random
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Annotated, Literal
+
+from PIL import Image
+from pydantic import BaseModel, Field
+
+from ocrmypdf import hookimpl
+from ocrmypdf._ocr_cache import SKIPPED_PAGE_TEXT
+from ocrmypdf._options import OcrOptions
+from ocrmypdf._tiles import tree_text
+from ocrmypdf._version import __version__
+from ocrmypdf.cli import numeric
+from ocrmypdf.exceptions import BadArgsError, SubprocessOutputError
+from ocrmypdf.hocrtransform import Baseline, BoundingBox, OcrClass, OcrElement
+from ocrmypdf.pluginspec import OcrEngine, OrientationConfidence
+
+log = logging.getLogger(__name__)
+
+_WORDS = (  # noqa: SIM905
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua enim ad minim veniam quis nostrud "
+    "exercitation ullamco laboris nisi aliquip ex ea commodo consequat duis aute "
+    "irure in reprehenderit voluptate velit esse cillum fugiat nulla pariatur"
+).split()
+
+# Layout of the synthetic text, in points: 10 pt type on 15 pt lines, within
+# 1 inch margins
+_FONT_SIZE = 10.0
+_LINE_PITCH = 15.0
+_MARGIN = 72.0
+_LINES_PER_PARAGRAPH = 8
+
+# Shape of the lognormal latency distribution
+_LOGNORMAL_SIGMA = 0.5
+
+
+class SyntheticOcrOptions(BaseModel):
+    """Options for the synthetic OCR engine."""
+
+    latency: Annotated[
+        float, Field(ge=0, description="Mean seconds to OCR each page")
+    ] = 0.5
+    distribution: Annotated[
+        Literal['fixed', 'uniform', 'exponential', 'lognormal'],
+        Field(description="Distribution of the time to OCR each page"),
+    ] = 'lognormal'
+    cpu_fraction: Annotated[
+        float,
+        Field(ge=0, le=1, description="Share of OCR time spent keeping a CPU busy"),
+    ] = 0.0
+    call_overhead: Annotated[
+        float, Field(ge=0, description="Seconds of setup for each call to the engine")
+    ] = 0.0
+    word_density: Annotated[
+        float, Field(ge=0, description="Words per square inch of page")
+    ] = 4.0
+    failure_rate: Annotated[
+        float, Field(ge=0, le=1, description="Probability that OCR of a page fails")
+    ] = 0.0
+    timeout_rate: Annotated[
+        float, Field(ge=0, le=1, description="Probability that a page times out")
+    ] = 0.0
+    timeout: Annotated[
+        float, Field(ge=0, description="Seconds after which OCR of a page times out")
+    ] = 180.0
+    seed: Annotated[int, Field(description="Seed for all random choices")] = 0
+
+    @classmethod
+    def add_arguments_to_parser(cls, parser, namespace: str = 'synthetic'):
+        """Add the synthetic OCR engine's arguments to the argument parser."""
+        synthetic = parser.add_argument_group(
+            "Synthetic OCR", "Benchmarking OCR engine that simulates OCR"
+        )
+        synthetic.add_argument(
+            f'--{namespace}-latency',
+            type=numeric(float, 0),
+            metavar='SECONDS',
+            dest=f'{namespace}_latency',
+            help="Mean time to OCR each page. Default 0.5.",
+        )
+        synthetic.add_argument(
+            f'--{namespace}-distribution',
+            choices=['fixed', 'uniform', 'exponential', 'lognormal'],
+            dest=f'{namespace}_distribution',
+            help="Distribution of the time to OCR each page: the same for every "
+            "page, uniform from zero to twice the mean, exponential, or "
+            "lognormal (the default), which has occasional slow pages.",
+        )
+        synthetic.add_argument(
+            f'--{namespace}-cpu-fraction',
+            type=numeric(float, 0, 1),
+            metavar='FRACTION',
+            dest=f'{namespace}_cpu_fraction',
+            help="Share of the time to OCR a page spent keeping a CPU busy, in "
+            "Python, rather than sleeping. 0 (the default) behaves like an "
+            "engine that runs in another process; 1 like one that runs in "
+            "Python and holds the GIL.",
+        )
+        synthetic.add_argument(
+            f'--{namespace}-call-overhead',
+            type=numeric(float, 0),
+            metavar='SECONDS',
+            dest=f'{namespace}_call_overhead',
+            help="Time spent on each call to the engine, as if loading models, "
+            "whether it OCRs one page or a batch (see --ocr-batch-size).",
+        )
+        synthetic.add_argument(
+            f'--{namespace}-word-density',
+            type=numeric(float, 0),
+            metavar='WORDS',
+            dest=f'{namespace}_word_density',
+            help="Number of words to output per square inch of page. Default 4, "
+            "about a full page of text.",
+        )
+        synthetic.add_argument(
+            f'--{namespace}-failure-rate',
+            type=numeric(float, 0, 1),
+            metavar='FRACTION',
+            dest=f'{namespace}_failure_rate',
+            help="Probability that OCR of a page fails with an error, which "
+            "stops processing as a crash of the OCR engine would.",
+        )
+        synthetic.add_argument(
+            f'--{namespace}-timeout-rate',
+            type=numeric(float, 0, 1),
+            metavar='FRACTION',
+            dest=f'{namespace}_timeout_rate',
+            help="Probability that OCR of a page times out. Pages also time out "
+            f"when they would take longer than --{namespace}-timeout.",
+        )
+        synthetic.add_argument(
+            f'--{namespace}-timeout',
+            type=numeric(float, 0),
+            metavar='SECONDS',
+            dest=f'{namespace}_timeout',
+            help="Time after which OCR of a page gives up, and the page is left "
+            "without text. Default 180.",
+        )
+        synthetic.add_argument(
+            f'--{namespace}-seed',
+            type=int,
+            dest=f'{namespace}_seed',
+            help="Seed for the random latencies, words and failures. Default 0.",
+        )
+
+
+def page_latency(rng: random.Random, settings: SyntheticOcrOptions) -> float:
+    """Draw the time to OCR a page from the configured distribution."""
+    mean = settings.latency
+    if mean == 0 or settings.distribution == 'fixed':
+        return mean
+    if settings.distribution == 'uniform':
+        return rng.uniform(0, 2 * mean)
+    if settings.distribution == 'exponential':
+        return rng.expovariate(1 / mean)
+    mu = math.log(mean) - _LOGNORMAL_SIGMA**2 / 2
+    return rng.lognormvariate(mu, _LOGNORMAL_SIGMA)
+
+
+def spend(seconds: float, cpu_fraction: float) -> None:
+    """Take ``seconds``, keeping a CPU busy for ``cpu_fraction`` of them."""
+    busy_until = time.perf_counter() + seconds * cpu_fraction
+    while time.perf_counter() < busy_until:
+        sum(range(1000))
+    time.sleep(seconds * (1 - cpu_fraction))
+
+
+def synthetic_page(
+    rng: random.Random,
+    size: tuple[int, int],
+    dpi: float,
+    word_density: float,
+    page_number: int = 0,
+) -> OcrElement:
+    """Lay out made up words in lines of text across a page image.
+
+    Args:
+        rng: Source of the random words.
+        size: Size of the page image in pixels.
+        dpi: Resolution of the page image.
+        word_density: Number of words per square inch of page.
+        page_number: Page number to store in the result.
+    """
+    width, height = size
+    scale = dpi / 72.0
+    margin = min(_MARGIN * scale, width / 10, height / 10)
+    line_height = _FONT_SIZE * scale
+    char_width = line_height / 2
+    space = char_width
+    words_left = round(word_density * (width / dpi) * (height / dpi))
+
+    paragraphs: list[OcrElement] = []
+    lines: list[OcrElement] = []
+    top = margin
+    while words_left > 0 and top + line_height <= height - margin:
+        words: list[OcrElement] = []
+        left = margin
+        while words_left > 0:
+            text = rng.choice(_WORDS)
+            right = left + len(text) * char_width
+            if right > width - margin:
+                break
+            words.append(
+                OcrElement(
+                    ocr_class=OcrClass.WORD,
+                    bbox=BoundingBox(
+                        left=left, top=top, right=right, bottom=top + line_height
+                    ),
+                    text=text,
+                    confidence=rng.uniform(0.6, 1.0),
+                )
+            )
+            words_left -= 1
+            left = right + space
+        if not words:
+            break
+        lines.append(
+            OcrElement(
+                ocr_class=OcrClass.LINE,
+                bbox=BoundingBox(
+                    left=margin,
+                    top=top,
+                    right=words[-1].bbox.right,
+                    bottom=top + line_height,
+                ),
+                baseline=Baseline(slope=0.0, intercept=-round(line_height / 5)),
+                children=words,
+            )
+        )
+        if len(lines) == _LINES_PER_PARAGRAPH:
+            paragraphs.append(_paragraph(lines))
+            lines = []
+        top += _LINE_PITCH * scale
+    if lines:
+        paragraphs.append(_paragraph(lines))
+    return OcrElement(
+        ocr_class=OcrClass.PAGE,
+        bbox=BoundingBox(left=0, top=0, right=width, bottom=height),
+        dpi=dpi,
+        page_number=page_number,
+        children=paragraphs,
+    )
+
+
+def _paragraph(lines: list[OcrElement]) -> OcrElement:
+    return OcrElement(
+        ocr_class=OcrClass.PARAGRAPH,
+        bbox=BoundingBox(
+            left=min(line.bbox.left for line in lines if line.bbox),
+            top=min(line.bbox.top for line in lines if line.bbox),
+            right=max(line.bbox.right for line in lines if line.bbox),
+            bottom=max(line.bbox.bottom for line in lines if line.bbox),
+        ),
+        children=lines,
+    )
+
+
+class SyntheticOcrEngine(OcrEngine):
+    """An OCR engine that simulates the time and output of real OCR."""
+
+    @staticmethod
+    def version() -> str:
+        """Return the OCRmyPDF version."""
+        return __version__
+
+    @staticmethod
+    def creator_tag(options: OcrOptions) -> str:
+        """Return creator tag for PDF metadata."""
+        return f"OCRmyPDF synthetic OCR {__version__} (not real OCR)"
+
+    def __str__(self) -> str:
+        """Return human-readable engine name."""
+        return "Synthetic OCR"
+
+    @staticmethod
+    def languages(options: OcrOptions) -> set[str]:
+        """Return supported languages (empty set, so any language is accepted)."""
+        return set()
+
+    @staticmethod
+    def get_orientation(input_file: Path, options: OcrOptions) -> OrientationConfidence:
+        """Return neutral orientation (no rotation detected)."""
+        return OrientationConfidence(angle=0, confidence=0.0)
+
+    @staticmethod
+    def get_deskew(input_file: Path, options: OcrOptions) -> float:
+        """Return zero deskew angle."""
+        return 0.0
+
+    @staticmethod
+    def supports_generate_ocr() -> bool:
+        """Return True - this engine supports the generate_ocr() API."""
+        return True
+
+    @staticmethod
+    def _ocr_page(
+        input_file: Path, settings: SyntheticOcrOptions, page_number: int
+    ) -> tuple[OcrElement, str]:
+        rng = random.Random(f'{settings.seed}:{page_number}')
+        latency = page_latency(rng, settings)
+        timed_out = rng.random() < settings.timeout_rate or latency > settings.timeout
+        failed = rng.random() < settings.failure_rate
+        spend(settings.timeout if timed_out else latency, settings.cpu_fraction)
+        with Image.open(input_file) as im:
+            size = im.size
+            dpi = float(im.info.get('dpi', (72, 72))[0])
+        if timed_out:
+            log.warning("[synthetic] took too long to OCR - skipping")
+            empty = OcrElement(
+                ocr_class=OcrClass.PAGE,
+                bbox=BoundingBox(left=0, top=0, right=size[0], bottom=size[1]),
+                dpi=dpi,
+                page_number=page_number,
+            )
+            return empty, SKIPPED_PAGE_TEXT
+        if failed:
+            raise SubprocessOutputError(
+                f"Synthetic OCR failure on page {page_number + 1}"
+            )
+        page = synthetic_page(rng, size, dpi, settings.word_density, page_number)
+        return page, tree_text(page)
+
+    @staticmethod
+    def generate_ocr(
+        input_file: Path,
+        options: OcrOptions,
+        page_number: int = 0,
+    ) -> tuple[OcrElement, str]:
+        """Simulate OCR of one page image."""
+        settings = options.synthetic
+        spend(settings.call_overhead, settings.cpu_fraction)
+        return SyntheticOcrEngine._ocr_page(input_file, settings, page_number)
+
+    @staticmethod
+    def supports_generate_ocr_batch() -> bool:
+        """Return True - this engine supports the generate_ocr_batch() API."""
+        return True
+
+    @staticmethod
+    def generate_ocr_batch(
+        input_files: Sequence[Path],
+        options: OcrOptions,
+        page_numbers: Sequence[int],
+    ) -> list[tuple[OcrElement, str]]:
+        """Simulate OCR of several page images, with one call overhead."""
+        settings = options.synthetic
+        spend(settings.call_overhead, settings.cpu_fraction)
+        return [
+            SyntheticOcrEngine._ocr_page(input_file, settings, page_number)
+            for input_file, page_number in zip(input_files, page_numbers, strict=True)
+        ]
+
+    @staticmethod
+    def generate_hocr(
+        input_file: Path,
+        output_hocr: Path,
+        output_text: Path,
+        options: OcrOptions,
+    ) -> None:
+        """Not supported - use pdf_renderer='fpdf2'."""
+        raise NotImplementedError(
+            "The synthetic OCR engine only supports the fpdf2 PDF renderer"
+        )
+
+    @staticmethod
+    def generate_pdf(
+        input_file: Path,
+        output_pdf: Path,
+        output_text: Path,
+        options: OcrOptions,
+    ) -> None:
+        """Not supported - use pdf_renderer='fpdf2'."""
+        raise NotImplementedError(
+            "The synthetic OCR engine only supports the fpdf2 PDF renderer"
+        )
+
+
+@hookimpl
+def register_options():
+    """Register the synthetic OCR engine's option model."""
+    return {'synthetic': SyntheticOcrOptions}
+
+
+@hookimpl
+def add_options(parser):
+    """Add the synthetic OCR engine's command line options."""
+    SyntheticOcrOptions.add_arguments_to_parser(parser)
+
+
+@hookimpl(tryfirst=True)
+def check_options(options):
+    """Check the synthetic OCR engine's options, and select the engine."""
+    if options.pdf_renderer == 'sandwich':
+        raise BadArgsError(
+            "The synthetic OCR engine only supports the fpdf2 PDF renderer"
+        )
+    # Validate the synthetic OCR options now rather than on the first page
+    _ = options.synthetic
+    # Tell the other OCR engine plugins that they are not used, so that they
+    # do not check for their dependencies
+    options.ocr_engine = 'synthetic'
+
+
+@hookimpl
+def get_ocr_engine(options):
+    """Use the synthetic OCR engine whenever this plugin is loaded."""
+    return SyntheticOcrEngine()
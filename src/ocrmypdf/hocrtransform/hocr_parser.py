@@ -19,7 +19,7 @@ import os
 import re
 import unicodedata
 from pathlib import Path
-from typing import Literal, cast
+from typing import BinaryIO, Literal, cast
 from xml.etree import ElementTree as ET
 
 from ocrmypdf.models.ocr_element import (
@@ -121,18 +121,20 @@ class HocrParser:
         re.VERBOSE,
     )
 
-    def __init__(self, hocr_file: str | Path):
+    def __init__(self, hocr_file: str | Path | BinaryIO):
         """Initialize the parser with an hOCR file.
 
         Args:
-            hocr_file: Path to the hOCR file to parse
+            hocr_file: Path to the hOCR file to parse, or a binary file object
+                such as :class:`io.BytesIO` holding the hOCR
 
         Raises:
             HocrParseError: If the file cannot be parsed
         """
-        self._hocr_path = Path(hocr_file)
+        if not hasattr(hocr_file, 'read'):
+            hocr_file = os.fspath(hocr_file)
         try:
-            self._tree = ET.parse(os.fspath(hocr_file))
+            self._tree = ET.parse(hocr_file)
         except ET.ParseError as e:
             raise HocrParseError(f"Failed to parse hOCR file: {e}") from e
 
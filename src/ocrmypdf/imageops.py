@@ -6,13 +6,43 @@
 from __future__ import annotations
 
 import logging
-from math import floor, sqrt
+from itertools import pairwise
+from math import cos, floor, radians, sin, sqrt
+from typing import Any, NamedTuple
 
-from PIL import Image
+from PIL import Image, ImageChops, ImageColor, ImageFilter, ImageMath, ImageOps
 
 log = logging.getLogger(__name__)
 
 
+class IntermediateImageFormat(NamedTuple):
+    """How to encode page images that are only used during processing."""
+
+    suffix: str
+    """File suffix for the images."""
+
+    format: str
+    """Pillow format name."""
+
+    params: dict[str, Any]
+    """Extra parameters for :meth:`PIL.Image.Image.save`."""
+
+
+INTERMEDIATE_IMAGE_FORMATS: dict[str, IntermediateImageFormat] = {
+    # Pillow's default zlib level: smallest files, slowest to write
+    'png': IntermediateImageFormat('.png', 'PNG', {}),
+    # Fastest zlib level; files are typically 10-30% larger
+    'png-fast': IntermediateImageFormat('.png', 'PNG', {'compress_level': 1}),
+    # No compression at all; files are several times larger
+    'tiff': IntermediateImageFormat('.tif', 'TIFF', {'compression': 'raw'}),
+}
+
+
+def intermediate_image_format(name: str | None) -> IntermediateImageFormat:
+    """Look up an intermediate image format by name; None means the default."""
+    return INTERMEDIATE_IMAGE_FORMATS[name or 'png']
+
+
 def bytes_per_pixel(mode: str) -> int:
     """Return the number of padded bytes per pixel for a given PIL image mode.
 
@@ -114,38 +144,553 @@ def calculate_downsample(
     )
 
 
+# Bits per pixel of the uncompressed raw modes that can be read a few rows at a
+# time, straight from the file
+_RAW_ROW_BITS = {'1': 1, '1;I': 1, 'L': 8, 'RGB': 24, 'RGBX': 32, 'CMYK': 32}
+
+# Modes that Image.reduce() supports without premultiplying alpha
+_REDUCIBLE_MODES = frozenset({'L', 'RGB', 'RGBX', 'CMYK', 'I', 'F'})
+
+
+class _RawRows(NamedTuple):
+    top: int
+    bottom: int
+    offset: int
+    rawmode: str
+    stride: int
+
+
+def _raw_rows(image: Image.Image) -> list[_RawRows] | None:
+    """Locate the rows of an image that is stored uncompressed and not yet loaded.
+
+    Uncompressed TIFF and PNM files, such as our intermediate images, store
+    whole rows of pixels one after another. Returns None for any other image.
+    """
+    if not getattr(image, 'tile', None) or getattr(image, 'fp', None) is None:
+        return None
+    strips = []
+    for codec, extents, offset, args in image.tile:
+        if codec != 'raw' or extents is None:
+            return None
+        if isinstance(args, str):
+            rawmode, stride, orientation = args, 0, 1
+        else:
+            rawmode, stride, orientation = (*args, 0, 1)[:3]
+        left, top, right, bottom = extents
+        if (
+            rawmode not in _RAW_ROW_BITS
+            or orientation != 1
+            or (left, right) != (0, image.width)
+        ):
+            return None
+        stride = stride or (image.width * _RAW_ROW_BITS[rawmode] + 7) // 8
+        strips.append(_RawRows(top, bottom, offset, rawmode, stride))
+    return strips
+
+
+def _read_rows(
+    image: Image.Image, raw: list[_RawRows] | None, top: int, bottom: int
+) -> Image.Image:
+    """Return rows ``top`` to ``bottom`` of an image.
+
+    If the image is stored as raw rows, only the requested rows are read from
+    the file. Otherwise the whole image is decoded, once, and cropped.
+    """
+    if raw is None:
+        return image.crop((0, top, image.width, bottom))
+    fp = image.fp  # type: ignore[attr-defined]
+    parts = []
+    for strip in raw:
+        first, last = max(top, strip.top), min(bottom, strip.bottom)
+        if first >= last:
+            continue
+        fp.seek(strip.offset + (first - strip.top) * strip.stride)
+        data = fp.read((last - first) * strip.stride)
+        part = Image.frombytes(
+            image.mode,
+            (image.width, last - first),
+            data,
+            'raw',
+            strip.rawmode,
+            strip.stride,
+        )
+        parts.append((first - top, part))
+    if len(parts) == 1:
+        return parts[0][1]
+    rows = Image.new(image.mode, (image.width, bottom - top))
+    for y, part in parts:
+        rows.paste(part, (0, y))
+    return rows
+
+
 def downsample_image(
     image: Image.Image,
     new_size: tuple[int, int],
     *,
     resample_mode: Image.Resampling = Image.Resampling.BICUBIC,
     reducing_gap: int = 3,
+    mode: str | None = None,
+    strip_height: int = 128,
 ) -> Image.Image:
     """Downsample an image to fit within the given limits.
 
     The DPI is adjusted to match the new size, which is how we can ensure the
     OCR is positioned correctly.
 
+    The image is downsampled in horizontal strips, so that memory use is
+    proportional to the output rather than the input. If the image was opened
+    but not loaded yet, the input is decoded in strips too, when possible:
+    JPEG images are decoded at reduced scale, and uncompressed TIFF and PNM
+    images are read a few rows at a time. Other images are decoded in full.
+
     Args:
         image: The image to downsample
         new_size: The new size of the image.
         resample_mode: The resampling mode to use when downsampling.
         reducing_gap: The reducing gap to use when downsampling (for larger
             reductions).
+        mode: If given, convert the image to this mode before resampling.
+        strip_height: Number of output rows to produce at a time.
     """
     if new_size == image.size:
+        if mode is not None and mode != image.mode:
+            return image.convert(mode)
         return image
 
     original_size = image.size
     original_dpi = image.info['dpi']
-    image = image.resize(
-        new_size,
-        resample=resample_mode,
-        reducing_gap=reducing_gap,
-    )
-    image.info['dpi'] = (
+    info = dict(image.info)
+    if getattr(image, 'tile', None) and image.format == 'JPEG':
+        # Let the JPEG decoder do as much of the reduction as it can
+        image.draft(mode, new_size)
+
+    out_mode = mode or image.mode
+    resample = resample_mode
+    if out_mode in ('1', 'P'):
+        resample = Image.Resampling.NEAREST  # as Image.resize() would
+    scale_x = image.width / new_size[0]
+    scale_y = image.height / new_size[1]
+    factor_x = factor_y = 1
+    if reducing_gap and out_mode in _REDUCIBLE_MODES:
+        factor_x = max(1, int(scale_x / reducing_gap))
+        factor_y = max(1, int(scale_y / reducing_gap))
+    # Input rows on either side of each strip that the filter can reach
+    margin = factor_y * (int(2 * scale_y / factor_y) + 2)
+
+    raw = _raw_rows(image)
+    result = Image.new(out_mode, new_size)
+    for out_top in range(0, new_size[1], strip_height):
+        out_bottom = min(out_top + strip_height, new_size[1])
+        # Align to the reduction factor so that every strip is reduced on the
+        # same grid as the whole image would be
+        top = max(0, floor(out_top * scale_y) - margin) // factor_y * factor_y
+        bottom = min(image.height, floor(out_bottom * scale_y) + margin + 1)
+        rows = _read_rows(image, raw, top, bottom)
+        if mode is not None and rows.mode != mode:
+            rows = rows.convert(mode)
+        if (factor_x, factor_y) != (1, 1):
+            rows = rows.reduce((factor_x, factor_y))
+        box = (
+            0.0,
+            (out_top * scale_y - top) / factor_y,
+            image.width / factor_x,
+            (out_bottom * scale_y - top) / factor_y,
+        )
+        strip = rows.resize(
+            (new_size[0], out_bottom - out_top), resample=resample, box=box
+        )
+        result.paste(strip, (0, out_top))
+    if result.mode == 'P' and strip.palette is not None:
+        result.putpalette(strip.palette)
+
+    result.info = info
+    result.info['dpi'] = (
         round(original_dpi[0] * new_size[0] / original_size[0]),
         round(original_dpi[1] * new_size[1] / original_size[1]),
     )
-    log.debug(f"Rescaled image to {image.size} pixels and {image.info['dpi']} dpi")
-    return image
+    log.debug(f"Rescaled image to {result.size} pixels and {result.info['dpi']} dpi")
+    return result
+
+
+def _projection_sharpness(image: Image.Image, angle: float) -> int:
+    """Score how well the rows of ``image`` line up when rotated by ``angle``.
+
+    The image is rotated and reduced to a single column of row averages. When
+    text lines are horizontal, rows alternate sharply between ink and gaps, so
+    adjacent rows differ the most.
+    """
+    rotated = image.rotate(angle, resample=Image.Resampling.NEAREST)
+    profile = rotated.resize((1, rotated.height), Image.Resampling.BOX).tobytes()
+    return sum((a - b) ** 2 for a, b in pairwise(profile))
+
+
+def estimate_skew(
+    image: Image.Image, *, max_angle: float = 10.0, working_size: int = 800
+) -> float:
+    """Estimate the skew of a page image from its horizontal projection profile.
+
+    Candidate angles are tried coarse to fine on a reduced copy of the image,
+    and the angle that makes text lines most nearly horizontal is returned.
+    This is not a substitute for orientation detection: only skew of up to
+    ``max_angle`` degrees is found.
+
+    Args:
+        image: The page image. Any mode is accepted.
+        max_angle: Largest skew angle to consider, in degrees.
+        working_size: Approximate size in pixels of the longer side of the
+            reduced image that is analyzed.
+
+    Returns:
+        The angle in degrees to pass to :meth:`PIL.Image.Image.rotate` to
+        deskew the image, that is, counterclockwise is positive. 0.0 if the
+        image has no content.
+    """
+    gray = image.convert('L')
+    factor = max(1, max(gray.size) // working_size)
+    ink = ImageOps.invert(gray.reduce(factor))
+    if ink.getbbox() is None:
+        return 0.0
+
+    scores: dict[float, int] = {}
+
+    def best_of(candidates):
+        # Sort so that ties (e.g. an image with no lines) favor the smallest
+        # correction
+        for angle in candidates:
+            if angle not in scores:
+                scores[angle] = _projection_sharpness(ink, angle)
+        return max(sorted(candidates, key=abs), key=scores.__getitem__)
+
+    limit = floor(max_angle)
+    best = best_of([float(a) for a in range(-limit, limit + 1)])
+    for step in (0.25, 0.05):
+        best = best_of([round(best + n * step, 2) for n in range(-4, 5)])
+    log.debug(f"Projection profile skew angle: {best:.2f}")
+    return best
+
+
+def ink_coverage(
+    image: Image.Image, *, ink_level: int = 128, margin: float = 0.05
+) -> float:
+    """Return the fraction of a page image that is covered by ink.
+
+    Pixels darker than ``ink_level`` count as ink. A margin around the edges of
+    the page is ignored, since scanners often leave dark borders and shadows
+    there, even on blank pages.
+
+    Args:
+        image: The page image; a downsampled copy is accurate enough.
+        ink_level: Gray level (0 is black, 255 is white) below which a pixel
+            counts as ink.
+        margin: Fraction of the width and height to ignore on each side.
+    """
+    gray = image if image.mode == 'L' else image.convert('L')
+    dx, dy = round(gray.width * margin), round(gray.height * margin)
+    histogram = gray.crop((dx, dy, gray.width - dx, gray.height - dy)).histogram()
+    total = sum(histogram)
+    if total == 0:
+        return 0.0
+    return sum(histogram[:ink_level]) / total
+
+
+def text_line_height(
+    image: Image.Image, dpi: float, *, strips: int = 4, min_lines: int = 5
+) -> float | None:
+    """Estimate the height of the smaller lines of text on a page image.
+
+    The image is reduced to about 100 DPI and cut into vertical strips, so
+    that lines of neighboring columns need not be aligned. In each strip, runs
+    of rows containing ink are taken to be lines of text. Headings, figures
+    and lines that touch make some runs taller than the body text, so the
+    lower quartile of the run heights is returned rather than the median.
+
+    Args:
+        image: The page image.
+        dpi: Its resolution.
+        strips: Number of vertical strips to measure separately.
+        min_lines: Fewest lines of text needed for an estimate.
+
+    Returns:
+        The line height in pixels of ``image``, or None if too few lines of
+        text were found.
+    """
+    factor = max(1, floor(dpi / 100))
+    gray = image if image.mode == 'L' else image.convert('L')
+    if factor > 1:
+        gray = gray.reduce(factor)
+    # Ink is white, so that each row's mean is its ink coverage
+    ink = ImageOps.invert(ImageOps.autocontrast(gray)).point(
+        lambda v: 255 if v > 127 else 0
+    )
+    heights = []
+    strip_width = max(ink.width // strips, 1)
+    for left in range(0, ink.width - strip_width + 1, strip_width):
+        strip = ink.crop((left, 0, left + strip_width, ink.height))
+        # Rows with at least 1% of their pixels inked contain text
+        profile = strip.resize((1, ink.height), Image.Resampling.BOX).tobytes()
+        run = 0
+        for value in [*profile, 0]:
+            if value >= 3:
+                run += 1
+                continue
+            if run >= 2:
+                heights.append(run)
+            run = 0
+    if len(heights) < min_lines:
+        return None
+    heights.sort()
+    return heights[len(heights) // 4] * factor
+
+
+def _estimate_background(image: Image.Image, dpi: float) -> Image.Image:
+    """Estimate the paper color of a page image, at low resolution.
+
+    The image is reduced to cells about 1 mm across. Taking the local maximum
+    over several cells removes text and line art, which are darker than the
+    paper around them, and blurring smooths the result.
+    """
+    factor = max(1, round(dpi / 24))
+    background = image.reduce(factor)
+    background = background.filter(ImageFilter.MaxFilter(7))
+    background = background.filter(ImageFilter.GaussianBlur(2))
+    # Avoid dividing by zero on pages with large, solid black regions
+    return background.point(lambda v: max(v, 1))
+
+
+def remove_background(
+    image: Image.Image,
+    *,
+    dpi: float = 300.0,
+    black_threshold: int = 70,
+    white_threshold: int = 190,
+    strip_height: int = 256,
+) -> Image.Image:
+    """Normalize the background of a grayscale or color page image to white.
+
+    A smooth estimate of the background (yellowed paper, gray stock, uneven
+    scanner lighting) is divided out of each channel, and then levels are
+    stretched so that ``black_threshold`` and darker becomes black and
+    ``white_threshold`` and lighter becomes white.
+
+    The background is estimated at low resolution. Upsampling it and the
+    per-pixel arithmetic are done in horizontal strips, so the working memory
+    needed beyond the input and output images is proportional to the width of
+    the page, not its area.
+
+    Args:
+        image: The page image. Images not in mode L or RGB are converted.
+        dpi: Resolution of the image, which sets the scale of the background
+            estimate.
+        black_threshold: Normalized value that becomes black.
+        white_threshold: Normalized value that becomes white.
+        strip_height: Number of rows to process at a time.
+
+    Returns:
+        A new image in mode L or RGB.
+    """
+    if not 0 <= black_threshold < white_threshold <= 255:
+        raise ValueError("require 0 <= black_threshold < white_threshold <= 255")
+    if image.mode not in ('L', 'RGB'):
+        gray = image.mode in ('1', 'LA', 'La', 'I', 'F') or image.mode.startswith('I;')
+        image = image.convert('L' if gray else 'RGB')
+
+    background = _estimate_background(image, dpi)
+    scale_y = background.height / image.height
+    level_range = white_threshold - black_threshold
+
+    def normalize(args):
+        # pixel / background, in fixed point with 8 fractional bits since
+        # ImageMath uses integer arithmetic, then stretched to the levels
+        ratio = args['im'] * (255 * 256) / args['bg']
+        return (ratio - black_threshold * 256) * 255 / (level_range * 256)
+
+    output = Image.new(image.mode, image.size)
+    for top in range(0, image.height, strip_height):
+        bottom = min(top + strip_height, image.height)
+        strip = image.crop((0, top, image.width, bottom))
+        strip_background = background.resize(
+            strip.size,
+            Image.Resampling.BILINEAR,
+            box=(0, top * scale_y, background.width, bottom * scale_y),
+        )
+        bands = [
+            ImageMath.lambda_eval(normalize, im=band, bg=band_background).convert('L')
+            for band, band_background in zip(
+                strip.split(), strip_background.split(), strict=True
+            )
+        ]
+        output.paste(Image.merge(image.mode, bands), (0, top))
+    if 'dpi' in image.info:
+        output.info['dpi'] = image.info['dpi']
+    return output
+
+
+def otsu_threshold(image: Image.Image) -> int:
+    """Return the gray level that best separates ink from paper by Otsu's method.
+
+    The threshold maximizes the variance between the pixels at or below it and
+    those above it, judged from the image's histogram alone.
+    """
+    histogram = image.histogram()[:256]
+    total = sum(histogram)
+    sum_all = sum(level * count for level, count in enumerate(histogram))
+    best_level, best_variance = 127, -1.0
+    count_below = sum_below = 0
+    for level, count in enumerate(histogram):
+        count_below += count
+        sum_below += level * count
+        count_above = total - count_below
+        if count_below == 0 or count_above == 0:
+            continue
+        mean_below = sum_below / count_below
+        mean_above = (sum_all - sum_below) / count_above
+        variance = count_below * count_above * (mean_below - mean_above) ** 2
+        if variance > best_variance:
+            best_level, best_variance = level, variance
+    return best_level
+
+
+def binarize_otsu(image: Image.Image) -> Image.Image:
+    """Convert a page image to 1-bit with one threshold, by Otsu's method."""
+    gray = image if image.mode == 'L' else image.convert('L')
+    threshold = otsu_threshold(gray)
+    output = gray.point(lambda v: 255 if v > threshold else 0, '1')
+    if 'dpi' in image.info:
+        output.info['dpi'] = image.info['dpi']
+    return output
+
+
+def binarize_sauvola(
+    image: Image.Image, *, dpi: float = 300.0, strip_height: int = 256
+) -> Image.Image:
+    """Convert a page image to 1-bit with thresholds adapted to each region.
+
+    This is Sauvola's method with k = 0.2 and R = 128: a pixel is ink when it
+    is darker than ``mean * (1 + k * (deviation / R - 1))`` of a window about
+    2.5 mm across. Unlike one threshold for the whole page, this keeps text on
+    shaded or unevenly lit regions. The local standard deviation is
+    approximated by 1.25 times the mean absolute deviation, which can be
+    computed on 8-bit images.
+
+    Args:
+        image: The page image.
+        dpi: Resolution of the image, which sets the window size.
+        strip_height: Number of rows to threshold at a time.
+    """
+    gray = image if image.mode == 'L' else image.convert('L')
+    radius = max(1, round(dpi / 20))
+    mean = gray.filter(ImageFilter.BoxBlur(radius))
+    deviation = ImageChops.difference(gray, mean).filter(ImageFilter.BoxBlur(radius))
+
+    def threshold(args):
+        # mean * (0.8 + 1.25 * deviation / 640), in integers, scaled by 2560
+        ink = args['im'] * 2560 < args['mean'] * (args['dev'] * 5 + 2048)
+        return (1 - ink) * 255
+
+    output = Image.new('1', gray.size)
+    for top in range(0, gray.height, strip_height):
+        box = (0, top, gray.width, min(top + strip_height, gray.height))
+        strip = ImageMath.lambda_eval(
+            threshold,
+            im=gray.crop(box),
+            mean=mean.crop(box),
+            dev=deviation.crop(box),
+        )
+        output.paste(strip.convert('L').convert('1', dither=Image.Dither.NONE), box)
+    if 'dpi' in image.info:
+        output.info['dpi'] = image.info['dpi']
+    return output
+
+
+def ocr_image_mode(image: Image.Image, mode: str, *, dpi: float) -> Image.Image:
+    """Convert a page image to the color mode requested for OCR.
+
+    Args:
+        image: The page image.
+        mode: One of :data:`OCR_IMAGE_MODES`. 'color' returns the image as is,
+            'gray' converts it to 8-bit grayscale, and 'otsu' and 'sauvola'
+            binarize it with :func:`binarize_otsu` or :func:`binarize_sauvola`.
+        dpi: Resolution of the image.
+    """
+    if mode == 'color' or image.mode == '1':
+        return image
+    if mode == 'gray':
+        if image.mode == 'L':
+            return image
+        output = image.convert('L')
+        if 'dpi' in image.info:
+            output.info['dpi'] = image.info['dpi']
+        return output
+    if mode == 'otsu':
+        return binarize_otsu(image)
+    if mode == 'sauvola':
+        return binarize_sauvola(image, dpi=dpi)
+    raise ValueError(f"unknown OCR image mode {mode!r}")
+
+
+#: Color modes that OCR images can be converted to; see :func:`ocr_image_mode`.
+OCR_IMAGE_MODES = ('color', 'gray', 'otsu', 'sauvola')
+
+
+def rotate_page_image(
+    image: Image.Image,
+    correction: int,
+    deskew_angle: float = 0.0,
+    *,
+    resample: Image.Resampling = Image.Resampling.BICUBIC,
+) -> Image.Image:
+    """Rotate a page image upright and deskew it, resampling at most once.
+
+    The orientation correction and the deskew angle are composed into a single
+    affine transform. If there is no skew, the image is transposed, which is
+    lossless.
+
+    Pillow can only use nearest neighbor resampling for 1-bit images, which
+    makes edges jagged, so 1-bit images are resampled in grayscale and then
+    thresholded again.
+
+    Args:
+        image: The page image.
+        correction: Cardinal angle, clockwise, that the page is rotated by; the
+            image is rotated counterclockwise by this angle to correct it.
+        deskew_angle: Counterclockwise angle in degrees to rotate by after
+            correcting the orientation, as returned by :func:`estimate_skew`.
+        resample: Resampling filter for the skew correction.
+
+    Returns:
+        The corrected image. If rotated by 90 or 270 degrees, its width and
+        height are swapped; otherwise, it is the same size as the input.
+        Any corners exposed by deskewing are filled with white.
+    """
+    correction %= 360
+    if abs(deskew_angle) < 0.005:  # Not enough to move any pixel noticeably
+        if correction == 0:
+            return image.copy()
+        return image.transpose(Image.Transpose[f'ROTATE_{correction}'])
+
+    w, h = image.size
+    out_w, out_h = (h, w) if correction % 180 == 90 else (w, h)
+    # Map each output pixel back to the input, about the centers of both
+    theta = -radians(correction + deskew_angle)
+    a, b = cos(theta), sin(theta)
+    matrix = (
+        a,
+        b,
+        w / 2 - a * out_w / 2 - b * out_h / 2,
+        -b,
+        a,
+        h / 2 + b * out_w / 2 - a * out_h / 2,
+    )
+
+    mono = image.mode == '1'
+    source = image.convert('L') if mono else image
+    corrected = source.transform(
+        (out_w, out_h),
+        Image.Transform.AFFINE,
+        matrix,
+        resample=resample,
+        fillcolor=ImageColor.getcolor('white', source.mode),  # type: ignore
+    )
+    if mono:
+        corrected = corrected.point(lambda v: 255 if v >= 128 else 0, mode='1')
+    return corrected
@@ -851,3 +851,90 @@ def iso_639_2_from_3(iso3: str) -> str:
         return ISO_639_3[iso3].alpha_2
     else:
         return ""
+
+
+# Tesseract language models by the script names reported by its orientation
+# and script detection (``tesseract --psm 0``)
+_SCRIPT_LANGUAGES = {
+    'Latin': (
+        'afr aze bos bre cat ceb ces cos cym dan deu eng enm epo est eus fao fil '
+        'fin fra frk frm fry gla gle glg hat hrv hun ind isl ita ita_old jav kmr '
+        'lat lav lit ltz mlt mri msa nld nor oci pol por que ron slk slv spa '
+        'spa_old sqi srp_latn sun swa swe tgl ton tur uzb vie yor'
+    ),
+    'Fraktur': 'deu frk deu_latf',
+    'Cyrillic': 'aze_cyrl bak bel bul chv kaz kir mkd mon rus srp tat tgk ukr uzb_cyrl',
+    'Greek': 'ell grc',
+    'Arabic': 'ara fas kur_ara pus snd uig urd',
+    'Hebrew': 'heb yid',
+    'Han': 'chi_sim chi_sim_vert chi_tra chi_tra_vert jpn jpn_vert kor kor_vert',
+    'Japanese': 'jpn jpn_vert',
+    'Hangul': 'kor kor_vert',
+    'Devanagari': 'hin mar nep san',
+    'Bengali': 'asm ben',
+    'Tamil': 'tam',
+    'Telugu': 'tel',
+    'Kannada': 'kan',
+    'Malayalam': 'mal',
+    'Gujarati': 'guj',
+    'Gurmukhi': 'pan',
+    'Oriya': 'ori',
+    'Sinhala': 'sin',
+    'Thai': 'tha',
+    'Lao': 'lao',
+    'Khmer': 'khm',
+    'Myanmar': 'mya',
+    'Tibetan': 'bod dzo',
+    'Georgian': 'kat kat_old',
+    'Armenian': 'hye',
+    'Ethiopic': 'amh tir',
+    'Syriac': 'syr',
+    'Thaana': 'div',
+    'Cherokee': 'chr',
+    'Canadian_Aboriginal': 'iku',
+}
+
+#: The scripts each Tesseract language model reads, by language name
+LANGUAGE_SCRIPTS: dict[str, frozenset[str]] = {
+    language: frozenset(
+        script
+        for script, names in _SCRIPT_LANGUAGES.items()
+        if language in names.split()
+    )
+    for names in _SCRIPT_LANGUAGES.values()
+    for language in names.split()
+}
+
+
+def language_scripts(language: str) -> frozenset[str]:
+    """Return the scripts a Tesseract language model reads.
+
+    Tesseract's script models, named like ``script/Cyrillic``, read the script
+    they are named for. Returns an empty set if the scripts are not known.
+    """
+    if language.startswith('script/'):
+        script = language.removeprefix('script/').removesuffix('_vert')
+        return frozenset({'Han' if script in ('HanS', 'HanT') else script})
+    if language in LANGUAGE_SCRIPTS:
+        return LANGUAGE_SCRIPTS[language]
+    # Models for text set in blackletter, such as spa_frak or deu_latf
+    if language.endswith(('_frak', '_latf')):
+        return frozenset({'Fraktur'})
+    # Regional or historical variants such as ita_old, fall back to the base
+    base = language.split('_', maxsplit=1)[0]
+    if base in ISO_639_3 or any(code.alt == base for code in ISO_639_3.values()):
+        return LANGUAGE_SCRIPTS.get(base, frozenset())
+    return frozenset()
+
+
+def languages_for_script(languages: list[str], script: str) -> list[str]:
+    """Return those of ``languages`` that may be written in ``script``.
+
+    Languages whose scripts are not known are kept, since they may be needed.
+    The order of ``languages`` is preserved.
+    """
+    return [
+        language
+        for language in languages
+        if script in (scripts := language_scripts(language)) or not scripts
+    ]
@@ -52,6 +52,7 @@ class TextboxInfo(NamedTuple):
     bbox: tuple[float, float, float, float]
     is_visible: bool
     is_corrupt: bool
+    text: str = ''
 
 
 class VectorMarker:
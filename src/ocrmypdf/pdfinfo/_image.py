@@ -246,6 +246,15 @@ class ImageInfo:
         """
         return _get_dpi(self._shorthand, (self._width, self._height))
 
+    @property
+    def shorthand(self) -> tuple[float, ...] | None:
+        """Transformation matrix used to draw the image, as (a, b, c, d, e, f).
+
+        The image is drawn into the unit square, so this maps the unit square
+        to its placement on the page in PDF units.
+        """
+        return self._shorthand
+
     @property
     def printed_area(self) -> float:
         """Physical area of the image in square inches."""
@@ -84,7 +84,7 @@ def simplify_textboxes(
             continue
         visible = first_char.rendermode != 3
         corrupt = first_char.get_text() == '\ufffd'
-        yield TextboxInfo(box.bbox, visible, corrupt)
+        yield TextboxInfo(box.bbox, visible, corrupt, box.get_text())
 
 
 class PageResolutionProfile(NamedTuple):
@@ -332,6 +332,19 @@ class PageInfo:
 
         return (obj.bbox for obj in self._textboxes if predicate(obj, visible, corrupt))
 
+    def get_text(self, visible: bool | None = None) -> str:
+        """Return the text of the page's textboxes, optionally only (in)visible ones.
+
+        Only available after detailed analysis.
+        """
+        if not self._detailed_analysis:
+            raise NotImplementedError('Did not do detailed analysis')
+        return '\n'.join(
+            tbox.text
+            for tbox in self._textboxes
+            if visible is None or tbox.is_visible == visible
+        )
+
     @property
     def dpi(self) -> Resolution:
         """Return DPI needed to render all images on the page."""
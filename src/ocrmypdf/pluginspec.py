@@ -401,6 +401,43 @@ class OrientationConfidence(NamedTuple):
     confidence: float
 
 
+class PageGeometry(NamedTuple):
+    """Expresses an OCR engine's analysis of page orientation and skew together.
+
+    Attributes:
+        angle: The clockwise angle (0, 90, 180, 270) that the page should be
+            rotated, as for :class:`OrientationConfidence`.
+        confidence: How confident the OCR engine is in ``angle``, as for
+            :class:`OrientationConfidence`.
+        deskew: The deskew angle of the image, in degrees, as for
+            :meth:`OcrEngine.get_deskew`.
+    """
+
+    angle: int = 0
+    confidence: float = 0.0
+    deskew: float = 0.0
+
+    @property
+    def orientation(self) -> OrientationConfidence:
+        """The orientation and confidence alone."""
+        return OrientationConfidence(self.angle, self.confidence)
+
+
+class ScriptConfidence(NamedTuple):
+    """Expresses an OCR engine's confidence in the writing system of a page.
+
+    Attributes:
+        script: The name of the script, such as ``'Latin'``, ``'Cyrillic'`` or
+            ``'Han'``, as used by :data:`ocrmypdf.languages.LANGUAGE_SCRIPTS`.
+            An empty string if no script was detected.
+        confidence: How confident the OCR engine is in ``script``. 0 is not
+            confident. Arbitrary units, as for :class:`OrientationConfidence`.
+    """
+
+    script: str
+    confidence: float
+
+
 class OcrEngine(ABC):
     """A class representing an OCR engine with capabilities similar to Tesseract OCR.
 
@@ -453,6 +490,70 @@ class OcrEngine(ABC):
         """Returns the deskew angle of the image, in degrees."""
         return 0.0
 
+    def get_page_geometry(
+        self,
+        input_file: Path,
+        options: OcrOptions,
+        *,
+        orientation: bool = True,
+        deskew: bool = True,
+    ) -> PageGeometry:
+        """Returns the orientation and deskew angle of the image together.
+
+        OCRmyPDF calls this when ``--rotate-pages`` or ``--deskew`` is in
+        effect. Engines that can find both from a single analysis of the page
+        should override this and :meth:`supports_page_geometry`; OCRmyPDF then
+        asks for both in one call.
+
+        Otherwise, OCRmyPDF asks for the orientation alone, and then calls
+        :meth:`get_deskew` once the page is turned upright, since the skew of
+        sideways text cannot be measured. Likewise, if the page must be turned
+        by 90 or 270 degrees, the deskew angle found with the orientation is
+        not used, and :meth:`get_deskew` is called on an upright image.
+
+        The default implementation calls :meth:`get_orientation` and
+        :meth:`get_deskew` as requested.
+
+        Args:
+            input_file: A page image to analyze.
+            options: The command line options.
+            orientation: If False, orientation is not needed and may be
+                reported as 0 with confidence 0.
+            deskew: If False, the deskew angle is not needed and may be
+                reported as 0.
+        """
+        orient_conf = (
+            self.get_orientation(input_file, options)
+            if orientation
+            else OrientationConfidence(0, 0.0)
+        )
+        deskew_angle = self.get_deskew(input_file, options) if deskew else 0.0
+        return PageGeometry(orient_conf.angle, orient_conf.confidence, deskew_angle)
+
+    @staticmethod
+    def supports_page_geometry() -> bool:
+        """Return True if get_page_geometry() analyzes the page only once.
+
+        Returns:
+            False by default. Engines that override get_page_geometry() to find
+            the orientation and deskew angle from a single analysis of the page
+            should override this to return True.
+        """
+        return False
+
+    @staticmethod
+    def get_script(input_file: Path, options: OcrOptions) -> ScriptConfidence | None:
+        """Returns the script (writing system) of the text in the image.
+
+        OCRmyPDF calls this with ``--detect-languages``, to OCR each page with
+        only those of the requested languages that are written in the script
+        found.
+
+        Returns:
+            None (the default) if this engine cannot detect scripts.
+        """
+        return None
+
     @staticmethod
     @abstractmethod
     def generate_hocr(
@@ -543,6 +644,63 @@ class OcrEngine(ABC):
         """
         raise NotImplementedError("This OcrEngine does not implement generate_ocr()")
 
+    @staticmethod
+    def supports_generate_ocr_batch() -> bool:
+        """Return True if this engine supports the generate_ocr_batch() API.
+
+        Returns:
+            False by default. Engines implementing generate_ocr_batch() should
+            override this to return True.
+        """
+        return False
+
+    @staticmethod
+    def generate_ocr_batch(
+        input_files: Sequence[Path],
+        options: OcrOptions,
+        page_numbers: Sequence[int],
+    ) -> list[tuple[OcrElement, str]]:
+        """Generate OCR results for several page images at once.
+
+        Engines with a costly setup for each call, or that recognize several
+        images faster together than one at a time, such as neural networks
+        with batch inference, may implement this in addition to
+        :meth:`generate_ocr`. With ``--ocr-batch-size``, pages that are being
+        OCRed at the same time by different worker threads, with the same
+        options, are combined into one call. Pages are OCRed with
+        :meth:`generate_ocr` when there is no other page to combine them
+        with, and when this method raises an exception, so that errors are
+        reported against the page that caused them.
+
+        Args:
+            input_files: Page images on which to perform OCR.
+            options: The command line options.
+            page_numbers: Zero-indexed page number of each image.
+
+        Returns:
+            A list with a tuple of (OcrElement tree for the page, plain text
+            content) for each image, in the same order as ``input_files``.
+        """
+        raise NotImplementedError(
+            "This OcrEngine does not implement generate_ocr_batch()"
+        )
+
+    @staticmethod
+    def cache_parameters(options: OcrOptions) -> object | None:
+        """Return the settings that affect this engine's results, for caching.
+
+        With ``--ocr-cache``, results are stored under a key made from the page
+        image, the engine's class and version, the OCR languages, and the value
+        returned here, which must have a stable ``repr()``. Include every
+        option that can change the engine's output, and the contents of any
+        files those options name, but not options such as thread counts that
+        only affect how fast it runs.
+
+        Returns:
+            None (the default) if this engine's results must not be cached.
+        """
+        return None
+
 
 @hookspec(firstresult=True)
 def get_ocr_engine(options: OcrOptions | None) -> OcrEngine:  # type: ignore[return-value]
@@ -6,8 +6,22 @@
 from __future__ import annotations
 
 import re
+import unicodedata
 from collections.abc import Iterable
 
+# Unicode categories of characters that do not appear in well extracted text:
+# control, unassigned, private use and surrogate characters
+_JUNK_CATEGORIES = frozenset({'Cc', 'Cn', 'Co', 'Cs'})
+
+_TOKEN_PUNCTUATION = '.,;:!?"\'()[]{}<>«»“”‘’'
+
+
+def _words(text: str) -> set[str]:
+    """Return the unique words of at least 3 letters in text."""
+    text = re.sub(r"[0-9_]+", ' ', text)
+    text = re.sub(r'\W+', ' ', text)
+    return {w for w in re.split(r'\s+', text) if len(w) >= 3}
+
 
 class OcrQualityDictionary:
     """Manages a dictionary for simple OCR quality checks."""
@@ -29,10 +43,7 @@ class OcrQualityDictionary:
         Returns:
             number of words that match / number
         """
-        text = re.sub(r"[0-9_]+", ' ', ocr_text)
-        text = re.sub(r'\W+', ' ', text)
-        text_words_list = re.split(r'\s+', text)
-        text_words = {w for w in text_words_list if len(w) >= 3}
+        text_words = _words(ocr_text)
 
         matches = 0
         for w in text_words:
@@ -42,3 +53,47 @@ class OcrQualityDictionary:
                 matches += 1
         hit_ratio = matches / len(text_words) if matches > 0 else 0.0
         return hit_ratio
+
+
+def measure_text_quality(
+    text: str, dictionary: OcrQualityDictionary | None = None
+) -> float:
+    """Estimate the quality of extracted or OCRed text, from 0.0 to 1.0.
+
+    The score is the share of characters that are not junk, such as the
+    replacement character for glyphs that cannot be mapped to Unicode, times the
+    share of words that are plausible. With a dictionary, plausible words are
+    those in the dictionary. Without one, they are words made only of letters,
+    hyphens and apostrophes, in lower, upper or title case, which rejects most
+    OCR errors such as ``iNvoice`` or ``c1ient``. Text without any words of 3 or
+    more letters is scored by its characters alone, and empty text scores 0.0.
+    """
+    chars = [c for c in text if not c.isspace()]
+    if not chars:
+        return 0.0
+    junk = sum(
+        1 for c in chars if c == '\ufffd' or unicodedata.category(c) in _JUNK_CATEGORIES
+    )
+    char_ratio = 1.0 - junk / len(chars)
+
+    if dictionary is not None:
+        if not _words(text):
+            return char_ratio
+        return char_ratio * dictionary.measure_words_matched(text)
+
+    # Tokens of 3 or more characters that contain a letter, without the
+    # punctuation around them
+    tokens = [
+        token
+        for token in (t.strip(_TOKEN_PUNCTUATION) for t in text.split())
+        if len(token) >= 3 and any(c.isalpha() for c in token)
+    ]
+    if not tokens:
+        return char_ratio
+    plausible = sum(
+        1
+        for token in tokens
+        if token.replace('-', '').replace("'", '').isalpha()
+        and (token.islower() or token.isupper() or token.istitle())
+    )
+    return char_ratio * plausible / len(tokens)
@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from ocrmypdf import _budget
+from ocrmypdf._budget import Effort, EffortPlanner
+from ocrmypdf._options import OcrOptions
+from ocrmypdf._pipelines.ocr import _report_degraded_pages
+from ocrmypdf.builtin_plugins.tesseract_ocr import TesseractOptions
+
+
+@pytest.fixture(autouse=True)
+def register_plugin_models():
+    OcrOptions.register_plugin_models({'tesseract': TesseractOptions})
+
+
+def _options(**kwargs):
+    return OcrOptions(
+        input_file='in.pdf',
+        output_file='out.pdf',
+        deskew=True,
+        clean=True,
+        oversample=400,
+        **kwargs,
+    )
+
+
+def test_planner_without_measurements_uses_full_effort():
+    assert EffortPlanner().choose(0.0) == Effort.full
+
+
+def test_planner_estimates_unmeasured_effort():
+    planner = EffortPlanner()
+    planner.record(Effort.full, 10.0)
+    planner.record(Effort.full, 20.0)
+    assert planner.estimate(Effort.full) == 15.0
+    assert planner.estimate(Effort.fast) == pytest.approx(6.0)
+    planner.record(Effort.fast, 3.0)
+    assert planner.estimate(Effort.fast) == 3.0
+
+
+@pytest.mark.parametrize(
+    'available, effort',
+    [
+        (20.0, Effort.full),
+        (8.0, Effort.reduced),
+        (5.0, Effort.fast),
+        (1.0, Effort.fast),
+    ],
+)
+def test_planner_choose(available, effort):
+    planner = EffortPlanner()
+    planner.record(Effort.full, 10.0)
+    assert planner.choose(available) == effort
+
+
+def test_seconds_per_page():
+    # 10 pages left, 2 workers, 100 seconds
+    assert _budget.seconds_per_page(1100.0, 1000.0, 10, 20, 2) == 20.0
+    # The last page gets one worker's time
+    assert _budget.seconds_per_page(1100.0, 1000.0, 19, 20, 4) == 100.0
+    assert _budget.seconds_per_page(1000.0, 1010.0, 19, 20, 4) < 0
+
+
+def test_options_for_full_effort():
+    options = _options()
+    assert _budget.options_for_effort(options, Effort.full, 60.0) is options
+
+
+def test_options_for_reduced_effort():
+    options = _options()
+    reduced = _budget.options_for_effort(options, Effort.reduced, 60.0)
+    assert not reduced.deskew
+    assert not reduced.clean
+    assert reduced.oversample == 400
+    assert options.deskew
+
+
+def test_options_for_fast_effort():
+    options = _options(tesseract_fast_tessdata='/fast')
+    assert options.tesseract.timeout == 180.0  # Populate plugin options
+    fast = _budget.options_for_effort(options, Effort.fast, 1.0)
+    assert fast.oversample == 0
+    assert fast.adaptive_ocr_resolution
+    assert fast.tesseract.timeout == _budget.MIN_PAGE_SECONDS
+    assert fast.tesseract.escalate_below == 0.0
+    assert fast.tesseract.fast_tessdata == '/fast'
+    assert options.tesseract.timeout == 180.0
+    assert options.tesseract.escalate_below == 75.0
+
+
+def test_useful_efforts_skips_no_op_levels():
+    assert _budget.useful_efforts(_options(), 60.0) == list(Effort)
+    default = OcrOptions(input_file='in.pdf', output_file='out.pdf')
+    assert _budget.useful_efforts(default, 60.0) == [Effort.full, Effort.fast]
+    fast = OcrOptions(
+        input_file='in.pdf', output_file='out.pdf', adaptive_ocr_resolution=True
+    )
+    assert _budget.useful_efforts(fast, 600.0) == [Effort.full]
+    assert _budget.useful_efforts(fast, 1.0) == [Effort.full, Effort.fast]
+
+
+def test_planner_choose_among_useful_efforts():
+    planner = EffortPlanner()
+    planner.record(Effort.full, 10.0)
+    assert planner.choose(8.0, [Effort.full, Effort.fast]) == Effort.fast
+    assert planner.choose(1.0, [Effort.full]) == Effort.full
+
+
+def test_plan_page(monkeypatch):
+    planner = EffortPlanner()
+    planner.record(Effort.full, 30.0)
+    monkeypatch.setattr(_budget, '_PLANNER', planner)
+    monkeypatch.setattr(_budget.time, 'time', lambda: 1000.0)
+    options, effort = _budget.plan_page(
+        _options(), deadline=1100.0, pageno=0, page_count=10, workers=1
+    )
+    assert effort == Effort.fast
+    assert options.tesseract.timeout == 10.0
+
+
+def test_plan_page_skips_no_op_effort(monkeypatch):
+    planner = EffortPlanner()
+    planner.record(Effort.full, 10.0)
+    monkeypatch.setattr(_budget, '_PLANNER', planner)
+    monkeypatch.setattr(_budget.time, 'time', lambda: 1000.0)
+    # Reduced effort would fit, but changes nothing without deskew or cleaning
+    options, effort = _budget.plan_page(
+        OcrOptions(input_file='in.pdf', output_file='out.pdf'),
+        deadline=1080.0,
+        pageno=0,
+        page_count=10,
+        workers=1,
+    )
+    assert effort == Effort.fast
+    assert options.adaptive_ocr_resolution
+
+
+def test_report_degraded_pages(caplog):
+    caplog.set_level(logging.WARNING)
+    _report_degraded_pages(
+        {0: Effort.full, 4: Effort.fast, 2: Effort.reduced, 3: Effort.fast}, 10
+    )
+    assert '1 of 10 pages were processed with reduced effort: 3' in caplog.text
+    assert '2 of 10 pages were processed with fast effort: 4, 5' in caplog.text
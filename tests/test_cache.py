@@ -0,0 +1,296 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pikepdf
+import pytest
+from PIL import Image
+
+from ocrmypdf import _pipeline, pdfinfo
+from ocrmypdf._cache import (
+    DiskCache,
+    cache_key,
+    page_fingerprint,
+    take_cache_counts,
+)
+from ocrmypdf._ocr_cache import CachingOcrEngine
+from ocrmypdf._options import OcrOptions
+from ocrmypdf._plugin_manager import get_plugin_manager
+from ocrmypdf.builtin_plugins.null_ocr import NullOcrEngine
+from ocrmypdf.models.ocr_element import Baseline, BoundingBox, OcrClass, OcrElement
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DiskCache(tmp_path / 'cache', 1000, name='test')
+
+
+def test_get_missing(cache, tmp_path):
+    take_cache_counts()
+    assert not cache.get('abcdef', tmp_path / 'out')
+    assert take_cache_counts() == {'test_misses': 1}
+
+
+def test_put_get(cache, tmp_path):
+    src = tmp_path / 'src'
+    src.write_bytes(b'hello')
+    cache.put('abcdef', src)
+
+    take_cache_counts()
+    assert cache.get('abcdef', tmp_path / 'out')
+    assert (tmp_path / 'out').read_bytes() == b'hello'
+    assert take_cache_counts() == {'test_hits': 1}
+
+
+def test_evicts_least_recently_used(cache, tmp_path):
+    src = tmp_path / 'src'
+    src.write_bytes(b'x' * 400)
+    for n, key in enumerate(['aa1', 'bb2']):
+        cache.put(key, src)
+        entry = cache.root / key[:2] / key
+        os.utime(entry, (n, n))
+    # Using aa1 makes bb2 the least recently used entry
+    assert cache.get('aa1', tmp_path / 'out')
+    cache.put('cc3', src)
+
+    assert cache.get('aa1', tmp_path / 'out')
+    assert not cache.get('bb2', tmp_path / 'out')
+    assert cache.get('cc3', tmp_path / 'out')
+
+
+def test_prune_and_clear(cache, tmp_path):
+    src = tmp_path / 'src'
+    src.write_bytes(b'x' * 100)
+    now = time.time()
+    for n, key in enumerate(['aa1', 'bb2', 'cc3']):
+        cache.put(key, src)
+        age = (3 - n) * 86400
+        os.utime(cache.root / key[:2] / key, (now - age, now - age))
+    assert [entry.key for entry in cache.entries()] == ['aa1', 'bb2', 'cc3']
+
+    assert [entry.key for entry in cache.prune(older_than=2.5 * 86400)] == ['aa1']
+    assert [entry.key for entry in cache.prune(max_bytes=150)] == ['bb2']
+    assert cache.prune(max_bytes=150) == []
+    assert [entry.key for entry in cache.clear()] == ['cc3']
+    assert cache.entries() == []
+
+
+def test_page_fingerprint_ignores_page_position(resources, tmp_path):
+    with pikepdf.open(resources / 'multipage.pdf') as pdf:
+        original = [page_fingerprint(page) for page in pdf.pages]
+        pdf.pages.reverse()
+        pdf.save(tmp_path / 'reversed.pdf')
+    with pikepdf.open(tmp_path / 'reversed.pdf') as pdf:
+        reversed_ = [page_fingerprint(page) for page in pdf.pages]
+
+    assert len(set(original)) == len(original)
+    assert reversed_ == original[::-1]
+
+
+def test_page_fingerprint_detects_content_change(resources, tmp_path):
+    with pikepdf.open(resources / 'linn.pdf') as pdf:
+        before = page_fingerprint(pdf.pages[0])
+        pdf.pages[0].contents_add(b'0 0 m 10 10 l S', prepend=False)
+        assert page_fingerprint(pdf.pages[0]) != before
+
+
+def test_cache_key_depends_on_parameters():
+    assert cache_key('fp', 300, 0) == cache_key('fp', 300, 0)
+    assert cache_key('fp', 300, 0) != cache_key('fp', 300, 90)
+
+
+def test_rasterize_uses_cache(resources, tmp_path):
+    def fake_rasterize(*, output_file, **kwargs):
+        output_file.write_bytes(b'raster')
+        return output_file
+
+    ctx = Mock()
+    ctx.options = OcrOptions(
+        input_file=resources / 'link.pdf',
+        output_file=tmp_path / 'out.pdf',
+        raster_cache=tmp_path / 'cache',
+    )
+    ctx.pageinfo = pdfinfo.PdfInfo(resources / 'link.pdf')[0]
+    ctx.plugin_manager.rasterize_pdf_page.side_effect = fake_rasterize
+    ctx.get_path = lambda name: tmp_path / name
+
+    take_cache_counts()
+    first = _pipeline.rasterize(resources / 'link.pdf', ctx)
+    (tmp_path / first.name).unlink()
+    second = _pipeline.rasterize(resources / 'link.pdf', ctx)
+
+    assert second.read_bytes() == b'raster'
+    assert ctx.plugin_manager.rasterize_pdf_page.call_count == 1
+    assert take_cache_counts() == {'raster_misses': 1, 'raster_hits': 1}
+
+
+def test_rasterize_cache_depends_on_rasterizer_version(
+    resources, tmp_path, monkeypatch
+):
+    def fake_rasterize(*, output_file, **kwargs):
+        output_file.write_bytes(b'raster')
+        return output_file
+
+    ctx = Mock()
+    ctx.options = OcrOptions(
+        input_file=resources / 'link.pdf',
+        output_file=tmp_path / 'out.pdf',
+        raster_cache=tmp_path / 'cache',
+    )
+    ctx.pageinfo = pdfinfo.PdfInfo(resources / 'link.pdf')[0]
+    ctx.plugin_manager.rasterize_pdf_page.side_effect = fake_rasterize
+    ctx.get_path = lambda name: tmp_path / name
+
+    monkeypatch.setattr(_pipeline, '_rasterizer_versions', lambda: ('10.0', '5.0'))
+    first = _pipeline.rasterize(resources / 'link.pdf', ctx)
+    first.unlink()
+    monkeypatch.setattr(_pipeline, '_rasterizer_versions', lambda: ('10.1', '5.0'))
+    _pipeline.rasterize(resources / 'link.pdf', ctx)
+
+    assert ctx.plugin_manager.rasterize_pdf_page.call_count == 2
+
+
+class CountingEngine(NullOcrEngine):
+    cacheable = True
+    calls = 0
+
+    def cache_parameters(self, options):
+        return ('settings',) if self.cacheable else None
+
+    def generate_ocr(self, input_file, options, page_number=0):
+        self.calls += 1
+        page, _ = NullOcrEngine.generate_ocr(input_file, options, page_number)
+        line = OcrElement(
+            ocr_class=OcrClass.LINE,
+            bbox=BoundingBox(left=1, top=2, right=30, bottom=10),
+            baseline=Baseline(slope=0.01, intercept=-2),
+            children=[
+                OcrElement(
+                    ocr_class=OcrClass.WORD,
+                    bbox=BoundingBox(left=1, top=2, right=30, bottom=10),
+                    text='hello',
+                    confidence=0.9,
+                )
+            ],
+        )
+        page.children.append(OcrElement(ocr_class=OcrClass.PARAGRAPH, children=[line]))
+        return page, 'hello\n'
+
+    def generate_hocr(self, input_file, output_hocr, output_text, options):
+        self.calls += 1
+        output_hocr.write_text('<html/>', encoding='utf-8')
+        output_text.write_text(
+            '[skipped page]' if 'skip' in input_file.name else 'text',
+            encoding='utf-8',
+        )
+
+
+@pytest.fixture
+def ocr_cache(tmp_path):
+    return DiskCache(tmp_path / 'ocr_cache', 10**6, name='test')
+
+
+@pytest.fixture
+def page_image(tmp_path):
+    image = tmp_path / 'page.png'
+    Image.new('L', (40, 20), 255).save(image, dpi=(300, 300))
+    return image
+
+
+def test_ocr_cache_generate_ocr(ocr_cache, page_image, tmp_path):
+    engine = CountingEngine()
+    cached = CachingOcrEngine(engine, ocr_cache)
+    options = SimpleNamespace(languages=['eng'])
+
+    take_cache_counts()
+    first, first_text = cached.generate_ocr(page_image, options, page_number=1)
+    second, second_text = cached.generate_ocr(page_image, options, page_number=5)
+
+    assert engine.calls == 1
+    assert take_cache_counts() == {'test_misses': 1, 'test_hits': 1}
+    assert second_text == first_text == 'hello\n'
+    assert second.page_number == 5
+    second.page_number = first.page_number
+    assert second == first
+
+    cached.generate_ocr(page_image, SimpleNamespace(languages=['deu']))
+    assert engine.calls == 2
+
+
+def test_ocr_cache_generate_ocr_batch(ocr_cache, page_image, tmp_path):
+    engine = CountingEngine()
+    cached = CachingOcrEngine(engine, ocr_cache)
+    options = SimpleNamespace(languages=['eng'])
+    other = tmp_path / 'other.png'
+    Image.new('L', (40, 20), 0).save(other)
+
+    cached.generate_ocr(page_image, options, page_number=0)
+    results = cached.generate_ocr_batch([page_image, other], options, [1, 2])
+
+    assert cached.supports_generate_ocr_batch()
+    # Only the image that was not cached was OCRed again
+    assert engine.calls == 2
+    assert [tree.page_number for tree, _ in results] == [1, 2]
+    assert [text for _, text in results] == ['hello\n', 'hello\n']
+    cached.generate_ocr(other, options)
+    assert engine.calls == 2
+
+
+def test_ocr_cache_key_is_image_content(ocr_cache, page_image, tmp_path):
+    engine = CountingEngine()
+    cached = CachingOcrEngine(engine, ocr_cache)
+    options = SimpleNamespace(languages=['eng'])
+    copy = tmp_path / 'copy.png'
+    copy.write_bytes(page_image.read_bytes())
+    other = tmp_path / 'other.png'
+    Image.new('L', (40, 20), 0).save(other)
+
+    for image in (page_image, copy, other):
+        cached.generate_ocr(image, options)
+
+    assert engine.calls == 2
+
+
+def test_ocr_cache_generate_hocr(ocr_cache, page_image, tmp_path):
+    engine = CountingEngine()
+    cached = CachingOcrEngine(engine, ocr_cache)
+    options = SimpleNamespace(languages=['eng'])
+    skipped = tmp_path / 'skip.png'
+    skipped.write_bytes(page_image.read_bytes() + b'\0')
+
+    for n in range(2):
+        hocr, text = tmp_path / f'{n}.hocr', tmp_path / f'{n}.txt'
+        cached.generate_hocr(page_image, hocr, text, options)
+        assert hocr.read_text() == '<html/>'
+        assert text.read_text() == 'text'
+    assert engine.calls == 1
+
+    # Pages the engine gave up on are not cached
+    for _ in range(2):
+        cached.generate_hocr(skipped, tmp_path / 's.hocr', tmp_path / 's.txt', options)
+    assert engine.calls == 3
+
+
+def test_ocr_cache_respects_uncacheable_engine(ocr_cache, page_image):
+    engine = CountingEngine()
+    engine.cacheable = False
+    cached = CachingOcrEngine(engine, ocr_cache)
+    for _ in range(2):
+        cached.generate_ocr(page_image, SimpleNamespace(languages=['eng']))
+    assert engine.calls == 2
+
+
+def test_get_ocr_engine_uses_ocr_cache(tmp_path):
+    pm = get_plugin_manager([])
+    options = OcrOptions(input_file='in.pdf', output_file='out.pdf', ocr_engine='none')
+    assert isinstance(pm.get_ocr_engine(options=options), NullOcrEngine)
+    options.ocr_cache = tmp_path / 'cache'
+    engine = pm.get_ocr_engine(options=options)
+    assert isinstance(engine, CachingOcrEngine)
+    assert str(engine) == 'No OCR engine'
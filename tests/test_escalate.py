@@ -0,0 +1,198 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from ocrmypdf._escalate import (
+    line_confidence,
+    line_crop_box,
+    low_confidence_lines,
+    replace_line_words,
+)
+from ocrmypdf._exec import tesseract
+from ocrmypdf._exec.tesseract import ThresholdingMethod
+from ocrmypdf.builtin_plugins import tesseract_ocr
+from ocrmypdf.exceptions import SubprocessOutputError
+from ocrmypdf.models.ocr_element import BoundingBox, OcrClass, OcrElement
+
+
+def _word(text, left, top, right, bottom, confidence):
+    return OcrElement(
+        ocr_class=OcrClass.WORD,
+        text=text,
+        bbox=BoundingBox(left=left, top=top, right=right, bottom=bottom),
+        confidence=confidence,
+    )
+
+
+def _line(*words, textangle=None):
+    return OcrElement(
+        ocr_class=OcrClass.LINE,
+        bbox=BoundingBox(
+            left=min(w.bbox.left for w in words),
+            top=min(w.bbox.top for w in words),
+            right=max(w.bbox.right for w in words),
+            bottom=max(w.bbox.bottom for w in words),
+        ),
+        textangle=textangle,
+        children=list(words),
+    )
+
+
+def _page(*lines):
+    return OcrElement(
+        ocr_class=OcrClass.PAGE,
+        bbox=BoundingBox(left=0, top=0, right=200, bottom=100),
+        children=[OcrElement(ocr_class=OcrClass.PARAGRAPH, children=list(lines))],
+    )
+
+
+def test_line_confidence():
+    assert line_confidence(_line(_word('a', 0, 0, 5, 5, 0.5))) == 0.5
+    line = _line(_word('a', 0, 0, 5, 5, 0.4), _word('b', 6, 0, 9, 5, 0.8))
+    assert line_confidence(line) == pytest.approx(0.6)
+    assert line_confidence(_line(_word('a', 0, 0, 5, 5, None))) is None
+
+
+def test_low_confidence_lines():
+    sure = _line(_word('sure', 10, 10, 50, 20, 0.95))
+    unsure = _line(_word('unsure', 10, 30, 50, 40, 0.3))
+    rotated = _line(_word('rotated', 10, 50, 20, 90, 0.3), textangle=90.0)
+    unknown = _line(_word('unknown', 10, 60, 50, 70, None))
+    page = _page(sure, unsure, rotated, unknown)
+    assert low_confidence_lines(page, 0.75) == [unsure]
+
+
+def test_line_crop_box_is_clipped():
+    line = _line(_word('edge', 2, 10, 195, 30, 0.5))
+    assert line_crop_box(line, (200, 100)) == (0, 5, 200, 35)
+
+
+def test_replace_line_words():
+    line = _line(_word('c1ear', 20, 20, 60, 30, 0.4))
+    recognized = _page(_line(_word('clear', 5, 4, 45, 14, 0.9)))
+    assert replace_line_words(line, recognized, (15, 16))
+    assert [w.text for w in line.words] == ['clear']
+    assert line.words[0].bbox == BoundingBox(left=20, top=20, right=60, bottom=30)
+
+
+@pytest.mark.parametrize(
+    'recognized',
+    [
+        _page(_line(_word('worse', 5, 4, 45, 14, 0.2))),
+        _page(),
+    ],
+)
+def test_replace_line_words_keeps_better(recognized):
+    line = _line(_word('kept', 20, 20, 60, 30, 0.4))
+    assert not replace_line_words(line, recognized, (15, 16))
+    assert [w.text for w in line.words] == ['kept']
+
+
+def _hocr(*words):
+    spans = ''.join(
+        f"<span class='ocr_line' title='bbox {left} {top} {right} {bottom}'>"
+        f"<span class='ocrx_word' title='bbox {left} {top} {right} {bottom}; "
+        f"x_wconf {conf}'>{text}</span></span>"
+        for text, (left, top, right, bottom), conf in words
+    )
+    return (
+        "<html><body><div class='ocr_page' title='bbox 0 0 200 100'>"
+        f"<p class='ocr_par'>{spans}</p></div></body></html>"
+    )
+
+
+def _options():
+    return SimpleNamespace(
+        ocr_engine='tesseract',
+        languages=['eng'],
+        use_threads=False,
+        tesseract=SimpleNamespace(
+            oem=None,
+            config=[],
+            pagesegmode=None,
+            thresholding=ThresholdingMethod.AUTO,
+            timeout=180.0,
+            user_words=None,
+            user_patterns=None,
+            omp_thread_limit=1,
+            batch_size=1,
+            fast_tessdata='/fast',
+            escalate_below=75.0,
+        ),
+    )
+
+
+def test_get_ocr_engine_two_tier():
+    engine = tesseract_ocr.get_ocr_engine(_options())
+    assert type(engine) is tesseract_ocr.TwoTierTesseractOcrEngine
+    options = _options()
+    options.tesseract.fast_tessdata = None
+    assert type(tesseract_ocr.get_ocr_engine(options)) is (
+        tesseract_ocr.TesseractOcrEngine
+    )
+
+
+@pytest.fixture
+def page_image(tmp_path):
+    image = tmp_path / 'page.png'
+    Image.new('L', (200, 100), 255).save(image, dpi=(300, 300))
+    return image
+
+
+def test_two_tier_escalates_unsure_lines(monkeypatch, page_image):
+    fast_calls, best_calls = [], []
+
+    def fake_generate_hocr_stdout(*, input_file, **kwargs):
+        fast_calls.append(kwargs)
+        return _hocr(
+            ('sure', (10, 10, 50, 20), 95),
+            ('c1ear', (10, 40, 50, 50), 30),
+        ).encode()
+
+    def fake_generate_hocr(*, input_file, output_hocr, output_text, **kwargs):
+        best_calls.append(kwargs)
+        with Image.open(input_file) as im:
+            assert im.info['dpi'] == pytest.approx((300, 300), abs=0.1)
+        output_hocr.write_text(_hocr(('clear', (4, 3, 44, 13), 90)), encoding='utf-8')
+        output_text.write_text('clear\n', encoding='utf-8')
+
+    monkeypatch.setattr(tesseract, 'generate_hocr_stdout', fake_generate_hocr_stdout)
+    monkeypatch.setattr(tesseract, 'generate_hocr', fake_generate_hocr)
+    page, text = tesseract_ocr.TwoTierTesseractOcrEngine.generate_ocr(
+        page_image, _options(), page_number=3
+    )
+
+    (fast,) = fast_calls
+    (best,) = best_calls
+    assert str(fast['tessdata_dir']) == '/fast'
+    assert best['pagesegmode'] == 7
+    assert 'tessdata_dir' not in best
+    assert [w.text for w in page.words] == ['sure', 'clear']
+    # Line was cropped with 4 pixels of padding
+    assert page.words[1].bbox == BoundingBox(left=10, top=39, right=50, bottom=49)
+    assert page.page_number == 3
+    assert text == 'sure\nclear\n'
+
+
+def test_two_tier_keeps_fast_ocr_on_failure(monkeypatch, page_image, caplog):
+    def fake_generate_hocr_stdout(**kwargs):
+        return _hocr(('c1ear', (10, 40, 50, 50), 30)).encode()
+
+    def fake_generate_hocr(**kwargs):
+        raise SubprocessOutputError()
+
+    monkeypatch.setattr(tesseract, 'generate_hocr_stdout', fake_generate_hocr_stdout)
+    monkeypatch.setattr(tesseract, 'generate_hocr', fake_generate_hocr)
+    page, text = tesseract_ocr.TwoTierTesseractOcrEngine.generate_ocr(
+        page_image, _options()
+    )
+
+    assert [w.text for w in page.words] == ['c1ear']
+    assert text == 'c1ear\n'
+    assert 'keeping the fast OCR' in caplog.text
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+from io import BytesIO
 from pathlib import Path
 from textwrap import dedent
 
@@ -187,6 +188,12 @@ class TestHocrParserBasic:
         assert page.bbox.width == 1000
         assert page.bbox.height == 500
 
+    def test_parse_from_file_object(self, simple_hocr):
+        page = HocrParser(BytesIO(simple_hocr.read_bytes())).parse()
+
+        assert page.bbox.width == 1000
+        assert page == HocrParser(simple_hocr).parse()
+
     def test_parse_page_number(self, simple_hocr):
         parser = HocrParser(simple_hocr)
         page = parser.parse()
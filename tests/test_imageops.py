@@ -3,15 +3,26 @@
 
 from __future__ import annotations
 
+import random
+
 import hypothesis.strategies as st
+import pytest
 from hypothesis import given
-from PIL import Image
+from PIL import Image, ImageChops, ImageDraw
 
 from ocrmypdf.imageops import (
     _calculate_downsample,
+    binarize_otsu,
+    binarize_sauvola,
     bytes_per_pixel,
     calculate_downsample,
     downsample_image,
+    estimate_skew,
+    ocr_image_mode,
+    otsu_threshold,
+    remove_background,
+    rotate_page_image,
+    text_line_height,
 )
 
 
@@ -56,3 +67,192 @@ def test_downsample_image():
     ds = downsample_image(im, (50, 50))
     assert ds.size == (50, 50)
     assert ds.info['dpi'] == (150, 150)
+
+
+def _text_block(size=(1700, 2200)):
+    """Draw something with the layout of a page of text: rows of words."""
+    rng = random.Random(42)
+    im = Image.new('L', size, 255)
+    draw = ImageDraw.Draw(im)
+    for top in range(200, size[1] - 200, 60):
+        left = 150
+        while left < size[0] - 300:
+            width = rng.randint(40, 200)
+            draw.rectangle((left, top, left + width, top + 30), fill=0)
+            left += width + 25
+    return im
+
+
+@pytest.mark.parametrize('new_size', [(500, 700), (1199, 1649), (37, 51)])
+def test_downsample_image_strips_match_resize(new_size):
+    im = _text_block((1200, 1650)).convert('RGB')
+    im.info['dpi'] = (300, 300)
+    expected = im.resize(new_size, Image.Resampling.BICUBIC, reducing_gap=3)
+
+    for strip_height in (7, 128):
+        ds = downsample_image(im, new_size, strip_height=strip_height)
+        assert ds.size == new_size
+        diff = ImageChops.difference(ds, expected).convert('L')
+        assert diff.getextrema()[1] <= 1
+
+
+@pytest.mark.parametrize('mode', ['RGB', 'L', '1'])
+def test_downsample_image_reads_raw_rows(tmp_path, mode):
+    page = _text_block((600, 800)).convert(mode)
+    page.save(tmp_path / 'page.tif', compression='raw', dpi=(300, 300))
+    expected = page.convert('L').resize((200, 266), Image.Resampling.BICUBIC)
+
+    with Image.open(tmp_path / 'page.tif') as im:
+        ds = downsample_image(im, (200, 266), mode='L', strip_height=50)
+        # Only the rows were read; the image itself was never decoded
+        assert im.tile
+    assert ds.mode == 'L'
+    assert ds.info['dpi'] == (100, 100)
+    assert ImageChops.difference(ds, expected).getextrema()[1] <= 1
+
+
+def test_downsample_image_palette():
+    im = _text_block((300, 400)).convert('RGB').convert('P')
+    im.info['dpi'] = (300, 300)
+    ds = downsample_image(im, (150, 200))
+    assert ds.mode == 'P'
+    assert ds.convert('RGB').tobytes() == (
+        im.resize((150, 200), Image.Resampling.NEAREST).convert('RGB').tobytes()
+    )
+
+
+@pytest.mark.parametrize('skew', [-8.0, -2.3, -0.4, 0.0, 1.15, 5.0])
+def test_estimate_skew(skew):
+    page = _text_block().rotate(
+        skew, resample=Image.Resampling.BICUBIC, fillcolor=255, expand=True
+    )
+    assert estimate_skew(page) == pytest.approx(-skew, abs=0.1)
+
+
+@pytest.mark.parametrize('mode', ['L', '1', 'RGB'])
+def test_text_line_height(mode):
+    page = _text_block().convert(mode)
+    assert text_line_height(page, 300) == pytest.approx(31, abs=3)
+    small = page.resize((page.width // 3, page.height // 3))
+    assert text_line_height(small, 100) == pytest.approx(10, abs=1)
+
+
+def test_text_line_height_blank():
+    assert text_line_height(Image.new('L', (1700, 2200), 255), 300) is None
+
+
+def test_estimate_skew_blank():
+    assert estimate_skew(Image.new('1', (800, 1000), 1)) == 0.0
+
+
+@pytest.mark.parametrize('correction', [0, 90, 180, 270])
+def test_rotate_page_image_matches_two_passes(correction):
+    page = _text_block((300, 400))
+    two_pass = page
+    if correction:
+        two_pass = page.transpose(Image.Transpose[f'ROTATE_{correction}'])
+    two_pass = two_pass.rotate(3.0, resample=Image.Resampling.BICUBIC, fillcolor=255)
+
+    fused = rotate_page_image(page, correction, 3.0)
+    assert fused.size == two_pass.size
+    diff = ImageChops.difference(fused, two_pass).crop((2, 2, *fused.size))
+    assert diff.getextrema()[1] <= 2
+
+
+def test_rotate_page_image_mono():
+    page = _text_block((300, 400)).convert('1')
+    assert rotate_page_image(page, 90).tobytes() == (
+        page.transpose(Image.Transpose.ROTATE_90).tobytes()
+    )
+    fused = rotate_page_image(page, 90, 1.5)
+    assert fused.mode == '1'
+    assert fused.size == (400, 300)
+
+
+def _yellowed_page():
+    # Text-like blocks on paper that darkens and yellows from top to bottom
+    text = _text_block((600, 800)).convert('RGB')
+    paper = Image.merge(
+        'RGB',
+        [
+            Image.linear_gradient('L')
+            .resize((600, 800))
+            .point(lambda v, hi=hi: hi - v // 8)
+            for hi in (240, 225, 170)
+        ],
+    )
+    return ImageChops.multiply(text, paper)
+
+
+@pytest.mark.parametrize('mode', ['RGB', 'L'])
+def test_remove_background(mode):
+    page = _yellowed_page().convert(mode)
+    page.info['dpi'] = (100, 100)
+    cleaned = remove_background(page, dpi=100)
+
+    assert cleaned.mode == mode
+    assert cleaned.size == page.size
+    assert cleaned.info['dpi'] == (100, 100)
+    # Margins become white; text stays black
+    assert cleaned.crop((0, 0, 100, 800)).getextrema() == (
+        ((255, 255),) * 3 if mode == 'RGB' else (255, 255)
+    )
+    assert cleaned.convert('L').getpixel((160, 215)) == 0
+
+
+def test_remove_background_strips_are_seamless():
+    page = _yellowed_page()
+    assert (
+        remove_background(page, dpi=100, strip_height=37).tobytes()
+        == remove_background(page, dpi=100, strip_height=10000).tobytes()
+    )
+
+
+def _ink_fraction(image, box):
+    histogram = image.crop(box).convert('L').histogram()
+    return histogram[0] / sum(histogram)
+
+
+def test_otsu_threshold():
+    im = Image.new('L', (100, 100), 200)
+    im.paste(40, (0, 0, 30, 100))
+    assert 40 <= otsu_threshold(im) < 200
+    assert binarize_otsu(im).getpixel((10, 10)) == 0
+    assert binarize_otsu(im).getpixel((50, 10)) == 255
+
+
+def test_binarize_sauvola_uneven_lighting():
+    # Lines of thin strokes, like text; the right half is in shadow, darker
+    # than the text on the left half
+    text = Image.new('L', (1700, 2200), 255)
+    for top in range(200, 2000, 60):
+        for left in range(150, 1550, 10):
+            text.paste(0, (left, top, left + 3, top + 30))
+    page = text.point(lambda v: 150 if v < 128 else 255)
+    shadow = text.point(lambda v: 20 if v < 128 else 100)
+    page.paste(shadow.crop((850, 0, 1700, 2200)), (850, 0))
+    page.info['dpi'] = (300, 300)
+
+    otsu = binarize_otsu(page)
+    sauvola = binarize_sauvola(page, dpi=300)
+
+    # Away from the edge of the shadow
+    left, right = (0, 0, 800, 2200), (900, 0, 1700, 2200)
+    expected = _ink_fraction(text, right)
+    assert _ink_fraction(otsu, right) == 1.0
+    assert _ink_fraction(sauvola, right) == pytest.approx(expected, abs=0.01)
+    assert _ink_fraction(sauvola, left) == pytest.approx(expected, abs=0.01)
+    assert sauvola.mode == '1'
+    assert sauvola.info['dpi'] == (300, 300)
+
+
+@pytest.mark.parametrize(
+    'mode, image_mode',
+    [('color', 'RGB'), ('gray', 'L'), ('otsu', '1'), ('sauvola', '1')],
+)
+def test_ocr_image_mode(mode, image_mode):
+    im = _text_block((400, 500)).convert('RGB')
+    im.info['dpi'] = (300, 300)
+    converted = ocr_image_mode(im, mode, dpi=300)
+    assert converted.mode == image_mode
+    assert converted.info['dpi'] == (300, 300)
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import pytest
+
+from ocrmypdf.languages import language_scripts, languages_for_script
+
+
+@pytest.mark.parametrize(
+    'language, scripts',
+    [
+        ('eng', {'Latin'}),
+        ('deu', {'Latin', 'Fraktur'}),
+        ('jpn', {'Han', 'Japanese'}),
+        ('srp_latn', {'Latin'}),
+        ('spa_frak', {'Fraktur'}),
+        ('fra_latf', {'Fraktur'}),
+        ('eng_custom', {'Latin'}),
+        ('script/Cyrillic', {'Cyrillic'}),
+        ('script/HanS_vert', {'Han'}),
+        ('xyz', set()),
+        ('custom_model', set()),
+    ],
+)
+def test_language_scripts(language, scripts):
+    assert language_scripts(language) == scripts
+
+
+@pytest.mark.parametrize(
+    'script, expected',
+    [
+        ('Latin', ['eng', 'deu', 'custom_model']),
+        ('Cyrillic', ['rus', 'custom_model']),
+        ('Han', ['chi_sim', 'custom_model']),
+        ('Thai', ['custom_model']),
+    ],
+)
+def test_languages_for_script(script, expected):
+    languages = ['eng', 'rus', 'deu', 'chi_sim', 'custom_model']
+    assert languages_for_script(languages, script) == expected
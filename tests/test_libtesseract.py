@@ -0,0 +1,303 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from ocrmypdf._exec import libtesseract, tesseract
+from ocrmypdf._exec.libtesseract import (
+    PT_HEADING_TEXT,
+    RIL_PARA,
+    RIL_TEXTLINE,
+    build_page,
+)
+from ocrmypdf._exec.tesseract import ThresholdingMethod
+from ocrmypdf.builtin_plugins import libtesseract_ocr
+from ocrmypdf.builtin_plugins.tesseract_ocr import TesseractOcrEngine
+from ocrmypdf.exceptions import BadArgsError
+from ocrmypdf.models.ocr_element import Baseline, BoundingBox, OcrClass
+from ocrmypdf.pluginspec import OrientationConfidence, PageGeometry
+
+needs_libtesseract = pytest.mark.skipif(
+    not libtesseract.available(), reason="libtesseract not installed"
+)
+
+
+@dataclass
+class FakeWord:
+    para: int
+    line: int
+    text: str
+    box: tuple[int, int, int, int]
+    block_type: int = 1
+    orientation: int = 0
+    direction: int = 0
+    language: str = 'eng'
+    confidence: float = 90.0
+
+
+@dataclass
+class FakeIterator:
+    """Stands in for libtesseract.ResultIterator, walking a list of words."""
+
+    words: list[FakeWord]
+    n: int = 0
+
+    def is_at_beginning_of(self, level):
+        if self.n == 0:
+            return True
+        word, prev = self.words[self.n], self.words[self.n - 1]
+        if level == RIL_PARA:
+            return word.para != prev.para
+        assert level == RIL_TEXTLINE
+        return (word.para, word.line) != (prev.para, prev.line)
+
+    def _line_words(self):
+        word = self.words[self.n]
+        return [w for w in self.words if (w.para, w.line) == (word.para, word.line)]
+
+    def bounding_box(self, level):
+        if level == RIL_TEXTLINE:
+            boxes = [w.box for w in self._line_words()]
+            return (
+                min(b[0] for b in boxes),
+                min(b[1] for b in boxes),
+                max(b[2] for b in boxes),
+                max(b[3] for b in boxes),
+            )
+        return self.words[self.n].box
+
+    def baseline(self, level):
+        left, _top, right, bottom = self.bounding_box(level)
+        return (left, bottom - 5, right, bottom - 5)
+
+    def block_type(self):
+        return self.words[self.n].block_type
+
+    def orientation(self):
+        return self.words[self.n].orientation, self.words[self.n].direction
+
+    def text(self, level):
+        return self.words[self.n].text
+
+    def confidence(self, level):
+        return self.words[self.n].confidence
+
+    def language(self):
+        return self.words[self.n].language
+
+    def next(self, level):
+        self.n += 1
+        return self.n < len(self.words)
+
+
+def test_build_page():
+    words = [
+        FakeWord(0, 0, 'Title', (10, 10, 100, 40), block_type=PT_HEADING_TEXT),
+        FakeWord(1, 0, 'ﬁrst', (10, 60, 50, 80), confidence=95.7),
+        FakeWord(1, 0, 'line', (60, 60, 100, 80)),
+        FakeWord(1, 1, ' ', (10, 90, 20, 110)),
+        FakeWord(2, 0, 'שלום', (10, 120, 60, 140), direction=1, language='heb'),
+    ]
+    page = build_page(FakeIterator(words), (200, 300), dpi=300.0, page_number=4)
+
+    assert page.bbox == BoundingBox(left=0, top=0, right=200, bottom=300)
+    assert page.dpi == 300.0
+    assert page.page_number == 4
+    header, body, hebrew = page.paragraphs
+    assert header.children[0].ocr_class == OcrClass.HEADER
+    # The line with only a blank word is dropped
+    assert [line.ocr_class for line in body.children] == [OcrClass.LINE]
+    assert [w.text for w in body.words] == ['first', 'line']
+    assert body.words[0].confidence == 0.95
+    assert body.children[0].baseline == Baseline(slope=0.0, intercept=-5)
+    assert hebrew.direction == 'rtl'
+    assert hebrew.language == 'heb'
+    assert hebrew.words[0].direction == 'rtl'
+
+
+def test_build_page_rotated_line():
+    words = [FakeWord(0, 0, 'up', (10, 10, 30, 100), orientation=1)]
+    page = build_page(FakeIterator(words), (200, 300), dpi=None, page_number=0)
+    assert page.lines[0].textangle == 270.0
+
+
+def test_build_page_no_text():
+    words = [FakeWord(0, 0, '', (10, 10, 30, 100))]
+    page = build_page(FakeIterator(words), (200, 300), dpi=None, page_number=0)
+    assert page.children == []
+
+
+def _options(**kwargs):
+    tesseract = SimpleNamespace(
+        oem=None,
+        config=[],
+        pagesegmode=None,
+        thresholding=ThresholdingMethod.AUTO,
+        timeout=180.0,
+        user_words=None,
+        user_patterns=None,
+        omp_thread_limit=1,
+        non_ocr_timeout=180.0,
+        batch_size=1,
+        fast_tessdata=None,
+    )
+    return SimpleNamespace(
+        ocr_engine='libtesseract',
+        languages=['eng'],
+        use_threads=False,
+        tesseract=tesseract,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    'available, engine',
+    [
+        (True, libtesseract_ocr.LibTesseractOcrEngine),
+        (False, TesseractOcrEngine),
+    ],
+)
+def test_get_ocr_engine(monkeypatch, available, engine):
+    monkeypatch.setattr(libtesseract, 'available', lambda: available)
+    assert type(libtesseract_ocr.get_ocr_engine(_options())) is engine
+    assert libtesseract_ocr.get_ocr_engine(SimpleNamespace(ocr_engine='auto')) is None
+
+
+def test_check_options_rejects_fast_tessdata():
+    options = _options()
+    options.tesseract.fast_tessdata = '/fast'
+    with pytest.raises(BadArgsError):
+        libtesseract_ocr.check_options(options)
+
+
+def test_get_api_keeps_recently_used(monkeypatch):
+    class FakeApi:
+        def __init__(self, lib, key):
+            self.languages = key.languages
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(libtesseract, 'load', lambda omp_thread_limit: None)
+    monkeypatch.setattr(libtesseract, 'TessBaseAPI', FakeApi)
+    monkeypatch.setattr(libtesseract, '_pool', threading.local())
+
+    def get_api(*languages):
+        return libtesseract.get_api(
+            languages=languages,
+            engine_mode=None,
+            tessconfig=[],
+            user_words=None,
+            user_patterns=None,
+        )
+
+    eng, rus, osd = get_api('eng'), get_api('rus'), get_api('osd')
+    assert get_api('eng') is eng
+    ell = get_api('ell')
+    assert rus.closed
+    assert not eng.closed
+    assert not osd.closed
+    assert not ell.closed
+    assert get_api('eng') is eng
+
+
+def test_generate_ocr_falls_back_to_program(monkeypatch, tmp_path, caplog):
+    def fail(**kwargs):
+        raise libtesseract.LibTesseractError("could not initialize")
+
+    def fake_generate_hocr_stdout(**kwargs):
+        return (
+            b"<html><body><div class='ocr_page' title='bbox 0 0 100 50'>"
+            b"<p class='ocr_par'><span class='ocr_line' title='bbox 1 1 60 20'>"
+            b"<span class='ocrx_word' title='bbox 1 1 60 20; x_wconf 90'>hello"
+            b"</span></span></p></div></body></html>"
+        )
+
+    monkeypatch.setattr(libtesseract, 'get_api', fail)
+    monkeypatch.setattr(tesseract, 'generate_hocr_stdout', fake_generate_hocr_stdout)
+    image = tmp_path / 'ocr.png'
+    Image.new('L', (100, 50), 255).save(image)
+
+    page, text = libtesseract_ocr.LibTesseractOcrEngine.generate_ocr(
+        image, _options(), page_number=2
+    )
+
+    assert [w.text for w in page.words] == ['hello']
+    assert page.page_number == 2
+    assert text == 'hello\n'
+    assert 'using the tesseract program' in caplog.text
+
+
+def test_get_page_geometry_one_analysis(monkeypatch, tmp_path):
+    calls = []
+
+    class FakeApi:
+        def page_geometry(self, image, *, orientation, deskew):
+            calls.append((image.size, orientation, deskew))
+            return 90, 12.5, -1.5
+
+    def get_api(**kwargs):
+        assert kwargs['languages'] == ['osd']
+        return FakeApi()
+
+    monkeypatch.setattr(libtesseract, 'get_api', get_api)
+    image = tmp_path / 'preview.png'
+    Image.new('L', (100, 50), 255).save(image)
+    engine = libtesseract_ocr.LibTesseractOcrEngine()
+
+    assert engine.supports_page_geometry()
+    geometry = engine.get_page_geometry(image, _options())
+    assert geometry == PageGeometry(90, 12.5, -1.5)
+    assert calls == [((100, 50), True, True)]
+
+
+def test_get_page_geometry_falls_back_to_program(monkeypatch, tmp_path, caplog):
+    def fail(**kwargs):
+        raise libtesseract.LibTesseractError("could not initialize")
+
+    monkeypatch.setattr(libtesseract, 'get_api', fail)
+    monkeypatch.setattr(
+        TesseractOcrEngine,
+        'get_orientation',
+        staticmethod(lambda input_file, options: OrientationConfidence(180, 5.0)),
+    )
+    monkeypatch.setattr(
+        TesseractOcrEngine, 'get_deskew', staticmethod(lambda input_file, options: 2.0)
+    )
+
+    geometry = libtesseract_ocr.LibTesseractOcrEngine().get_page_geometry(
+        tmp_path / 'preview.png', _options()
+    )
+
+    assert geometry == PageGeometry(180, 5.0, 2.0)
+    assert 'using the tesseract program' in caplog.text
+
+
+@needs_libtesseract
+def test_recognize_matches_program(resources, tmp_path):
+    from ocrmypdf.hocrtransform import HocrParser
+
+    image = tmp_path / 'page.png'
+    with Image.open(resources / 'typewriter.png') as im:
+        im.save(image, dpi=(300, 300))
+    options = _options()
+
+    page, text = libtesseract_ocr.LibTesseractOcrEngine.generate_ocr(
+        image, options, page_number=0
+    )
+    TesseractOcrEngine.generate_hocr(
+        image, tmp_path / 'page.hocr', tmp_path / 'page.txt', options
+    )
+    expected = HocrParser(tmp_path / 'page.hocr').parse()
+
+    assert [w.text for w in page.words] == [w.text for w in expected.words]
+    assert [w.bbox for w in page.words] == [w.bbox for w in expected.words]
+    assert text == (tmp_path / 'page.txt').read_text(encoding='utf-8')
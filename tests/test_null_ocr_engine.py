@@ -128,6 +128,19 @@ class TestNullOcrEngineGenerateOcr:
         assert ocr_tree.bbox.right == 100
         assert ocr_tree.bbox.bottom == 100
 
+    def test_generate_ocr_batch(self, sample_image):
+        """generate_ocr_batch() should return one result per image, in order."""
+        from ocrmypdf.builtin_plugins.null_ocr import NullOcrEngine
+
+        engine = NullOcrEngine()
+        assert engine.supports_generate_ocr_batch()
+        results = engine.generate_ocr_batch(
+            [sample_image, sample_image], MagicMock(), [3, 7]
+        )
+
+        assert [tree.page_number for tree, _ in results] == [3, 7]
+        assert [text for _, text in results] == ["", ""]
+
 
 class TestOcrEngineOption:
     """Test --ocr-engine CLI option."""
@@ -0,0 +1,111 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ocrmypdf._ocr_batch import OcrBatcher
+from ocrmypdf._options import OcrOptions
+from ocrmypdf.builtin_plugins.null_ocr import NullOcrEngine
+from ocrmypdf.models.ocr_element import OcrClass, OcrElement
+
+
+class RecordingEngine(NullOcrEngine):
+    def __init__(self, fail_batch=False):
+        """Record the pages OCRed by each call."""
+        self.fail_batch = fail_batch
+        self.batches = []
+        self.singles = []
+
+    def generate_ocr(self, input_file, options, page_number=0):
+        if input_file.name == 'bad.png':
+            raise ValueError("bad page")
+        self.singles.append(page_number)
+        return OcrElement(ocr_class=OcrClass.PAGE, page_number=page_number), ''
+
+    def generate_ocr_batch(self, input_files, options, page_numbers):
+        if self.fail_batch:
+            raise ValueError("batch failed")
+        self.batches.append(list(page_numbers))
+        return [
+            (OcrElement(ocr_class=OcrClass.PAGE, page_number=n), f'page {n}')
+            for n in page_numbers
+        ]
+
+
+@pytest.fixture
+def options(tmp_path):
+    return OcrOptions(input_file=tmp_path / 'in.pdf', output_file=tmp_path / 'out.pdf')
+
+
+def _ocr_concurrently(batcher, engine, options, files, batch_size):
+    with ThreadPoolExecutor(len(files)) as executor:
+        futures = [
+            executor.submit(
+                batcher.generate_ocr, engine, f, options, n, batch_size=batch_size
+            )
+            for n, f in enumerate(files)
+        ]
+        return futures, [f.exception() for f in futures]
+
+
+def test_ocr_batcher_combines_pages(tmp_path, options):
+    engine = RecordingEngine()
+    files = [tmp_path / f'{n}.png' for n in range(3)]
+    futures, _ = _ocr_concurrently(OcrBatcher(window=5.0), engine, options, files, 3)
+
+    assert [sorted(b) for b in engine.batches] == [[0, 1, 2]]
+    assert engine.singles == []
+    for n, future in enumerate(futures):
+        tree, text = future.result()
+        assert tree.page_number == n
+        assert text == f'page {n}'
+
+
+def test_ocr_batcher_runs_incomplete_batch(tmp_path, options):
+    engine = RecordingEngine()
+    tree, _ = OcrBatcher(window=0.01).generate_ocr(
+        engine, tmp_path / 'page.png', options, 4, batch_size=4
+    )
+    # A batch of one page is OCRed as a single page
+    assert tree.page_number == 4
+    assert engine.singles == [4]
+    assert engine.batches == []
+
+
+def test_ocr_batcher_retries_failed_batch_singly(tmp_path, options):
+    engine = RecordingEngine(fail_batch=True)
+    files = [tmp_path / 'good.png', tmp_path / 'bad.png']
+    futures, errors = _ocr_concurrently(
+        OcrBatcher(window=5.0), engine, options, files, 2
+    )
+
+    assert futures[0].result()[0].page_number == 0
+    assert isinstance(errors[1], ValueError)
+    assert engine.singles == [0]
+
+
+def test_ocr_batcher_keeps_different_options_apart(tmp_path, options):
+    engine = RecordingEngine()
+    other_options = options.model_copy(update={'languages': ['deu']})
+    batcher = OcrBatcher(window=0.2)
+    with ThreadPoolExecutor(2) as executor:
+        futures = [
+            executor.submit(
+                batcher.generate_ocr,
+                engine,
+                tmp_path / f'{n}.png',
+                page_options,
+                n,
+                batch_size=2,
+            )
+            for n, page_options in enumerate((options, other_options))
+        ]
+        for future in futures:
+            future.result()
+
+    assert engine.batches == []
+    assert sorted(engine.singles) == [0, 1]
@@ -108,6 +108,59 @@ class TestOcrEngineInterface:
         with pytest.raises(NotImplementedError):
             engine.generate_ocr(Path("test.png"), MagicMock(), 0)
 
+    def test_get_page_geometry_default(self):
+        """Default get_page_geometry() calls only the analyses requested."""
+        from ocrmypdf.pluginspec import OrientationConfidence, PageGeometry
+
+        calls = []
+
+        class MinimalEngine(OcrEngine):
+            @staticmethod
+            def version():
+                return "1.0"
+
+            @staticmethod
+            def creator_tag(options):
+                return "test"
+
+            def __str__(self):
+                return "test"
+
+            @staticmethod
+            def languages(options):
+                return set()
+
+            @staticmethod
+            def get_orientation(input_file, options):
+                calls.append('orientation')
+                return OrientationConfidence(180, 12.5)
+
+            @staticmethod
+            def get_deskew(input_file, options):
+                calls.append('deskew')
+                return -1.5
+
+            @staticmethod
+            def generate_hocr(input_file, output_hocr, output_text, options):
+                pass
+
+            @staticmethod
+            def generate_pdf(input_file, output_pdf, output_text, options):
+                pass
+
+        engine = MinimalEngine()
+        geometry = engine.get_page_geometry(Path("test.png"), MagicMock())
+        assert geometry == PageGeometry(angle=180, confidence=12.5, deskew=-1.5)
+        assert geometry.orientation == OrientationConfidence(180, 12.5)
+        assert calls == ['orientation', 'deskew']
+
+        calls.clear()
+        geometry = engine.get_page_geometry(
+            Path("test.png"), MagicMock(), orientation=False
+        )
+        assert geometry == PageGeometry(deskew=-1.5)
+        assert calls == ['deskew']
+
 
 class TestOcrElementExport:
     """Test that OcrElement is exported from public API."""
@@ -137,3 +137,27 @@ class TestOcrEnginePluginSelection:
 
         engine = null_ocr.get_ocr_engine(options=options)
         assert engine is None
+
+    def test_tesseract_subclass_overriding_hocr_keeps_hocr(self):
+        """Subclasses that override only generate_hocr() should still be used."""
+        from ocrmypdf.builtin_plugins.libtesseract_ocr import LibTesseractOcrEngine
+        from ocrmypdf.builtin_plugins.tesseract_ocr import (
+            TesseractOcrEngine,
+            TwoTierTesseractOcrEngine,
+        )
+
+        class HocrEngine(TesseractOcrEngine):
+            @staticmethod
+            def generate_hocr(input_file, output_hocr, output_text, options):
+                pass
+
+        class OcrEngine(HocrEngine):
+            @staticmethod
+            def generate_ocr(input_file, options, page_number=0):
+                pass
+
+        assert TesseractOcrEngine().supports_generate_ocr()
+        assert TwoTierTesseractOcrEngine().supports_generate_ocr()
+        assert LibTesseractOcrEngine().supports_generate_ocr()
+        assert not HocrEngine().supports_generate_ocr()
+        assert OcrEngine().supports_generate_ocr()
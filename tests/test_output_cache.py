@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import pytest
+
+from ocrmypdf import cache as cache_cli
+from ocrmypdf._options import OcrOptions
+from ocrmypdf._output_cache import (
+    describe_entry,
+    output_cache,
+    output_cache_key,
+    restore_output,
+    store_output,
+)
+from ocrmypdf._plugin_manager import get_plugin_manager
+from ocrmypdf.builtin_plugins.null_ocr import NullOcrEngine
+
+from .conftest import check_ocrmypdf
+
+
+@pytest.fixture
+def plugin_manager():
+    return get_plugin_manager([])
+
+
+@pytest.fixture
+def input_file(tmp_path):
+    path = tmp_path / 'input.pdf'
+    path.write_bytes(b'%PDF-1.7 input')
+    return path
+
+
+def _options(tmp_path, **kwargs):
+    kwargs.setdefault('output_file', tmp_path / 'output.pdf')
+    return OcrOptions(
+        input_file=tmp_path / 'input.pdf',
+        ocr_engine='none',
+        output_type='pdf',
+        output_cache=tmp_path / 'cache',
+        **kwargs,
+    )
+
+
+def test_key_ignores_destination_and_parallelism(tmp_path, input_file, plugin_manager):
+    key = output_cache_key(input_file, _options(tmp_path), plugin_manager)
+    assert key == output_cache_key(
+        input_file,
+        _options(tmp_path, output_file=tmp_path / 'other.pdf', jobs=3),
+        plugin_manager,
+    )
+    assert key != output_cache_key(
+        input_file, _options(tmp_path, optimize=2), plugin_manager
+    )
+    assert key != output_cache_key(
+        input_file, _options(tmp_path, sidecar=tmp_path / 'out.txt'), plugin_manager
+    )
+    input_file.write_bytes(b'%PDF-1.7 changed')
+    assert key != output_cache_key(input_file, _options(tmp_path), plugin_manager)
+
+
+def test_key_depends_on_wordlist_contents(tmp_path, input_file, plugin_manager):
+    wordlist = tmp_path / 'words.txt'
+    wordlist.write_text('invoice\n')
+    options = _options(
+        tmp_path, mode='skip', skip_text_quality=0.7, skip_text_wordlist=wordlist
+    )
+    key = output_cache_key(input_file, options, plugin_manager)
+    wordlist.write_text('receipt\n')
+    assert key != output_cache_key(input_file, options, plugin_manager)
+
+
+def test_key_depends_on_config_contents(tmp_path, input_file, plugin_manager):
+    config = tmp_path / 'config'
+    config.write_text('tessedit_char_whitelist 0123456789\n')
+    options = _options(tmp_path, tesseract_config=[str(config)])
+    key = output_cache_key(input_file, options, plugin_manager)
+    config.write_text('tessedit_char_whitelist ABC\n')
+    assert key != output_cache_key(input_file, options, plugin_manager)
+
+
+def test_key_depends_on_engine_parameters(
+    tmp_path, input_file, plugin_manager, monkeypatch
+):
+    options = _options(tmp_path)
+    monkeypatch.setattr(
+        NullOcrEngine, 'cache_parameters', staticmethod(lambda options: '/models')
+    )
+    key = output_cache_key(input_file, options, plugin_manager)
+    monkeypatch.setattr(
+        NullOcrEngine, 'cache_parameters', staticmethod(lambda options: '/other')
+    )
+    assert key != output_cache_key(input_file, options, plugin_manager)
+
+
+def test_store_and_restore(tmp_path):
+    options = _options(tmp_path, sidecar=tmp_path / 'output.txt')
+    cache = output_cache(options)
+    assert not restore_output(cache, 'abcdef', options)
+
+    options.output_file.write_bytes(b'%PDF-1.7 output')
+    options.sidecar.write_text('text')
+    store_output(cache, 'abcdef', options, 'input.pdf')
+    (entry,) = cache.entries()
+    assert describe_entry(entry.path) == 'input.pdf'
+
+    restored = _options(
+        tmp_path,
+        output_file=tmp_path / 'restored.pdf',
+        sidecar=tmp_path / 'restored.txt',
+    )
+    assert restore_output(cache, 'abcdef', restored)
+    assert restored.output_file.read_bytes() == b'%PDF-1.7 output'
+    assert restored.sidecar.read_text() == 'text'
+
+
+def test_restore_requires_sidecar(tmp_path):
+    options = _options(tmp_path)
+    cache = output_cache(options)
+    options.output_file.write_bytes(b'%PDF-1.7 output')
+    store_output(cache, 'abcdef', options, 'input.pdf')
+    with_sidecar = _options(tmp_path, sidecar=tmp_path / 'output.txt')
+    assert not restore_output(cache, 'abcdef', with_sidecar)
+
+
+def test_cache_command(tmp_path, capsys):
+    options = _options(tmp_path)
+    cache = output_cache(options)
+    options.output_file.write_bytes(b'%PDF-1.7 output')
+    store_output(cache, 'abcdef', options, 'input.pdf')
+
+    assert cache_cli.main(['info', str(cache.root)]) == 0
+    assert '1 entries' in capsys.readouterr().out
+    assert cache_cli.main(['list', str(cache.root)]) == 0
+    assert 'abcdef  input.pdf' in capsys.readouterr().out
+    assert cache_cli.main(['prune', str(cache.root), '--older-than', '1']) == 0
+    assert 'Deleted 0 entries' in capsys.readouterr().out
+    assert cache_cli.main(['clear', str(cache.root)]) == 0
+    assert 'Deleted 1 entries' in capsys.readouterr().out
+    assert cache.entries() == []
+
+
+def test_cache_command_prune_requires_limit(tmp_path):
+    with pytest.raises(SystemExit):
+        cache_cli.main(['prune', str(tmp_path)])
+
+
+def test_output_cache(resources, outpdf, caplog):
+    cache_dir = outpdf.parent / 'cache'
+    args = ['--ocr-engine', 'none', '--output-type', 'pdf', '--output-cache', cache_dir]
+    check_ocrmypdf(resources / 'ccitt.pdf', outpdf, *args)
+    outpdf.unlink()
+    caplog.set_level('INFO')
+    check_ocrmypdf(resources / 'ccitt.pdf', outpdf, *args)
+    assert 'Output copied from --output-cache' in caplog.text
+
+
+def test_output_cache_skips_timed_out_pages(resources, outpdf):
+    cache_dir = outpdf.parent / 'cache'
+    check_ocrmypdf(
+        resources / 'ccitt.pdf',
+        outpdf,
+        '--output-type',
+        'pdf',
+        '--output-cache',
+        cache_dir,
+        '--plugin',
+        'ocrmypdf.extra_plugins.synthetic_ocr',
+        '--synthetic-latency',
+        '0',
+        '--synthetic-timeout-rate',
+        '1',
+        '--synthetic-timeout',
+        '0',
+    )
+    assert output_cache(_options(outpdf.parent)).entries() == []
@@ -14,10 +14,13 @@ from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen.canvas import Canvas
 
 from ocrmypdf import _pipeline, pdfinfo
+from ocrmypdf._options import OcrOptions
 from ocrmypdf._pipeline import _select_raster_device
+from ocrmypdf._pipelines import _common
 from ocrmypdf.helpers import Resolution
+from ocrmypdf.imageops import estimate_skew
 from ocrmypdf.pdfinfo import Encoding
-from ocrmypdf.pluginspec import GhostscriptRasterDevice
+from ocrmypdf.pluginspec import GhostscriptRasterDevice, PageGeometry, ScriptConfidence
 
 warnings.filterwarnings(
     "ignore", category=DeprecationWarning, module="reportlab.lib.rl_safe_eval"
@@ -215,3 +218,454 @@ def test_select_device_black_mask_stays_mono(tmp_path):
     p = _make_image_mask_pdf(tmp_path / 'b.pdf', b"0 g")
     pageinfo = pdfinfo.PdfInfo(p)[0]
     assert _select_raster_device(pageinfo) == GhostscriptRasterDevice.PNGMONOD
+
+
+def _page_context_for(tmp_path, intermediate_image_format='png'):
+    ctx = Mock()
+    ctx.get_path = lambda name: tmp_path / name
+    ctx.options.intermediate_image_format = intermediate_image_format
+    return ctx
+
+
+def test_create_preview_image_downsamples(tmp_path):
+    raster = tmp_path / 'rasterize.png'
+    Image.new('1', (1200, 600), 1).save(raster, dpi=(600, 600))
+
+    preview = _pipeline.create_preview_image(raster, _page_context_for(tmp_path))
+    with Image.open(preview) as im:
+        assert im.format == 'JPEG'
+        assert im.mode == 'L'
+        assert im.size == (600, 300)
+        assert im.info['dpi'] == pytest.approx((300, 300))
+
+
+def test_create_preview_image_keeps_low_resolution(tmp_path):
+    raster = tmp_path / 'rasterize.png'
+    Image.new('RGB', (200, 100), 'white').save(raster, dpi=(150, 150))
+
+    preview = _pipeline.create_preview_image(raster, _page_context_for(tmp_path))
+    with Image.open(preview) as im:
+        assert im.mode == 'L'
+        assert im.size == (200, 100)
+
+
+@pytest.mark.parametrize(
+    'correction, expected_pixel',
+    [(0, (0, 0)), (90, (0, 19)), (180, (19, 9)), (270, (9, 0))],
+)
+def test_rotate_raster(tmp_path, correction, expected_pixel):
+    raster = tmp_path / 'rasterize.png'
+    im = Image.new('L', (20, 10), 255)
+    im.putpixel((0, 0), 0)
+    im.save(raster, dpi=(100, 50))
+
+    out = _pipeline.rotate_raster(raster, _page_context_for(tmp_path), correction)
+    if correction == 0:
+        assert out == raster
+    with Image.open(out) as rotated:
+        if correction % 180 == 90:
+            assert rotated.size == (10, 20)
+            assert rotated.info['dpi'] == pytest.approx((50, 100), abs=0.1)
+        else:
+            assert rotated.size == (20, 10)
+            assert rotated.info['dpi'] == pytest.approx((100, 50), abs=0.1)
+        assert rotated.getpixel(expected_pixel) == 0
+
+
+def test_rotate_raster_deskew(tmp_path):
+    raster = tmp_path / 'rasterize.png'
+    Image.new('L', (20, 10), 255).save(raster, dpi=(100, 50))
+
+    out = _pipeline.rotate_raster(raster, _page_context_for(tmp_path), 90, 2.0)
+    assert out != raster
+    with Image.open(out) as rotated:
+        assert rotated.size == (10, 20)
+        assert rotated.info['dpi'] == pytest.approx((50, 100), abs=0.1)
+        # Corners exposed by the deskew are filled with white
+        assert rotated.getextrema() == (255, 255)
+
+
+@pytest.mark.parametrize(
+    'image_format, suffix, pil_format',
+    [('png', '.png', 'PNG'), ('png-fast', '.png', 'PNG'), ('tiff', '.tif', 'TIFF')],
+)
+def test_intermediate_image_format(tmp_path, image_format, suffix, pil_format):
+    raster = tmp_path / 'rasterize.png'
+    Image.new('RGB', (20, 10), 'white').save(raster, dpi=(100, 50))
+    ctx = _page_context_for(tmp_path, image_format)
+
+    out = _pipeline.rotate_raster(raster, ctx, 90)
+    assert out.suffix == suffix
+    with Image.open(out) as im:
+        assert im.format == pil_format
+        assert im.size == (10, 20)
+        assert im.info['dpi'] == pytest.approx((50, 100), abs=0.1)
+
+
+def _make_scan_pdf(path, im, *, with_vector=False, mask=False):
+    pdf = pikepdf.new()
+    page = pdf.add_blank_page(page_size=(im.width * 72 / 100, im.height * 72 / 100))
+    image = pikepdf.Stream(pdf, im.tobytes())
+    image.Type = pikepdf.Name.XObject
+    image.Subtype = pikepdf.Name.Image
+    image.Width, image.Height = im.size
+    image.ColorSpace = pikepdf.Name.DeviceGray
+    image.BitsPerComponent = 8
+    if mask:
+        image.Decode = [1, 0]
+    page.Resources = pikepdf.Dictionary(XObject=pikepdf.Dictionary(Im0=image))
+    content = b"q %f 0 0 %f 0 0 cm /Im0 Do Q" % tuple(page.mediabox[2:4])
+    if with_vector:
+        content += b" 0 0 m 10 10 l S"
+    page.Contents = pdf.make_stream(content)
+    pdf.save(path)
+    return path
+
+
+def _extract_context(tmp_path, pdf_path):
+    ctx = _page_context_for(tmp_path)
+    ctx.options.oversample = 0
+    ctx.pageinfo = pdfinfo.PdfInfo(pdf_path)[0]
+    return ctx
+
+
+@pytest.fixture
+def gradient_image():
+    im = Image.new('L', (40, 30))
+    im.putdata([(x * 6 + y) % 256 for y in range(30) for x in range(40)])
+    return im
+
+
+def test_extract_page_image(tmp_path, gradient_image):
+    pdf_path = _make_scan_pdf(tmp_path / 'scan.pdf', gradient_image)
+    ctx = _extract_context(tmp_path, pdf_path)
+
+    out = _pipeline.extract_page_image(pdf_path, ctx, output_tag='_x')
+    assert out == tmp_path / 'rasterize_x.png'
+    with Image.open(out) as im:
+        assert im.mode == 'L'
+        assert im.tobytes() == gradient_image.tobytes()
+        assert im.info['dpi'] == pytest.approx((100, 100), abs=0.1)
+
+
+def test_extract_page_image_rotated(tmp_path, gradient_image):
+    pdf_path = _make_scan_pdf(tmp_path / 'scan.pdf', gradient_image)
+    ctx = _extract_context(tmp_path, pdf_path)
+
+    out = _pipeline.extract_page_image(pdf_path, ctx, correction=90)
+    with Image.open(out) as im:
+        expected = gradient_image.transpose(Image.Transpose.ROTATE_90)
+        assert im.tobytes() == expected.tobytes()
+
+
+@pytest.mark.parametrize('with_vector, mask', [(True, False), (False, True)])
+def test_extract_page_image_declines(tmp_path, gradient_image, with_vector, mask):
+    pdf_path = _make_scan_pdf(
+        tmp_path / 'scan.pdf', gradient_image, with_vector=with_vector, mask=mask
+    )
+    ctx = _extract_context(tmp_path, pdf_path)
+    assert _pipeline.extract_page_image(pdf_path, ctx) is None
+
+
+def test_extract_page_image_declines_partial_coverage(tmp_path, rgb_image):
+    c = Canvas(str(tmp_path / 'partial.pdf'), pagesize=(5 * inch, 5 * inch))
+    c.drawImage(rgb_image, 1 * inch, 1 * inch, width=1 * inch, height=1 * inch)
+    c.showPage()
+    c.save()
+    ctx = _extract_context(tmp_path, tmp_path / 'partial.pdf')
+    assert _pipeline.extract_page_image(tmp_path / 'partial.pdf', ctx) is None
+
+
+def test_preprocess_deskew_projection(tmp_path):
+    page = Image.new('L', (850, 1100), 255)
+    for top in range(100, 1000, 40):
+        page.paste(0, (100, top, 750, top + 15))
+    skewed = page.rotate(3.0, resample=Image.Resampling.BICUBIC, fillcolor=255)
+    pdf_path = _make_scan_pdf(tmp_path / 'scan.pdf', skewed)
+    skewed.save(tmp_path / 'skewed.png', dpi=(100, 100))
+    ctx = _extract_context(tmp_path, pdf_path)
+    ctx.options.deskew_method = 'projection'
+
+    out = _pipeline.preprocess_deskew(tmp_path / 'skewed.png', ctx)
+
+    ctx.plugin_manager.get_ocr_engine.assert_not_called()
+    with Image.open(out) as im:
+        assert estimate_skew(im) == pytest.approx(0.0, abs=0.1)
+
+
+def _geometry_context(tmp_path, **options):
+    ctx = _page_context_for(tmp_path)
+    ctx.options.rotate_pages_threshold = 2.0
+    ctx.pageinfo.rotation = 0
+    for name, value in options.items():
+        setattr(ctx.options, name, value)
+    return ctx
+
+
+def test_get_page_geometry_one_engine_call(tmp_path):
+    ctx = _geometry_context(
+        tmp_path, rotate_pages=True, deskew=True, deskew_method='engine'
+    )
+    engine = ctx.plugin_manager.get_ocr_engine.return_value
+    engine.supports_page_geometry.return_value = True
+    engine.get_page_geometry.return_value = PageGeometry(180, 10.0, 1.25)
+
+    assert _pipeline.get_page_geometry(tmp_path / 'preview.jpg', ctx) == (180, 1.25)
+    engine.get_page_geometry.assert_called_once_with(
+        tmp_path / 'preview.jpg', ctx.options, orientation=True, deskew=True
+    )
+    engine.get_orientation.assert_not_called()
+    engine.get_deskew.assert_not_called()
+
+
+def test_get_page_geometry_orientation_then_deskew(tmp_path):
+    ctx = _geometry_context(
+        tmp_path, rotate_pages=True, deskew=True, deskew_method='engine'
+    )
+    engine = ctx.plugin_manager.get_ocr_engine.return_value
+    engine.supports_page_geometry.return_value = False
+    engine.get_page_geometry.return_value = PageGeometry(180, 10.0)
+    engine.get_deskew.return_value = 1.25
+
+    assert _pipeline.get_page_geometry(tmp_path / 'preview.jpg', ctx) == (180, 1.25)
+    engine.get_page_geometry.assert_called_once_with(
+        tmp_path / 'preview.jpg', ctx.options, orientation=True, deskew=False
+    )
+    engine.get_deskew.assert_called_once_with(tmp_path / 'preview.jpg', ctx.options)
+
+
+def test_get_page_geometry_projection(tmp_path):
+    # A sideways page: the text lines run vertically until rotated upright
+    page = Image.new('L', (1100, 850), 255)
+    for left in range(100, 1000, 40):
+        page.paste(0, (left, 100, left + 15, 750))
+    preview = tmp_path / 'preview.png'
+    page.rotate(-2.0, resample=Image.Resampling.BICUBIC, fillcolor=255).save(preview)
+    ctx = _geometry_context(
+        tmp_path, rotate_pages=True, deskew=True, deskew_method='projection'
+    )
+    engine = ctx.plugin_manager.get_ocr_engine.return_value
+    engine.get_page_geometry.return_value = PageGeometry(270, 10.0)
+
+    correction, deskew_angle = _pipeline.get_page_geometry(preview, ctx)
+
+    engine.get_page_geometry.assert_called_once_with(
+        preview, ctx.options, orientation=True, deskew=False
+    )
+    assert correction == 270
+    assert deskew_angle == pytest.approx(2.0, abs=0.1)
+
+
+def test_get_page_geometry_engine_deskew_sideways(tmp_path):
+    # A sideways, skewed page: the engine can only measure the skew once the
+    # page is upright
+    page = Image.new('L', (1100, 850), 255)
+    for left in range(100, 1000, 40):
+        page.paste(0, (left, 100, left + 15, 750))
+    preview = tmp_path / 'preview.jpg'
+    page.rotate(-2.0, resample=Image.Resampling.BICUBIC, fillcolor=255).save(
+        preview, dpi=(150, 100)
+    )
+    ctx = _geometry_context(
+        tmp_path, rotate_pages=True, deskew=True, deskew_method='engine'
+    )
+    engine = ctx.plugin_manager.get_ocr_engine.return_value
+    engine.supports_page_geometry.return_value = False
+    engine.get_page_geometry.return_value = PageGeometry(270, 10.0)
+
+    def get_deskew(input_file, options):
+        with Image.open(input_file) as im:
+            assert im.size == (850, 1100)
+            assert im.info['dpi'] == pytest.approx((100, 150))
+            return estimate_skew(im)
+
+    engine.get_deskew.side_effect = get_deskew
+
+    correction, deskew_angle = _pipeline.get_page_geometry(preview, ctx)
+
+    assert correction == 270
+    assert deskew_angle == pytest.approx(2.0, abs=0.1)
+    # Skew is measured once, on the upright preview only
+    engine.get_page_geometry.assert_called_once_with(
+        preview, ctx.options, orientation=True, deskew=False
+    )
+    engine.get_deskew.assert_called_once()
+
+
+def test_preprocess_remove_background(tmp_path):
+    page = Image.linear_gradient('L').resize((200, 300)).point(lambda v: 220 - v // 4)
+    page.paste(20, (50, 100, 150, 120))
+    pdf_path = _make_scan_pdf(tmp_path / 'scan.pdf', page)
+    page.save(tmp_path / 'gray.png', dpi=(100, 100))
+    ctx = _extract_context(tmp_path, pdf_path)
+
+    out = _pipeline.preprocess_remove_background(tmp_path / 'gray.png', ctx)
+
+    assert out == tmp_path / 'pp_rm_bg.png'
+    with Image.open(out) as im:
+        assert im.getpixel((10, 10)) == 255
+        assert im.getpixel((10, 290)) == 255
+        assert im.getpixel((100, 110)) == 0
+        assert im.info['dpi'] == pytest.approx((100, 100), abs=0.1)
+
+
+@pytest.mark.parametrize('content, blank', [('shadow', True), ('text', False)])
+def test_is_blank_page(tmp_path, content, blank):
+    page = Image.new('L', (850, 1100), 255)
+    if content == 'shadow':
+        # Scanners often leave a dark edge even on blank pages
+        page.paste(0, (0, 0, 30, 1100))
+    else:
+        page.paste(0, (100, 500, 700, 520))
+    page.save(tmp_path / 'preview.png')
+    ctx = _page_context_for(tmp_path)
+    ctx.options.skip_blank = 0.5
+    ctx.options.blank_ink_level = 128
+
+    assert _pipeline.is_blank_page(tmp_path / 'preview.png', ctx) == blank
+
+
+@pytest.mark.parametrize('skip_blank_processing', [True, False])
+def test_process_page_blank(tmp_path, skip_blank_processing):
+    pdf_path = _make_scan_pdf(tmp_path / 'scan.pdf', Image.new('L', (200, 300), 255))
+    ctx = _extract_context(tmp_path, pdf_path)
+    ctx.origin = pdf_path
+    ctx.options = OcrOptions(
+        input_file=pdf_path,
+        output_file=tmp_path / 'out.pdf',
+        skip_blank=0.1,
+        skip_blank_processing=skip_blank_processing,
+        deskew=True,
+        rotate_pages=True,
+    )
+    ctx.plugin_manager.filter_page_image.return_value = None
+
+    ocr_image, visible_page, correction = _common.process_page(ctx)
+
+    assert ocr_image is None
+    assert correction == 0
+    assert (visible_page is None) == skip_blank_processing
+    ctx.plugin_manager.get_ocr_engine.assert_not_called()
+
+
+def _languages_context(tmp_path, script):
+    ctx = _page_context_for(tmp_path)
+    ctx.options = OcrOptions(
+        input_file=tmp_path / 'in.pdf',
+        output_file=tmp_path / 'out.pdf',
+        languages=['eng', 'deu', 'rus'],
+        detect_languages=True,
+    )
+    engine = ctx.plugin_manager.get_ocr_engine.return_value
+    engine.get_script.return_value = script
+    return ctx
+
+
+@pytest.mark.parametrize(
+    'script, languages',
+    [
+        (ScriptConfidence('Cyrillic', 5.0), ['rus']),
+        (ScriptConfidence('Latin', 5.0), ['eng', 'deu']),
+        (ScriptConfidence('Cyrillic', 0.5), ['eng', 'deu', 'rus']),
+        (ScriptConfidence('Greek', 5.0), ['eng', 'deu', 'rus']),
+        (None, ['eng', 'deu', 'rus']),
+    ],
+)
+def test_select_page_languages(tmp_path, script, languages):
+    ctx = _languages_context(tmp_path, script)
+    document_options = ctx.options
+
+    _pipeline.select_page_languages(tmp_path / 'preview.jpg', ctx)
+
+    assert ctx.options.languages == languages
+    assert document_options.languages == ['eng', 'deu', 'rus']
+
+
+def test_select_page_languages_disabled(tmp_path):
+    ctx = _languages_context(tmp_path, ScriptConfidence('Cyrillic', 5.0))
+    ctx.options.detect_languages = False
+
+    _pipeline.select_page_languages(tmp_path / 'preview.jpg', ctx)
+
+    assert ctx.options.languages == ['eng', 'deu', 'rus']
+    ctx.plugin_manager.get_ocr_engine.assert_not_called()
+
+
+def _text_page(line_height, dpi, mode='L'):
+    page = Image.new('L', (1700, 2200), 255)
+    for top in range(100, 2000, 2 * line_height):
+        page.paste(0, (100, top, 1600, top + line_height))
+    page = page.convert(mode)
+    page.info['dpi'] = (dpi, dpi)
+    return page
+
+
+@pytest.mark.parametrize('mode', ['L', '1'])
+def test_adapt_ocr_resolution_large_text(mode):
+    ocr_image = _pipeline.adapt_ocr_resolution(_text_page(120, 600, mode))
+    assert ocr_image.size == (850, 1100)
+    assert ocr_image.info['dpi'] == (300, 300)
+    assert ocr_image.mode == 'L'
+
+
+def test_adapt_ocr_resolution_min_dpi():
+    ocr_image = _pipeline.adapt_ocr_resolution(_text_page(300, 300))
+    assert ocr_image.info['dpi'] == (_pipeline.MIN_ADAPTIVE_OCR_DPI,) * 2
+
+
+@pytest.mark.parametrize('line_height', [50, None])
+def test_adapt_ocr_resolution_unchanged(line_height):
+    if line_height is None:
+        page = Image.new('L', (1700, 2200), 255)
+        page.info['dpi'] = (600, 600)
+    else:
+        page = _text_page(line_height, 300)
+    assert _pipeline.adapt_ocr_resolution(page) is page
+
+
+def _text_pdf(path, text, *, invisible=True):
+    canvas = Canvas(str(path), pagesize=(8.5 * inch, 11 * inch))
+    textobject = canvas.beginText(inch, 10 * inch)
+    textobject.setFont('Helvetica', 12)
+    if invisible:
+        textobject.setTextRenderMode(3)
+    textobject.textLine(text)
+    canvas.drawText(textobject)
+    canvas.save()
+    return pdfinfo.PdfInfo(path, detailed_analysis=True, progbar=False, max_workers=1)
+
+
+def _skip_text_context(pageinfo, **options):
+    ctx = Mock()
+    ctx.pageinfo = pageinfo
+    ctx.options = OcrOptions(
+        input_file='a.pdf', output_file='b.pdf', mode='skip', **options
+    )
+    return ctx
+
+
+@pytest.mark.parametrize(
+    'text, invisible, required',
+    [
+        ("Invoice for services rendered in the month of March", True, False),
+        ("lnv0ice f0r serv1ces rendcred iN tlie m0nth 0f Marcli", True, True),
+        ("lnv0ice f0r serv1ces rendcred iN tlie m0nth 0f Marcli", False, False),
+    ],
+)
+def test_skip_text_quality(tmp_path, text, invisible, required):
+    info = _text_pdf(tmp_path / 'text.pdf', text, invisible=invisible)
+    ctx = _skip_text_context(info[0], skip_text_quality=0.7)
+    assert _pipeline.is_ocr_required(ctx) == required
+    # Without a quality threshold, pages with text are always skipped
+    assert not _pipeline.is_ocr_required(_skip_text_context(info[0]))
+
+
+def test_skip_text_quality_wordlist(tmp_path):
+    info = _text_pdf(tmp_path / 'text.pdf', "Rechnung für Leistungen im März")
+    wordlist = tmp_path / 'words.txt'
+    wordlist.write_text("für\nim\nMärz\n", encoding='utf-8')
+    ctx = _skip_text_context(
+        info[0], skip_text_quality=0.5, skip_text_wordlist=wordlist
+    )
+    assert _pipeline.existing_text_quality(ctx.pageinfo, ctx.options) == 0.5
+    assert not _pipeline.is_ocr_required(ctx)
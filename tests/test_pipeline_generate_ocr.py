@@ -33,6 +33,7 @@ class TestOcrEngineDirect:
         mock_context = MagicMock()
         mock_engine = MagicMock()
         mock_engine.supports_generate_ocr.return_value = True
+        mock_engine.supports_generate_ocr_batch.return_value = False
         mock_engine.generate_ocr.return_value = (
             OcrElement(ocr_class='ocr_page', bbox=BoundingBox(0, 0, 100, 100)),
             "test text",
@@ -11,6 +11,7 @@ from PIL import Image
 from ocrmypdf._exec import ghostscript, tesseract
 from ocrmypdf.exceptions import ExitCode
 from ocrmypdf.helpers import Resolution
+from ocrmypdf.imageops import estimate_skew
 from ocrmypdf.pdfinfo import PdfInfo
 from ocrmypdf.pluginspec import GhostscriptRasterDevice
 
@@ -40,6 +41,30 @@ def test_deskew(resources, outdir):
     assert -0.5 < skew_angle < 0.5, "Deskewing failed"
 
 
+@pytest.mark.parametrize('source', ['skew.pdf', 'rotated_skew.pdf'])
+def test_deskew_projection(resources, outdir, source):
+    deskewed_pdf = check_ocrmypdf(
+        resources / source,
+        outdir / source,
+        '-d',
+        '--deskew-method',
+        'projection',
+        '--output-type',
+        'pdf',
+    )
+
+    deskewed_png = outdir / 'deskewed.png'
+    ghostscript.rasterize_pdf(
+        deskewed_pdf,
+        deskewed_png,
+        raster_device=GhostscriptRasterDevice.PNGGRAY,
+        raster_dpi=Resolution(150, 150),
+        pageno=1,
+    )
+    with Image.open(deskewed_png) as im:
+        assert abs(estimate_skew(im)) < 0.3, "Deskewing failed"
+
+
 def test_deskew_blank_page(resources, outpdf):
     # Tesseract doesn't like blank pages - make sure we can get through
     check_ocrmypdf(resources / 'blank.pdf', outpdf, '--deskew')
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from ocrmypdf import quality as qual
 
 
@@ -19,3 +21,17 @@ def test_quality_measurement():
     assert oqd.measure_words_matched("12345 10% _f  7fox -brown   | words") == 1.0
 
     assert oqd.measure_words_matched("quick quick quick") == 1.0
+
+
+def test_measure_text_quality():
+    assert qual.measure_text_quality("The quick brown fox, (don't) well-known.") == 1.0
+    assert qual.measure_text_quality("Tbe qu1ck brOwn f0x jumps") == 0.4
+    assert qual.measure_text_quality("\ufffd\ufffd fox") == pytest.approx(0.6)
+    assert qual.measure_text_quality("12 345 6.78") == 1.0
+    assert qual.measure_text_quality("  ") == 0.0
+
+
+def test_measure_text_quality_dictionary():
+    oqd = qual.OcrQualityDictionary(wordlist=["quick", "brown", "fox"])
+    assert qual.measure_text_quality("quick brown fox jumps", oqd) == 0.75
+    assert qual.measure_text_quality("12 345", oqd) == 1.0
@@ -243,6 +243,35 @@ class TestRasterizerHookDirect:
         with Image.open(img) as im:
             assert im.mode == '1'
 
+    @pytest.mark.skipif(not PYPDFIUM_AVAILABLE, reason="pypdfium2 not installed")
+    def test_pypdfium_honors_intermediate_image_format(self, resources, tmp_path):
+        pm = get_plugin_manager([])
+        options = OcrOptions(
+            input_file=resources / 'graph.pdf',
+            output_file=tmp_path / 'out.pdf',
+            rasterizer='pypdfium',
+            intermediate_image_format='tiff',
+        )
+
+        img = tmp_path / 'intermediate.tif'
+        pm.rasterize_pdf_page(
+            input_file=resources / 'graph.pdf',
+            output_file=img,
+            raster_device='pnggray',
+            raster_dpi=Resolution(50, 50),
+            page_dpi=Resolution(50, 50),
+            pageno=1,
+            rotation=0,
+            filter_vector=False,
+            stop_on_soft_error=True,
+            options=options,
+            use_cropbox=False,
+        )
+        with Image.open(img) as im:
+            assert im.format == 'TIFF'
+            assert im.info['compression'] == 'raw'
+            assert im.info['dpi'] == pytest.approx((50, 50))
+
 
 def _make_text_mask_pdf(path, fill: bytes):
     """Build a letter page with a large text image mask painted with ``fill``.
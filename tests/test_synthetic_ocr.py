@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import logging
+import random
+import statistics
+
+import pytest
+from PIL import Image
+
+from ocrmypdf._options import OcrOptions
+from ocrmypdf._tiles import tree_text
+from ocrmypdf.exceptions import ExitCode, SubprocessOutputError
+from ocrmypdf.extra_plugins.synthetic_ocr import (
+    SyntheticOcrEngine,
+    SyntheticOcrOptions,
+    page_latency,
+    synthetic_page,
+)
+from ocrmypdf.hocrtransform import OcrClass
+
+from .conftest import run_ocrmypdf_api
+
+
+@pytest.fixture(autouse=True)
+def register_plugin_models():
+    OcrOptions.register_plugin_models({'synthetic': SyntheticOcrOptions})
+
+
+@pytest.fixture
+def page_image(tmp_path):
+    path = tmp_path / 'page.png'
+    Image.new('L', (1275, 1650), 255).save(path, dpi=(150, 150))
+    return path
+
+
+def _options(**kwargs):
+    options = OcrOptions(input_file='in.pdf', output_file='out.pdf')
+    options.extra_attrs.update({f'synthetic_{k}': v for k, v in kwargs.items()})
+    return options
+
+
+@pytest.mark.parametrize('distribution', ['uniform', 'exponential', 'lognormal'])
+def test_page_latency_mean(distribution):
+    settings = SyntheticOcrOptions(latency=2.0, distribution=distribution)
+    rng = random.Random(0)
+    samples = [page_latency(rng, settings) for _ in range(5000)]
+    assert min(samples) >= 0
+    assert statistics.fmean(samples) == pytest.approx(2.0, rel=0.1)
+
+
+def test_page_latency_fixed():
+    settings = SyntheticOcrOptions(latency=2.0, distribution='fixed')
+    assert page_latency(random.Random(0), settings) == 2.0
+
+
+def test_synthetic_page_word_density():
+    page = synthetic_page(random.Random(0), (1275, 1650), 150.0, 4.0, page_number=3)
+    assert page.ocr_class == OcrClass.PAGE
+    assert page.page_number == 3
+    words = page.words
+    assert len(words) == round(4.0 * 8.5 * 11)
+    for word in words:
+        assert 0 <= word.bbox.left < word.bbox.right <= 1275
+        assert 0 <= word.bbox.top < word.bbox.bottom <= 1650
+    assert all(line.baseline for line in page.lines)
+
+
+def test_synthetic_page_fills_at_most_one_page():
+    page = synthetic_page(random.Random(0), (1275, 1650), 150.0, 1000.0)
+    words = page.words
+    assert 0 < len(words) < 1000 * 8.5 * 11
+
+
+def test_generate_ocr_is_reproducible(page_image):
+    options = _options(latency=0.0, seed=7)
+    page, text = SyntheticOcrEngine.generate_ocr(page_image, options, 2)
+    again, again_text = SyntheticOcrEngine.generate_ocr(page_image, options, 2)
+    other, other_text = SyntheticOcrEngine.generate_ocr(page_image, options, 3)
+    assert text == again_text == tree_text(page)
+    assert text != other_text
+    assert page.dpi == pytest.approx(150.0, abs=0.1)
+
+
+def test_generate_ocr_batch_matches_single_pages(page_image):
+    options = _options(latency=0.0)
+    batch = SyntheticOcrEngine.generate_ocr_batch(
+        [page_image, page_image], options, [0, 1]
+    )
+    assert [text for _, text in batch] == [
+        SyntheticOcrEngine.generate_ocr(page_image, options, n)[1] for n in (0, 1)
+    ]
+
+
+def test_generate_ocr_failure(page_image):
+    options = _options(latency=0.0, failure_rate=1.0)
+    with pytest.raises(SubprocessOutputError):
+        SyntheticOcrEngine.generate_ocr(page_image, options, 0)
+
+
+def test_generate_ocr_timeout(page_image, caplog):
+    caplog.set_level(logging.WARNING)
+    options = _options(latency=0.0, timeout_rate=1.0, timeout=0.0)
+    page, text = SyntheticOcrEngine.generate_ocr(page_image, options, 0)
+    assert text == '[skipped page]'
+    assert not page.children
+    assert 'took too long' in caplog.text
+
+
+def test_synthetic_ocr_plugin(resources, outpdf):
+    exitcode = run_ocrmypdf_api(
+        resources / 'multipage.pdf',
+        outpdf,
+        '--output-type',
+        'pdf',
+        '--force-ocr',
+        '--plugin',
+        'ocrmypdf.extra_plugins.synthetic_ocr',
+        '--synthetic-latency',
+        '0.01',
+        '--synthetic-word-density',
+        '1',
+    )
+    assert exitcode == ExitCode.ok
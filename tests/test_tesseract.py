@@ -6,14 +6,24 @@ from __future__ import annotations
 import logging
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from os import fspath
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
+from PIL import Image
 
 from ocrmypdf import pdfinfo
 from ocrmypdf._exec import tesseract
-from ocrmypdf.exceptions import BadArgsError, MissingDependencyError
+from ocrmypdf.builtin_plugins.tesseract_ocr import TesseractOcrEngine
+from ocrmypdf.exceptions import (
+    BadArgsError,
+    MissingDependencyError,
+    SubprocessOutputError,
+)
+from ocrmypdf.hocrtransform import HocrParser
 
 from .conftest import check_ocrmypdf, run_ocrmypdf_api
 
@@ -167,3 +177,266 @@ def test_blocked_language(resources, no_outpdf):
     for bad_lang in ['osd', 'equ']:
         with pytest.raises(BadArgsError):
             run_ocrmypdf_api(infile, no_outpdf, '-l', bad_lang)
+
+
+def _hocr_document(*pages):
+    divs = ''.join(
+        f"  <div class='ocr_page' id='page_{n + 1}' "
+        f"title='image \"p{n}.png\"; bbox 0 0 {w} {h}; ppageno {n}'>\n"
+        f"   <p class='ocr_par'><span class='ocr_line' title='bbox 1 1 50 20'>"
+        f"<span class='ocrx_word' title='bbox 1 1 50 20; x_wconf 90'>{word}"
+        f"</span></span></p>\n  </div>\n"
+        for n, (w, h, word) in enumerate(pages)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<html xmlns="http://www.w3.org/1999/xhtml" xml:lang="en" lang="en">\n'
+        ' <head>\n  <title></title>\n </head>\n'
+        f' <body>\n{divs} </body>\n</html>\n'
+    )
+
+
+_BATCH_SETTINGS = dict(
+    languages=['eng'],
+    engine_mode=None,
+    tessconfig=[],
+    timeout=180.0,
+    pagesegmode=None,
+    thresholding=tesseract.ThresholdingMethod.AUTO,
+    user_words=None,
+    user_patterns=None,
+)
+
+
+def test_split_hocr(tmp_path):
+    pages = tesseract.split_hocr(_hocr_document((100, 50, 'one'), (200, 80, 'two')))
+
+    assert len(pages) == 2
+    for n, (page, width, word) in enumerate(
+        zip(pages, (100, 200), ('one', 'two'), strict=True)
+    ):
+        (tmp_path / f'{n}.hocr').write_text(page, encoding='utf-8')
+        tree = HocrParser(tmp_path / f'{n}.hocr').parse()
+        assert tree.bbox.right == width
+        assert tree.page_number == 0
+        assert [w.text for w in tree.words] == [word]
+
+
+def test_generate_hocr_batch(tmp_path):
+    def fake_run(args, **kwargs):
+        filelist, prefix = Path(args[-4]), Path(args[-3])
+        images = filelist.read_text().splitlines()
+        assert images == [fspath((tmp_path / f'p{n}.png').resolve()) for n in range(2)]
+        assert kwargs['timeout'] == 360.0
+        prefix.with_suffix('.hocr').write_text(
+            _hocr_document((100, 50, 'one'), (200, 80, 'two')), encoding='utf-8'
+        )
+        prefix.with_suffix('.txt').write_text('one\n\ftwo\n\f', encoding='utf-8')
+        return subprocess.CompletedProcess(args, 0, stdout=b'')
+
+    items = [
+        (tmp_path / f'p{n}.png', tmp_path / f'p{n}.hocr', tmp_path / f'p{n}.txt')
+        for n in range(2)
+    ]
+    with patch('ocrmypdf._exec.tesseract.run', side_effect=fake_run):
+        tesseract.generate_hocr_batch(items, **_BATCH_SETTINGS)
+
+    assert (tmp_path / 'p1.txt').read_text() == 'two\n'
+    tree = HocrParser(tmp_path / 'p1.hocr').parse()
+    assert [w.text for w in tree.words] == ['two']
+
+
+def test_generate_hocr_batch_page_count_mismatch(tmp_path):
+    def fake_run(args, **kwargs):
+        prefix = Path(args[-3])
+        prefix.with_suffix('.hocr').write_text(
+            _hocr_document((100, 50, 'one')), encoding='utf-8'
+        )
+        prefix.with_suffix('.txt').write_text('one\n\f', encoding='utf-8')
+        return subprocess.CompletedProcess(args, 0, stdout=b'')
+
+    items = [
+        (tmp_path / f'p{n}.png', tmp_path / f'p{n}.hocr', tmp_path / f'p{n}.txt')
+        for n in range(2)
+    ]
+    with (
+        patch('ocrmypdf._exec.tesseract.run', side_effect=fake_run),
+        pytest.raises(SubprocessOutputError),
+    ):
+        tesseract.generate_hocr_batch(items, **_BATCH_SETTINGS)
+
+
+def test_hocr_batcher_combines_concurrent_requests(tmp_path):
+    batches = []
+
+    def fake_generate_hocr_batch(items, **kwargs):
+        batches.append([input_file.name for input_file, _, _ in items])
+
+    batcher = tesseract.HocrBatcher(window=5.0)
+    with (
+        patch(
+            'ocrmypdf._exec.tesseract.generate_hocr_batch',
+            side_effect=fake_generate_hocr_batch,
+        ),
+        ThreadPoolExecutor(3) as executor,
+    ):
+        list(
+            executor.map(
+                lambda n: batcher.generate_hocr(
+                    input_file=tmp_path / f'p{n}.png',
+                    output_hocr=tmp_path / f'p{n}.hocr',
+                    output_text=tmp_path / f'p{n}.txt',
+                    batch_size=3,
+                    **_BATCH_SETTINGS,
+                ),
+                range(3),
+            )
+        )
+
+    assert len(batches) == 1
+    assert sorted(batches[0]) == ['p0.png', 'p1.png', 'p2.png']
+
+
+def test_hocr_batcher_retries_failed_batch_singly(tmp_path):
+    def fake_generate_hocr(*, input_file, **kwargs):
+        if input_file.name == 'bad.png':
+            raise SubprocessOutputError()
+
+    batcher = tesseract.HocrBatcher(window=5.0)
+    with (
+        patch(
+            'ocrmypdf._exec.tesseract.generate_hocr_batch',
+            side_effect=SubprocessOutputError,
+        ),
+        patch(
+            'ocrmypdf._exec.tesseract.generate_hocr', side_effect=fake_generate_hocr
+        ) as mock,
+        ThreadPoolExecutor(2) as executor,
+    ):
+        futures = [
+            executor.submit(
+                batcher.generate_hocr,
+                input_file=tmp_path / name,
+                output_hocr=tmp_path / f'{name}.hocr',
+                output_text=tmp_path / f'{name}.txt',
+                batch_size=2,
+                **_BATCH_SETTINGS,
+            )
+            for name in ('good.png', 'bad.png')
+        ]
+        futures[0].result()
+        with pytest.raises(SubprocessOutputError):
+            futures[1].result()
+    assert mock.call_count == 2
+
+
+def test_get_script(tmp_path):
+    osd = (
+        b'Page number: 0\nOrientation in degrees: 0\nRotate: 0\n'
+        b'Orientation confidence: 12.40\nScript: Cyrillic\n'
+        b'Script confidence: 4.17\n'
+    )
+    with patch('ocrmypdf._exec.tesseract.run') as mock_run:
+        mock_run.return_value = subprocess.CompletedProcess([], 0, stdout=osd)
+        script = tesseract.get_script(tmp_path / 'page.png', None, 10.0)
+    assert script == ('Cyrillic', pytest.approx(4.17))
+
+
+def test_orientation_and_script_share_osd(tmp_path):
+    osd = (
+        b'Page number: 0\nOrientation in degrees: 90\nRotate: 270\n'
+        b'Orientation confidence: 12.40\nScript: Cyrillic\n'
+        b'Script confidence: 4.17\n'
+    )
+    Image.new('L', (100, 100), 255).save(tmp_path / 'page.png')
+    with patch('ocrmypdf._exec.tesseract.run') as mock_run:
+        mock_run.return_value = subprocess.CompletedProcess([], 0, stdout=osd)
+        orient_conf = tesseract.get_orientation(tmp_path / 'page.png', None, 10.0)
+        script = tesseract.get_script(tmp_path / 'page.png', None, 10.0)
+    assert orient_conf.angle == 90
+    assert script == ('Cyrillic', pytest.approx(4.17))
+    mock_run.assert_called_once()
+
+
+def test_get_script_too_few_characters(tmp_path):
+    with patch('ocrmypdf._exec.tesseract.run') as mock_run:
+        mock_run.side_effect = subprocess.CalledProcessError(
+            1, 'tesseract', output=b'Too few characters. Skipping this page\n'
+        )
+        script = tesseract.get_script(tmp_path / 'page.png', None, 10.0)
+    assert script == ('', 0.0)
+
+
+def test_generate_hocr_stdout(tmp_path):
+    hocr = _hocr_document((100, 50, 'one'))
+    with patch('ocrmypdf._exec.tesseract.run') as mock_run:
+        mock_run.return_value = subprocess.CompletedProcess(
+            [], 0, stdout=hocr.encode(), stderr=b''
+        )
+        result = tesseract.generate_hocr_stdout(
+            input_file=tmp_path / 'page.png', **_BATCH_SETTINGS
+        )
+    args = mock_run.call_args.args[0]
+    assert args[-2:] == ['stdout', 'hocr']
+    assert result == hocr.encode()
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    'side_effect',
+    [
+        subprocess.TimeoutExpired('tesseract', 10.0),
+        subprocess.CalledProcessError(1, 'tesseract', b'', b'Empty page!!\n'),
+    ],
+)
+def test_generate_hocr_stdout_skipped_page(tmp_path, side_effect):
+    with patch('ocrmypdf._exec.tesseract.run') as mock_run:
+        mock_run.side_effect = side_effect
+        result = tesseract.generate_hocr_stdout(
+            input_file=tmp_path / 'page.png', **_BATCH_SETTINGS
+        )
+    assert result is None
+
+
+def test_generate_hocr_stdout_error(tmp_path):
+    with patch('ocrmypdf._exec.tesseract.run') as mock_run:
+        mock_run.side_effect = subprocess.CalledProcessError(
+            1, 'tesseract', b'', b'an unexpected error'
+        )
+        with pytest.raises(SubprocessOutputError):
+            tesseract.generate_hocr_stdout(
+                input_file=tmp_path / 'page.png', **_BATCH_SETTINGS
+            )
+
+
+@pytest.mark.parametrize('hocr, text', [(True, 'one\n'), (False, '[skipped page]')])
+def test_engine_generate_ocr(tmp_path, hocr, text):
+    image = tmp_path / 'page.png'
+    Image.new('L', (100, 50), 255).save(image)
+    options = SimpleNamespace(
+        languages=['eng'],
+        use_threads=True,
+        tesseract=SimpleNamespace(
+            oem=None,
+            config=[],
+            pagesegmode=None,
+            thresholding=tesseract.ThresholdingMethod.AUTO,
+            timeout=180.0,
+            user_words=None,
+            user_patterns=None,
+            omp_thread_limit=1,
+            batch_size=1,
+        ),
+    )
+    result = _hocr_document((100, 50, 'one')).encode() if hocr else None
+    with patch(
+        'ocrmypdf._exec.tesseract.generate_hocr_stdout', return_value=result
+    ) as mock_stdout:
+        page, page_text = TesseractOcrEngine.generate_ocr(image, options, 4)
+
+    mock_stdout.assert_called_once()
+    assert [w.text for w in page.words] == (['one'] if hocr else [])
+    assert page.bbox.right == 100
+    assert page.page_number == 4
+    assert page_text == text
+    assert list(tmp_path.iterdir()) == [image]
@@ -0,0 +1,217 @@
+# SPDX-FileCopyrightText: 2026 James R. Barlow
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+from PIL import Image
+
+from ocrmypdf import _pipeline
+from ocrmypdf._tiles import Tile, merge_tile_trees, plan_tiles, tree_text
+from ocrmypdf.models.ocr_element import BoundingBox, OcrClass, OcrElement
+
+
+def test_small_image_is_one_tile():
+    assert plan_tiles((800, 600), 1000, 100) == [
+        Tile(box=(0, 0, 800, 600), core=(0, 0, 800, 600))
+    ]
+
+
+@pytest.mark.parametrize('size', [(5000, 3000), (1001, 4321), (30000, 200)])
+def test_tile_cores_partition_image(size):
+    tiles = plan_tiles(size, 1000, 200)
+    area = 0
+    for tile in tiles:
+        left, top, right, bottom = tile.box
+        assert right - left <= 1000
+        assert bottom - top <= 1000
+        # Core is inside the tile with margin for the overlap
+        assert left <= tile.core[0] < tile.core[2] <= right
+        assert top <= tile.core[1] < tile.core[3] <= bottom
+        area += (tile.core[2] - tile.core[0]) * (tile.core[3] - tile.core[1])
+    assert area == size[0] * size[1]
+
+
+def _word(text, left, top, right, bottom):
+    return OcrElement(
+        ocr_class=OcrClass.WORD,
+        text=text,
+        bbox=BoundingBox(left=left, top=top, right=right, bottom=bottom),
+    )
+
+
+def _line(*words):
+    return OcrElement(
+        ocr_class=OcrClass.LINE,
+        bbox=BoundingBox(
+            left=min(w.bbox.left for w in words),
+            top=min(w.bbox.top for w in words),
+            right=max(w.bbox.right for w in words),
+            bottom=max(w.bbox.bottom for w in words),
+        ),
+        children=list(words),
+    )
+
+
+def _page(*lines, width, height):
+    return OcrElement(
+        ocr_class=OcrClass.PAGE,
+        bbox=BoundingBox(left=0, top=0, right=width, bottom=height),
+        children=[OcrElement(ocr_class=OcrClass.PARAGRAPH, children=list(lines))],
+    )
+
+
+def test_merge_removes_overlap_duplicates():
+    tiles = plan_tiles((1800, 100), 1000, 200)
+    assert len(tiles) == 2
+    left_tile, right_tile = tiles
+    offset = right_tile.box[0]  # 800
+    # "overlap" lies inside both tiles; its center is in the right tile's core
+    left_tree = _page(
+        _line(_word('left', 10, 10, 100, 40), _word('overlap', 850, 10, 950, 40)),
+        width=1000,
+        height=100,
+    )
+    right_tree = _page(
+        _line(
+            _word('overlap', 850 - offset, 10, 950 - offset, 40),
+            _word('right', 1700 - offset, 10, 1790 - offset, 40),
+        ),
+        width=1000,
+        height=100,
+    )
+
+    page = merge_tile_trees(
+        [(left_tile, left_tree), (right_tile, right_tree)],
+        (1800, 100),
+        dpi=300.0,
+        page_number=3,
+    )
+
+    words = [(w.text, w.bbox.left) for w in page.words]
+    assert words == [('left', 10), ('overlap', 850), ('right', 1700)]
+    assert page.dpi == 300.0
+    assert page.page_number == 3
+    assert page.bbox == BoundingBox(left=0, top=0, right=1800, bottom=100)
+    assert tree_text(page) == 'left\n\noverlap right\n'
+
+
+def test_merge_joins_line_across_tiles():
+    tiles = plan_tiles((1800, 100), 1000, 200)
+    left_tile, right_tile = tiles
+    offset = right_tile.box[0]  # 800; the tile cores meet at 900
+    left_tree = _page(
+        _line(
+            _word('alpha', 700, 10, 780, 40),
+            _word('beta', 820, 12, 880, 40),
+            _word('gamma', 910, 10, 990, 42),
+        ),
+        _line(_word('next', 700, 60, 780, 90)),
+        width=1000,
+        height=100,
+    )
+    right_tree = _page(
+        _line(
+            _word('beta', 820 - offset, 12, 880 - offset, 40),
+            _word('gamma', 910 - offset, 10, 990 - offset, 42),
+            _word('delta', 1000 - offset, 10, 1080 - offset, 40),
+        ),
+        width=1000,
+        height=100,
+    )
+
+    page = merge_tile_trees(
+        [(right_tile, right_tree), (left_tile, left_tree)],
+        (1800, 100),
+        dpi=300.0,
+        page_number=1,
+    )
+
+    assert len(page.paragraphs) == 1
+    paragraph = page.paragraphs[0]
+    assert paragraph.bbox == BoundingBox(left=700, top=10, right=1080, bottom=90)
+    first, second = paragraph.lines
+    assert [w.text for w in first.words] == ['alpha', 'beta', 'gamma', 'delta']
+    assert first.bbox == BoundingBox(left=700, top=10, right=1080, bottom=42)
+    assert second.bbox == BoundingBox(left=700, top=60, right=780, bottom=90)
+    assert tree_text(page) == 'alpha beta gamma delta\nnext\n'
+
+
+def test_ocr_engine_tiled(tmp_path):
+    def fake_generate_ocr(input_file, options, page_number):
+        with Image.open(input_file) as im:
+            width, height = im.size
+        # Pretend there is a word in the center of every tile
+        cx, cy = width // 2, height // 2
+        word = _word(input_file.stem, cx - 10, cy - 10, cx + 10, cy + 10)
+        return _page(_line(word), width=width, height=height), word.text
+
+    image = tmp_path / 'ocr.png'
+    Image.new('L', (2500, 1200), 255).save(image, dpi=(300, 300))
+
+    ctx = Mock()
+    ctx.pageno = 0
+    ctx.options.ocr_tile_size = 1000
+    ctx.options.intermediate_image_format = 'png'
+    ctx.options.jobs = 2
+    ctx.get_path = lambda name: tmp_path / name
+    engine = ctx.plugin_manager.get_ocr_engine.return_value
+    engine.supports_generate_ocr.return_value = True
+    engine.generate_ocr.side_effect = fake_generate_ocr
+
+    assert _pipeline.should_tile_ocr_image(image, ctx)
+    ocr_tree, text_out = _pipeline.ocr_engine_tiled(image, ctx)
+
+    tiles = plan_tiles((2500, 1200), 1000, 125)
+    assert engine.generate_ocr.call_count == len(tiles)
+    assert len(ocr_tree.words) == len(tiles)
+    for word, tile in zip(ocr_tree.words, tiles, strict=True):
+        cx = (word.bbox.left + word.bbox.right) / 2
+        cy = (word.bbox.top + word.bbox.bottom) / 2
+        assert tile.box[0] <= cx < tile.box[2]
+        assert tile.box[1] <= cy < tile.box[3]
+    assert ocr_tree.dpi == pytest.approx(300, abs=0.1)
+    assert 'ocr_tile_000' in text_out.read_text()
+
+
+def test_ocr_engine_tiled_shares_jobs_between_pages(tmp_path):
+    running = 0
+    most_running = 0
+    lock = threading.Lock()
+
+    def fake_generate_ocr(input_file, options, page_number):
+        nonlocal running, most_running
+        with lock:
+            running += 1
+            most_running = max(most_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        with Image.open(input_file) as im:
+            return _page(width=im.width, height=im.height), ''
+
+    def page_context(pageno):
+        image = tmp_path / f'ocr{pageno}.png'
+        Image.new('L', (2500, 1200), 255).save(image, dpi=(300, 300))
+        ctx = Mock()
+        ctx.pageno = pageno
+        ctx.options.ocr_tile_size = 1000
+        ctx.options.intermediate_image_format = 'png'
+        ctx.options.jobs = 3
+        ctx.options.use_threads = True
+        ctx.get_path = lambda name: tmp_path / f'{pageno}_{name}'
+        engine = ctx.plugin_manager.get_ocr_engine.return_value
+        engine.supports_generate_ocr.return_value = True
+        engine.generate_ocr.side_effect = fake_generate_ocr
+        return image, ctx
+
+    pages = [page_context(pageno) for pageno in range(3)]
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        list(pool.map(lambda page: _pipeline.ocr_engine_tiled(*page), pages))
+
+    assert most_running <= 3
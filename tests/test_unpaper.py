@@ -4,17 +4,24 @@
 from __future__ import annotations
 
 import logging
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from os import fspath
 from unittest.mock import Mock, patch
 
 import pytest
 from packaging.version import Version
+from PIL import Image, ImageOps
 from pydantic import ValidationError
 
 from ocrmypdf._exec import unpaper
 from ocrmypdf._validation import check_options
 from ocrmypdf.cli import get_options_and_plugins
-from ocrmypdf.exceptions import ExitCode, MissingDependencyError
+from ocrmypdf.exceptions import (
+    ExitCode,
+    MissingDependencyError,
+    SubprocessOutputError,
+)
 
 from .conftest import check_ocrmypdf, have_unpaper, run_ocrmypdf_api
 
@@ -138,3 +145,114 @@ def test_palette_image(resources, outpdf):
         '--plugin',
         'tests/plugins/tesseract_noop.py',
     )
+
+
+def _fake_unpaper(args, **kwargs):
+    """Stand in for unpaper's sheet templates: invert each numbered input."""
+    end_sheet = int(args[args.index('--end-sheet') + 1])
+    input_template, output_template = args[-2:]
+    for sheet in range(1, end_sheet + 1):
+        with Image.open(input_template % sheet) as im:
+            ImageOps.invert(im.convert('L')).save(output_template % sheet)
+
+
+def test_clean_batch_one_process(resources, tmp_path):
+    items = []
+    for n in range(3):
+        Image.new('L', (10, 10), n * 10).save(tmp_path / f'in{n}.png')
+        items.append((tmp_path / f'in{n}.png', tmp_path / f'out{n}.png'))
+
+    with patch('ocrmypdf._exec.unpaper.run', side_effect=_fake_unpaper) as mock:
+        results = unpaper.clean_batch(items, dpi=300)
+
+    mock.assert_called_once()
+    assert results == [output for _, output in items]
+    for n, output in enumerate(results):
+        with Image.open(output) as im:
+            assert im.getpixel((0, 0)) == 255 - n * 10
+            assert im.info['dpi'] == pytest.approx((300, 300), abs=0.1)
+
+
+def test_clean_batcher_combines_concurrent_requests(tmp_path):
+    batches = []
+
+    def fake_clean_batch(items, **kwargs):
+        batches.append(len(items))
+        return [output for _, output in items]
+
+    batcher = unpaper.CleanBatcher(window=5.0)
+    with (
+        patch('ocrmypdf._exec.unpaper.clean_batch', side_effect=fake_clean_batch),
+        ThreadPoolExecutor(3) as executor,
+    ):
+        results = list(
+            executor.map(
+                lambda n: batcher.clean(
+                    tmp_path / f'in{n}.png',
+                    tmp_path / f'out{n}.png',
+                    dpi=300,
+                    batch_size=3,
+                ),
+                range(3),
+            )
+        )
+
+    assert batches == [3]
+    assert results == [tmp_path / f'out{n}.png' for n in range(3)]
+
+
+def test_clean_batcher_runs_incomplete_batch(tmp_path):
+    with (
+        patch('ocrmypdf._exec.unpaper.clean_batch') as mock_batch,
+        patch(
+            'ocrmypdf._exec.unpaper.clean',
+            side_effect=lambda input_file, output_file, **kwargs: output_file,
+        ) as mock,
+    ):
+        batcher = unpaper.CleanBatcher(window=0.01)
+        out = batcher.clean(
+            tmp_path / 'in.png', tmp_path / 'out.png', dpi=300, batch_size=4
+        )
+    assert out == tmp_path / 'out.png'
+    # A page left alone in its batch is cleaned singly
+    mock.assert_called_once()
+    mock_batch.assert_not_called()
+
+
+def test_clean_batcher_retries_failed_batch_singly(tmp_path):
+    def fake_clean(input_file, output_file, **kwargs):
+        if input_file.name == 'bad.png':
+            raise SubprocessOutputError()
+        return output_file
+
+    batcher = unpaper.CleanBatcher(window=5.0)
+    with (
+        patch('ocrmypdf._exec.unpaper.clean_batch', side_effect=OSError),
+        patch('ocrmypdf._exec.unpaper.clean', side_effect=fake_clean),
+        ThreadPoolExecutor(2) as executor,
+    ):
+        futures = [
+            executor.submit(
+                batcher.clean,
+                tmp_path / name,
+                tmp_path / f'out_{name}',
+                dpi=300,
+                batch_size=2,
+            )
+            for name in ('good.png', 'bad.png')
+        ]
+        assert futures[0].result() == tmp_path / 'out_good.png'
+        with pytest.raises(SubprocessOutputError):
+            futures[1].result()
+
+
+@needs_unpaper
+def test_clean_batch(resources, tmp_path):
+    items = []
+    for n in range(2):
+        shutil.copy(resources / 'crom.png', tmp_path / f'in{n}.png')
+        items.append((tmp_path / f'in{n}.png', tmp_path / f'out{n}.png'))
+    assert unpaper.clean_batch(items, dpi=300) == [output for _, output in items]
+    for _, output in items:
+        with Image.open(output) as im:
+            assert im.size == (400, 50)
@@ -74,6 +74,23 @@ def test_lossless_redo():
         make_ocr_opts(redo_ocr=True, deskew=True)
 
 
+def test_skip_text_quality_options(tmp_path):
+    with pytest.raises(ValueError, match="--skip-text-quality requires --skip-text"):
+        make_ocr_opts(skip_text_quality=0.7)
+    with pytest.raises(ValueError, match="--skip-text-quality is not currently"):
+        make_ocr_opts(skip_text=True, skip_text_quality=0.7, deskew=True)
+    with pytest.raises(ValueError, match="--skip-text-wordlist requires"):
+        make_ocr_opts(skip_text=True, skip_text_wordlist=tmp_path / 'words.txt')
+    with pytest.raises(BadArgsError, match="is not a file"):
+        vd.check_options_skip_text_quality(
+            make_ocr_opts(
+                skip_text=True,
+                skip_text_quality=0.7,
+                skip_text_wordlist=tmp_path / 'words.txt',
+            )
+        )
+
+
 def test_mutex_options():
     with pytest.raises(
         ValueError, match="Choose only one of --force-ocr, --skip-text, --redo-ocr"